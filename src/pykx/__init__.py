@@ -3,6 +3,7 @@ An interface between Python and q.
 """
 
 import base64
+import importlib
 import logging
 import os
 import sys
@@ -11,7 +12,8 @@ if os.getenv('PYKX_LOADED_UNDER_Q') == 'True':
     sys.exit(0)
 
 # Attempt to import PyArrow early to get ahead of others (e.g. Pandas) who would try to import it
-# without guarding against segfaults. Skip this if we're just doing a qinit check.
+# without guarding against segfaults. The module is only loaded once it is first used. Skip this if
+# we're just doing a qinit check.
 if os.environ.get('PYKX_QINIT_CHECK') is None:
     try:
         from ._pyarrow import pyarrow
@@ -301,7 +303,6 @@ from . import console
 from . import exceptions
 from . import wrappers
 from . import schema
-from . import streamlit
 from . import random
 from . import help
 
@@ -319,8 +320,6 @@ from ._ipc import _init as _ipc_init
 _ipc_init(q)
 
 from .compress_encrypt import Compress, CompressionAlgorithm, Encrypt
-from .db import DB
-from .tick import TICK
 from .ipc import AsyncQConnection, QConnection, QFuture, RawQConnection, SecureQConnection, SyncQConnection # noqa
 from .config import qargs, qhome, qlic, suppress_warnings
 from .wrappers import *
@@ -331,6 +330,10 @@ from ._ipc import ssl_info
 from .schema import _init as _schema_init
 _schema_init(q)
 
+if config.pykx_trace:
+    from . import profiler
+    profiler._trace_to_file(config.pykx_trace)
+
 from .register import _init as _register_init
 _register_init(q)
 
@@ -340,12 +343,6 @@ _license_init(q)
 from .random import _init as _random_init
 _random_init(q)
 
-from .db import _init as _db_init
-_db_init(q)
-
-from .tick import _init as _tick_init
-_tick_init(q)
-
 from .remote import _init as _remote_init
 _remote_init(q)
 
@@ -489,6 +486,7 @@ if licensed:
 
 __all__ = sorted([
     'AsyncQConnection',
+    'builders',
     'deserialize',
     'EmbeddedQ',
     'EmbeddedQFuture',
@@ -507,6 +505,8 @@ __all__ = sorted([
     'serialize',
     'SyncQConnection',
     'RawQConnection',
+    'TableBuilder',
+    'VectorBuilder',
     'activate_numpy_allocator',
     'console',
     'ctx',
@@ -516,11 +516,17 @@ __all__ = sorted([
     'licensed',
     'toq',
     'schema',
+    'shared',
+    'memory',
+    'profile',
+    'profiler',
     'config',
     'util',
     'q',
     'shutdown_thread',
     'PyKXReimport',
+    'pool',
+    'ProcessPool',
     'help',
     'qhelp',
     *exceptions.__all__,
@@ -535,5 +541,37 @@ if not no_pykx_signal:
             pass
 
 
+# Submodules and their attributes which are imported when first accessed rather than by
+# `import pykx`, as they are not used by PyKX itself and importing them all would slow every import
+_lazy_attributes = {
+    'builders': ('builders', None),
+    'TableBuilder': ('builders', 'TableBuilder'),
+    'VectorBuilder': ('builders', 'VectorBuilder'),
+    'db': ('db', None),
+    'DB': ('db', 'DB'),
+    'memory': ('memory', None),
+    'pool': ('pool', None),
+    'ProcessPool': ('pool', 'ProcessPool'),
+    'profiler': ('profiler', None),
+    'profile': ('profiler', 'profile'),
+    'shared': ('shared', None),
+    'streamlit': ('streamlit', None),
+    'tick': ('tick', None),
+    'TICK': ('tick', 'TICK'),
+}
+
+
+def __getattr__(name):
+    try:
+        module, attr = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module 'pykx' has no attribute '{name}'") from None
+    value = importlib.import_module(f'.{module}', __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
 def __dir__():
     return __all__
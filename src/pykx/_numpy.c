@@ -4,6 +4,7 @@
 #include <dlfcn.h>
 #include <stdio.h>
 #include <assert.h>
+#include <stdatomic.h>
 #include <stddef.h>
 #include <string.h>
 #include <Python.h>
@@ -23,6 +24,22 @@ uint8_t k_type_to_size[] = {(uint8_t)sizeof(K), 1, 16, 0, 1, 2, 4, 8, 4, 8, 1, 8
 
 long gc_enabled = -1;
 
+// Usage of the allocator, read by `pykx.memory`. Numpy may allocate and free arrays without
+// holding the GIL, so the counters are atomic.
+static _Atomic long long allocated_bytes = 0;
+static _Atomic long long allocated_arrays = 0;
+static _Atomic long long peak_bytes = 0;
+
+
+static void track_allocation(long long bytes, long long arrays) {
+    long long current = atomic_fetch_add(&allocated_bytes, bytes) + bytes;
+    atomic_fetch_add(&allocated_arrays, arrays);
+    long long peak = atomic_load(&peak_bytes);
+    // On failure `peak` is updated to the latest peak, so the loop ends once either this thread
+    // has raised the peak or another thread has raised it above `current`
+    while (current > peak && !atomic_compare_exchange_weak(&peak_bytes, &peak, current));
+}
+
 
 typedef struct {
     uintptr_t(*malloc)(size_t);
@@ -34,12 +51,14 @@ typedef struct {
 
 uintptr_t k_malloc(Allocator* ctx, size_t sz) {
     uintptr_t r = buf_from_k(ktn_ptr(KG, sz));
+    track_allocation(sz, 1);
     return r;
 }
 
 
 uintptr_t k_calloc(Allocator* ctx, size_t sz) {
     uintptr_t r = memset(buf_from_k(ktn_ptr(KG, sz)), 0, sz);
+    track_allocation(sz, 1);
     return r;
 }
 
@@ -48,6 +67,7 @@ void k_free(Allocator* ctx, uintptr_t p, npy_uintp sz) {
     PyGILState_STATE gstate;
     gstate = PyGILState_Ensure();
     if (p) {
+        track_allocation(-(long long)sz, -1);
         K x = k_from_buf(p);
         r0_ptr(x);
         int should_dealloc = x->r == 0;
@@ -86,6 +106,7 @@ uintptr_t k_realloc(Allocator* ctx, uintptr_t p, npy_uintp sz) {
         r0_ptr(prev);
     }
 
+    track_allocation((long long)sz - prev_size, 0);
     k->t = t;
     k->n = sz / k_type_to_size[t];
     uintptr_t r = buf_from_k(k);
@@ -131,6 +152,17 @@ static PyObject* numpy_deactivate_pykx_allocators(PyObject* self, PyObject* args
 }
 
 
+static PyObject* numpy_allocator_stats(PyObject* self, PyObject* args) {
+    int reset = 0;
+    if (!PyArg_ParseTuple(args, "|p", &reset)) return NULL;
+    long long bytes = atomic_load(&allocated_bytes);
+    PyObject* res = Py_BuildValue("{s:L,s:L,s:L}", "bytes", bytes, "arrays",
+        atomic_load(&allocated_arrays), "peak_bytes", atomic_load(&peak_bytes));
+    if (reset) atomic_store(&peak_bytes, bytes);
+    return res;
+}
+
+
 static PyObject* init_numpy_ctx(PyObject* self, PyObject* args) {
     Py_ssize_t r0_addr;
     Py_ssize_t k_addr;
@@ -146,6 +178,7 @@ static PyObject* init_numpy_ctx(PyObject* self, PyObject* args) {
 static PyMethodDef _NumpyMethods[] = {
     {"activate_pykx_allocators", numpy_activate_pykx_allocators, METH_NOARGS, "See `pykx.activate_numpy_allocator` for details."},
     {"deactivate_pykx_allocators", numpy_deactivate_pykx_allocators, METH_NOARGS, "See `pykx.deactivate_numpy_allocator` for details."},
+    {"allocator_stats", numpy_allocator_stats, METH_VARARGS, "See `pykx.memory.snapshot` for details."},
     {"init_numpy_ctx", init_numpy_ctx, METH_VARARGS, "See `pykx.init_numpy_ctx` for details."},
     {NULL, NULL, 0, NULL} // Sentinel
 };
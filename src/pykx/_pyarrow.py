@@ -4,26 +4,39 @@ PyArrow can appear to install without error, but then fail to import with a Pyth
 segmentation fault.
 
 Because it's very hard to know when a segfault may occur when importing PyArrow, we test it out
-first by importing it in a subprocess. If that works, then we import it here, and provide it for
-the rest of PyKX to use under the name `pyarrow`. Otherwise `pyarrow` is set to `None`.
+first by importing it in a subprocess. If that works, then we provide it for the rest of PyKX to
+use under the name `pyarrow`. Otherwise `pyarrow` is set to `None`. The module provided is loaded
+lazily, when one of its attributes is first accessed, so that importing PyKX doesn't load PyArrow.
 """
+# We do the import in this weird way because otherwise it fails on macOS in some cases with:
+# `AttributeError: module 'importlib' has no attribute 'util'`
+# See: https://stackoverflow.com/a/39661116/5946921
+from importlib import util as importlib_util
 import os
+import sys
+
+from .config import cache_dir, load_pyarrow_unsafe, suppress_warnings
+
+
+def _lazy_import(spec):
+    # Creates the module without executing it, which happens on first access to an attribute
+    if 'pyarrow' in sys.modules:
+        return sys.modules['pyarrow']
+    spec.loader = importlib_util.LazyLoader(spec.loader)
+    module = importlib_util.module_from_spec(spec)
+    sys.modules['pyarrow'] = module
+    spec.loader.exec_module(module)
+    return module
 
-from .config import load_pyarrow_unsafe, suppress_warnings
 
 if load_pyarrow_unsafe:
-    import pyarrow
+    pyarrow_spec = importlib_util.find_spec('pyarrow')
+    pyarrow = _lazy_import(pyarrow_spec) if pyarrow_spec else None
 else:
-    # We do the import in this weird way because otherwise it fails on macOS in some cases with:
-    # `AttributeError: module 'importlib' has no attribute 'util'`
-    # See: https://stackoverflow.com/a/39661116/5946921
-    from importlib import util as importlib_util
-
     import builtins
     from pathlib import Path
     import signal
     import subprocess
-    import sys
     from warnings import warn
 
     from .exceptions import PyKXWarning
@@ -48,8 +61,32 @@ else:
                               '`pykx._pyarrow.import_attempt_output` for the reason.')
         return original_importer(name, globals, locals, fromlist, level)
 
-    # Only try to import PyArrow (and potentially issue a warning) if it is installed
-    if importlib_util.find_spec('pyarrow'):
+    def _import_check_key(spec):
+        # Identifies the interpreter and PyArrow installation for which the import was checked, so
+        # the check is repeated if either changes
+        origin = Path(spec.origin)
+        return f'{Path(sys.executable).resolve()}|{origin}|{origin.stat().st_mtime_ns}\n'
+
+    def _import_checked(spec):
+        try:
+            return (cache_dir / 'pyarrow_import_check').read_text() == _import_check_key(spec)
+        except OSError:
+            return False
+
+    def _save_import_check(spec):
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            (cache_dir / 'pyarrow_import_check').write_text(_import_check_key(spec))
+        except OSError: # nocov
+            pass
+
+    # Only try to import PyArrow (and potentially issue a warning) if it is installed. The import
+    # is checked in a subprocess the first time, which takes as long as starting Python, and the
+    # result is cached for later imports of PyKX.
+    pyarrow_spec = importlib_util.find_spec('pyarrow')
+    if pyarrow_spec and pyarrow_spec.origin and _import_checked(pyarrow_spec):
+        pyarrow = _lazy_import(pyarrow_spec)
+    elif pyarrow_spec:
         cmd = (str(Path(sys.executable).as_posix()), '-c', 'import pyarrow')
         p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
         if p.returncode: # nocov
@@ -63,6 +100,8 @@ else:
             # Replace the `__import__` function to prevent other from trying to import PyArrow
             builtins.__import__ = pyarrow_importer
         else:
-            import pyarrow # noqa: F401
+            pyarrow = _lazy_import(pyarrow_spec)
+            if pyarrow_spec.origin:
+                _save_import_check(pyarrow_spec)
     else: # nocov
         pass # PyArrow is not installed; nothing need be done!
@@ -9,6 +9,7 @@
 #include <string.h>
 #include <dlfcn.h>
 #include <pthread.h>
+#include <time.h>
 #include "k.h"
 
 
@@ -25,6 +26,7 @@ bool is_done(struct QFuture* fut) {
 
 struct QCall {
     struct QFuture* fut;
+    long long enqueued;
     int handle;
     bool is_dot;
     const char* query;
@@ -50,13 +52,84 @@ static void* _q_handle;
 static pthread_t q_thread;
 static int qinit_rc;
 static pthread_mutex_t head_mutex;
-static pthread_mutex_t cond_mutex;
 static pthread_cond_t cond;
+static pthread_mutex_t done_mutex;
+static pthread_cond_t done_cond;
 static pthread_mutex_t init_mutex;
 static pthread_cond_t init;
 static bool kill_thread;
 static bool is_closing = false;
 
+// Statistics for the queue of calls, guarded by head_mutex
+static long long stat_pending;
+static long long stat_calls;
+static long long stat_wakeups;
+static long long stat_max_depth;
+static long long stat_total_wait;
+static long long stat_max_wait;
+
+static long long now_ns() {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (long long)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
+
+static struct QCallNode* new_call(int handle, bool is_dot, const char* query, int argc, K* args) {
+    struct QFuture* fut = malloc(sizeof(struct QFuture));
+    fut->done = false;
+    fut->res = (K)0;
+    struct QCall* call = malloc(sizeof(struct QCall));
+    call->fut = fut;
+    call->handle = handle;
+    call->is_dot = is_dot;
+    call->query = query;
+    call->argc = argc;
+    call->arg0 = args[0];
+    call->arg1 = args[1];
+    call->arg2 = args[2];
+    call->arg3 = args[3];
+    call->arg4 = args[4];
+    call->arg5 = args[5];
+    call->arg6 = args[6];
+    call->arg7 = args[7];
+    struct QCallNode* call_node = malloc(sizeof(struct QCallNode));
+    call_node->next = NULL;
+    call_node->call = call;
+    return call_node;
+}
+
+// Appends the linked calls from first to last to the queue, waking the q thread once
+static void submit_calls(struct QCallNode* first, struct QCallNode* last, long long n) {
+    long long now = now_ns();
+    for (struct QCallNode* node = first; node != NULL; node = node->next)
+        node->call->enqueued = now;
+    pthread_mutex_lock(&head_mutex);
+    if (calls_head == NULL) {
+        calls_head = first;
+    } else {
+        calls_tail->next = first;
+    }
+    calls_tail = last;
+    stat_pending += n;
+    pthread_cond_signal(&cond);
+    pthread_mutex_unlock(&head_mutex);
+}
+
+static void wait_for_call(struct QCallNode* call_node) {
+    pthread_mutex_lock(&done_mutex);
+    while (!is_done(call_node->call->fut))
+        pthread_cond_wait(&done_cond, &done_mutex);
+    pthread_mutex_unlock(&done_mutex);
+}
+
+static K free_call(struct QCallNode* call_node) {
+    K res = call_node->call->fut->res;
+    free(call_node->call->fut);
+    free(call_node->call);
+    free(call_node);
+    return res;
+}
+
 
 int (*_qinit)(int, char**, char*, char*, char*);
 
@@ -90,50 +163,11 @@ K _dot_internal(K x, K y) {
     return __ee(__dot(x, y));
 }
 K _dot(K x, K y) {
-    struct QFuture* fut = malloc(sizeof(struct QFuture));
-    fut->done = false;
-    fut->res = (K)0;
-    struct QCall* call = malloc(sizeof(struct QCall));
-    call->fut = fut;
-    call->handle = 0;
-    call->is_dot = true;
-    call->query = NULL;
-    call->argc = 2;
-    call->arg0 = x;
-    call->arg1 = y;
-    call->arg2 = NULL;
-    call->arg3 = NULL;
-    call->arg4 = NULL;
-    call->arg5 = NULL;
-    call->arg6 = NULL;
-    call->arg7 = NULL;
-    struct QCallNode* call_node = malloc(sizeof(struct QCallNode));
-    call_node->next = NULL;
-    call_node->call = call;
-    pthread_mutex_lock(&head_mutex);
-    if (calls_head == NULL) {
-        calls_head = call_node;
-        calls_tail = call_node;
-    } else {
-        calls_tail->next = call_node;
-        calls_tail = call_node;
-    }
-    pthread_mutex_unlock(&head_mutex);
-    while (1 == 1) {
-        pthread_mutex_lock(&cond_mutex);
-        pthread_cond_signal(&cond);
-        pthread_mutex_unlock(&cond_mutex);
-        if (is_done(fut)) {
-            pthread_mutex_lock(&head_mutex);
-            free(call_node);
-            free(call);
-            K res = fut->res;
-            free(fut);
-            pthread_mutex_unlock(&head_mutex);
-            return res;
-        }
-    }
-    return (K)0;
+    K args[8] = {x, y, NULL, NULL, NULL, NULL, NULL, NULL};
+    struct QCallNode* call_node = new_call(0, true, NULL, 2, args);
+    submit_calls(call_node, call_node, 1);
+    wait_for_call(call_node);
+    return free_call(call_node);
 }
 
 static K (*__ja)(K* x, void* y);
@@ -184,51 +218,50 @@ K _k(int handle, const char* s, ...) {
     }
     va_end(argp);
 
-    struct QFuture* fut = malloc(sizeof(struct QFuture));
-    fut->done = false;
-    fut->res = (K)0;
-    struct QCall* call = malloc(sizeof(struct QCall));
-    call->fut = fut;
-    call->handle = handle;
-    call->is_dot = false;
-    call->query = s;
-    call->argc = qargc;
-    call->arg0 = qargs[0];
-    call->arg1 = qargs[1];
-    call->arg2 = qargs[2];
-    call->arg3 = qargs[3];
-    call->arg4 = qargs[4];
-    call->arg5 = qargs[5];
-    call->arg6 = qargs[6];
-    call->arg7 = qargs[7];
-    struct QCallNode* call_node = malloc(sizeof(struct QCallNode));
-    call_node->next = NULL;
-    call_node->call = call;
+    struct QCallNode* call_node = new_call(handle, false, s, qargc, qargs);
+    submit_calls(call_node, call_node, 1);
+    wait_for_call(call_node);
+    return free_call(call_node);
+}
 
-    pthread_mutex_lock(&head_mutex);
-    if (calls_head == NULL) {
-        calls_head = call_node;
-        calls_tail = call_node;
-    } else {
-        calls_tail->next = call_node;
-        calls_tail = call_node;
+// Submits n calls with a single handoff to the q thread. The arguments of call i are
+// args[8 * i] to args[8 * i + argcs[i] - 1], and its result is written to results[i].
+void k_batch(int n, int* handles, const char** queries, int* argcs, K* args, K* results) {
+    if (n <= 0)
+        return;
+    struct QCallNode** nodes = malloc(n * sizeof(struct QCallNode*));
+    for (int i = 0; i < n; i++) {
+        nodes[i] = new_call(handles[i], false, queries[i], argcs[i], args + 8 * i);
+        if (i > 0)
+            nodes[i - 1]->next = nodes[i];
     }
+    submit_calls(nodes[0], nodes[n - 1], n);
+    // Calls are run in order, so all have completed once the last has
+    wait_for_call(nodes[n - 1]);
+    for (int i = 0; i < n; i++)
+        results[i] = free_call(nodes[i]);
+    free(nodes);
+}
+
+void queue_stats(long long* out) {
+    pthread_mutex_lock(&head_mutex);
+    out[0] = stat_pending;
+    out[1] = stat_calls;
+    out[2] = stat_wakeups;
+    out[3] = stat_max_depth;
+    out[4] = stat_total_wait;
+    out[5] = stat_max_wait;
+    pthread_mutex_unlock(&head_mutex);
+}
+
+void reset_queue_stats() {
+    pthread_mutex_lock(&head_mutex);
+    stat_calls = 0;
+    stat_wakeups = 0;
+    stat_max_depth = 0;
+    stat_total_wait = 0;
+    stat_max_wait = 0;
     pthread_mutex_unlock(&head_mutex);
-    while (1 == 1) {
-        pthread_mutex_lock(&cond_mutex);
-        pthread_cond_signal(&cond);
-        pthread_mutex_unlock(&cond_mutex);
-        if (is_done(fut)) {
-            pthread_mutex_lock(&head_mutex);
-            free(call_node);
-            free(call);
-            K res = fut->res;
-            free(fut);
-            pthread_mutex_unlock(&head_mutex);
-            return res;
-        }
-    }
-    return (K)0;
 }
 
 static K (*__ka)(int t);
@@ -491,29 +524,53 @@ void* q_thread_init(void* _qini) {
     pthread_cond_signal(&init);
     pthread_mutex_unlock(&init_mutex);
     while (1 == 1) {
-        pthread_mutex_lock(&cond_mutex);
+        pthread_mutex_lock(&head_mutex);
         while (calls_head == NULL && kill_thread == false) {
-            pthread_cond_wait(&cond, &cond_mutex);
+            pthread_cond_wait(&cond, &head_mutex);
         }
-        pthread_mutex_unlock(&cond_mutex);
-        pthread_mutex_lock(&head_mutex);
         if (kill_thread) {
             pthread_mutex_unlock(&head_mutex);
             break;
         }
-        if (calls_head != NULL) {
-            struct QCall* call = calls_head->call;
+        // Take every pending call, so calls submitted while q is busy are run without waiting
+        // for the thread to be woken again
+        struct QCallNode* node = calls_head;
+        long long depth = stat_pending;
+        calls_head = NULL;
+        calls_tail = NULL;
+        stat_pending = 0;
+        stat_calls += depth;
+        stat_wakeups += 1;
+        if (depth > stat_max_depth)
+            stat_max_depth = depth;
+        pthread_mutex_unlock(&head_mutex);
+        long long total_wait = 0;
+        long long max_wait = 0;
+        while (node != NULL) {
+            // The caller frees the node once the call is done, so the next node is read first
+            struct QCallNode* next = node->next;
+            struct QCall* call = node->call;
+            long long wait = now_ns() - call->enqueued;
+            total_wait += wait;
+            if (wait > max_wait)
+                max_wait = wait;
+            K res;
             if (call->is_dot) {
-                K res = _dot_internal(call->arg0, call->arg1);
-                call->fut->res = res;
-                call->fut->done = true;
+                res = _dot_internal(call->arg0, call->arg1);
             } else {
-                K res = _k_internal(call->handle, call->query, call->argc, call->arg0, call->arg1, call->arg2, call->arg3, call->arg4, call->arg5, call->arg6, call->arg7);
-                call->fut->res = res;
-                call->fut->done = true;
+                res = _k_internal(call->handle, call->query, call->argc, call->arg0, call->arg1, call->arg2, call->arg3, call->arg4, call->arg5, call->arg6, call->arg7);
             }
-            calls_head = calls_head->next;
+            pthread_mutex_lock(&done_mutex);
+            call->fut->res = res;
+            call->fut->done = true;
+            pthread_cond_broadcast(&done_cond);
+            pthread_mutex_unlock(&done_mutex);
+            node = next;
         }
+        pthread_mutex_lock(&head_mutex);
+        stat_total_wait += total_wait;
+        if (max_wait > stat_max_wait)
+            stat_max_wait = max_wait;
         pthread_mutex_unlock(&head_mutex);
     }
     pthread_exit(0);
@@ -523,10 +580,8 @@ void* q_thread_init(void* _qini) {
 void shutdown_thread() {
     pthread_mutex_lock(&head_mutex);
     kill_thread = true;
-    pthread_mutex_unlock(&head_mutex);
-    pthread_mutex_lock(&cond_mutex);
     pthread_cond_signal(&cond);
-    pthread_mutex_unlock(&cond_mutex);
+    pthread_mutex_unlock(&head_mutex);
 }
 
 int q_init(int argc, char** argv, char* qhome, char* qlic, char* qqq) {
@@ -534,8 +589,9 @@ int q_init(int argc, char** argv, char* qhome, char* qlic, char* qqq) {
     calls_tail = NULL;
     kill_thread = false;
     pthread_mutex_init(&head_mutex, NULL);
-    pthread_mutex_init(&cond_mutex, NULL);
     pthread_cond_init(&cond, NULL);
+    pthread_mutex_init(&done_mutex, NULL);
+    pthread_cond_init(&done_cond, NULL);
     pthread_mutex_init(&init_mutex, NULL);
     pthread_cond_init(&init, NULL);
     struct QInit* qini = malloc(sizeof(struct QInit));
@@ -1,4 +1,6 @@
 from libc.stdint cimport *
+from libc.math cimport isinf
+from libc.string cimport memcpy
 
 from cpython.bytes cimport PyBytes_FromStringAndSize
 from cpython.ref cimport Py_INCREF
@@ -76,9 +78,21 @@ cdef inline uint64_t byteswap64(uint64_t x):
     return x
 
 
+# Called with each `_K` object created while `pykx.memory` is tracking K objects held by Python,
+# which records them in `_tracked_objects` keyed by their id until they are deallocated
+_memory_hook = None
+_tracked_objects = {}
+
+
+def set_memory_hook(hook):
+    global _memory_hook
+    _memory_hook = hook
+
+
 # A cdef class is used to store the reference in order to guarantee r0 is called
 cdef class _K:
     cdef core.K k
+    cdef object __weakref__
 
     def __cinit__(self, uintptr_t k, bint incref):
         if incref:
@@ -86,6 +100,8 @@ cdef class _K:
         self.k = <core.K>k
 
     def __dealloc__(self):
+        if _tracked_objects:
+            _tracked_objects.pop(id(self), None)
         core.r0(self.k)
 
     @property
@@ -97,6 +113,8 @@ def k_from_addr(cls, uintptr_t addr, bint incref, str name=''):
     instance = object.__new__(cls)
     instance._addr = addr
     instance._k = _K(addr, incref)
+    if _memory_hook is not None:
+        _memory_hook(instance._k, cls, addr)
     instance.__init__(None) # placeholder argument
     if name != '':
         instance._name = name
@@ -134,6 +152,10 @@ cpdef inline int k_r(x):
     return (<core.K><uintptr_t>x._addr).r
 
 
+cpdef inline int k_u(x):
+    return (<core.K><uintptr_t>x._addr).u
+
+
 cpdef inline unsigned char k_g(x):
     return (<core.K><uintptr_t>x._addr).g
 
@@ -195,6 +217,53 @@ cpdef k_pickle(x):
     return arr
 
 
+def vector_buffer(self):
+    """Returns a uint8 Numpy array viewing the raw data of a q vector, which references the vector.
+
+    Returns `None` if the vector does not store its data inline.
+    """
+    cdef core.K x = _k(self)
+    if x.t not in _k_type_itemsize:
+        return None
+    cdef np.npy_intp n = x.n * _k_type_itemsize[x.t]
+    cdef np.ndarray arr = np.PyArray_SimpleNewFromData(1, &n, np.NPY_UINT8, <void*>x.G0)
+    # Increment the Python ref count because PyArray_SetBaseObject will steal a reference
+    Py_INCREF(self)
+    PyArray_SetBaseObject(arr, self)
+    return arr
+
+
+def vector_from_buffer(int t, int attr, buf):
+    """Creates a q vector of type `t` by copying the raw data from an object supporting the buffer
+    protocol, such as a `pickle.PickleBuffer`."""
+    cdef const uint8_t[::1] data = memoryview(buf).cast('B')
+    cdef size_t itemsize = _k_type_itemsize[t]
+    cdef core.K kx = core.ktn(t, len(data) // itemsize)
+    if kx.n:
+        memcpy(<void*>kx.G0, <const void*>&data[0], kx.n * itemsize)
+    kx.u = attr
+    return factory(<uintptr_t>kx, False)
+
+
+def list_from_items(items):
+    """Creates a q general list referencing each of the given `pykx.K` objects."""
+    cdef core.K kx = core.ktn(0, len(items))
+    cdef Py_ssize_t i
+    for i in range(len(items)):
+        (<core.K*>kx.G0)[i] = core.r1(_k(items[i]))
+    return factory(<uintptr_t>kx, False)
+
+
+def dictionary_from_parts(keys, values, bint table=False):
+    """Creates a q dictionary from its keys and values, or a q table if `table` is set."""
+    cdef core.K kx = core.xD(core.r1(_k(keys)), core.r1(_k(values)))
+    if table:
+        kx = core.xT(kx)
+    if kx == NULL:
+        raise QError('Failed to create a q dictionary or table from its parts')
+    return factory(<uintptr_t>kx, False)
+
+
 cpdef k_hash(x):
     cdef core.K serialized = core.b9(6, <core.K><uintptr_t>x._addr)
     return hash(PyBytes_FromStringAndSize(<char*>serialized.G0, <Py_ssize_t>serialized.n))
@@ -343,6 +412,206 @@ def list_np(self, bint raw, bint has_nulls, bint raw_repr):
     return arr
 
 
+# Item size in bytes of the q vector types whose data is stored inline
+_k_type_itemsize = {
+    1: 1, 2: 16, 4: 1, 5: 2, 6: 4, 7: 8, 8: 4, 9: 8, 10: 1,
+    12: 8, 13: 4, 14: 4, 15: 8, 16: 8, 17: 4, 18: 4, 19: 4,
+}
+
+
+def list_flatten(self):
+    """Copies the items of a list of same typed vectors into contiguous memory in one pass.
+
+    Returns a tuple of the int64 offsets of each item (of length `n + 1`), the flattened raw data
+    as a uint8 Numpy array, and the q type of the items. Returns `None` if the list is empty or its
+    items are not all vectors of the same type with inline data.
+    """
+    cdef long long n = _k(self).n
+    cdef core.K* items = <core.K*>_k(self).G0
+    cdef long long i
+    cdef long long total = 0
+    cdef signed char t
+    cdef size_t itemsize
+    cdef char* dst
+    if n == 0:
+        return None
+    t = items[0].t
+    if t not in _k_type_itemsize:
+        return None
+    itemsize = _k_type_itemsize[t]
+    offsets = np.empty(n + 1, dtype=np.int64)
+    cdef int64_t[:] offs = offsets
+    offs[0] = 0
+    for i in range(n):
+        if items[i].t != t:
+            return None
+        total += items[i].n
+        offs[i + 1] = total
+    values = np.empty(total * itemsize, dtype=np.uint8)
+    dst = <char*>cnp.PyArray_DATA(values)
+    for i in range(n):
+        memcpy(dst + offs[i] * itemsize, <void*>items[i].G0, items[i].n * itemsize)
+    return offsets, values, t
+
+
+def list_from_offsets(vec, offsets, int t):
+    """Splits a q vector into a q list of vectors of type `t` at the given int64 offsets.
+
+    The offsets must be non-decreasing, of length `n + 1` for a list of `n` items, and relative to
+    the start of `vec`. The item size of `t` must match that of `vec`.
+    """
+    cdef int64_t[:] offs = np.ascontiguousarray(offsets, dtype=np.int64)
+    cdef long long n = len(offs) - 1
+    cdef char* src = <char*>_k(vec).G0
+    cdef long long i
+    cdef size_t itemsize
+    cdef core.K item
+    if t not in _k_type_itemsize or _k_type_itemsize.get(k_t(vec)) != _k_type_itemsize[t]:
+        raise TypeError(f'Cannot split a vector of type {k_t(vec)}h into vectors of type {t}h')
+    itemsize = _k_type_itemsize[t]
+    if n < 0 or offs[0] < 0 or offs[n] > _k(vec).n:
+        raise ValueError('Offsets are out of bounds for the given vector')
+    for i in range(n):
+        if offs[i + 1] < offs[i]:
+            raise ValueError('Offsets must be non-decreasing')
+    cdef core.K kx = core.ktn(0, n)
+    for i in range(n):
+        item = core.ktn(t, offs[i + 1] - offs[i])
+        memcpy(<void*>item.G0, src + offs[i] * itemsize, item.n * itemsize)
+        (<core.K*>kx.G0)[i] = item
+    return factory(<uintptr_t>kx, False)
+
+
+def vector_slice(self, long long start, long long stop):
+    """Copies items `start` to `stop` of a q vector into a new q vector of the same type.
+
+    The indices are clamped to the bounds of the vector. Items of a general list are shared with
+    the original list rather than copied. Returns `None` if the type of the vector is not
+    supported.
+    """
+    cdef core.K x = _k(self)
+    cdef signed char t = x.t
+    cdef size_t itemsize
+    cdef long long i
+    cdef core.K res
+    if t == 0 or t == 11:
+        itemsize = sizeof(void*)
+    elif t in _k_type_itemsize:
+        itemsize = _k_type_itemsize[t]
+    else:
+        return None
+    start = min(max(start, 0), x.n)
+    stop = min(max(stop, start), x.n)
+    res = core.ktn(t, stop - start)
+    memcpy(<void*>res.G0, <char*>x.G0 + start * itemsize, res.n * itemsize)
+    if t == 0:
+        for i in range(res.n):
+            core.r1((<core.K*>res.G0)[i])
+    return factory(<uintptr_t>res, False)
+
+
+cdef inline bint _is_null(core.K x, long long i) nogil:
+    # Whether item `i` of the vector `x`, or the atom `x` if `i` is negative, is a q null
+    cdef signed char t = -x.t if x.t < 0 else x.t
+    cdef void* p = <void*>(&x.g) if i < 0 and t != 2 else <void*>x.G0
+    if i < 0:
+        i = 0
+    if t == 5:
+        return (<int16_t*>p)[i] == INT16_MIN
+    if t == 6 or 13 <= t <= 14 or 17 <= t <= 19:
+        return (<int32_t*>p)[i] == INT32_MIN
+    if t == 7 or t == 12 or t == 16:
+        return (<int64_t*>p)[i] == INT64_MIN
+    if t == 8:
+        return (<float*>p)[i] != (<float*>p)[i]
+    if t == 9 or t == 15:
+        return (<double*>p)[i] != (<double*>p)[i]
+    if t == 2:
+        return (<uint64_t*>p)[2 * i] == 0 and (<uint64_t*>p)[2 * i + 1] == 0
+    if t == 10:
+        return (<char*>p)[i] == 32 # ' '
+    if t == 11:
+        return (<char**>p)[i][0] == 0
+    return False
+
+
+cdef inline bint _is_inf(core.K x, long long i) nogil:
+    # Whether item `i` of the vector `x`, or the atom `x` if `i` is negative, is a q infinity
+    cdef signed char t = -x.t if x.t < 0 else x.t
+    cdef void* p = <void*>(&x.g) if i < 0 else <void*>x.G0
+    if i < 0:
+        i = 0
+    if t == 5:
+        return (<int16_t*>p)[i] == INT16_MAX or (<int16_t*>p)[i] == -INT16_MAX
+    if t == 6 or 13 <= t <= 14 or 17 <= t <= 19:
+        return (<int32_t*>p)[i] == INT32_MAX or (<int32_t*>p)[i] == -INT32_MAX
+    if t == 7 or t == 12 or t == 16:
+        return (<int64_t*>p)[i] == INT64_MAX or (<int64_t*>p)[i] == -INT64_MAX
+    if t == 8:
+        return isinf((<float*>p)[i])
+    if t == 9 or t == 15:
+        return isinf((<double*>p)[i])
+    return False
+
+
+cdef long long _scan(core.K x, bint infs, bint integral, uint8_t* mask, bint stop) nogil:
+    # Counts the null (or infinite) items of `x`, setting them in `mask` if it is not NULL. The
+    # items of a general list are checked only if they are atoms, and when `integral` is set only
+    # if they are integral atoms. Returns -1 if nulls cannot be detected for the type of `x`.
+    cdef long long n = x.n
+    cdef long long i
+    cdef long long count = 0
+    cdef bint found
+    cdef core.K item
+    if x.t < 0 or x.t > 19:
+        return -1
+    for i in range(n):
+        if x.t == 0:
+            item = (<core.K*>x.G0)[i]
+            if item.t >= 0 or (integral and not -7 <= item.t <= -5):
+                continue
+            found = _is_inf(item, -1) if infs else _is_null(item, -1)
+        else:
+            found = _is_inf(x, i) if infs else _is_null(x, i)
+        if found:
+            count += 1
+            if mask != NULL:
+                mask[i] = 1
+            elif stop:
+                break
+    return count
+
+
+def null_count(self, bint infs=False, bint stop=False):
+    """Counts the null items of a q vector, or its infinite items if `infs` is set.
+
+    Items of a general list are only counted if they are atoms. If `stop` is set the scan ends at
+    the first match. Returns `None` if the type of the vector is not supported.
+    """
+    cdef core.K x = _k(self)
+    cdef long long count
+    with nogil:
+        count = _scan(x, infs, False, NULL, stop)
+    return None if count < 0 else count
+
+
+def null_mask(self, bint infs=False, bint integral=False):
+    """Creates a boolean Numpy array marking the null items of a q vector.
+
+    If `infs` is set the infinite items are marked instead. Items of a general list are only
+    marked if they are atoms, or integral atoms if `integral` is set. Returns `None` if the type of
+    the vector is not supported.
+    """
+    cdef core.K x = _k(self)
+    if x.t < 0 or x.t > 19:
+        return None
+    mask = np.zeros(x.n, dtype=np.bool_)
+    cdef uint8_t* data = <uint8_t*>cnp.PyArray_DATA(mask)
+    with nogil:
+        _scan(x, infs, integral, data, False)
+    return mask
+
+
 def guid_vector_np(self, bint raw, bint has_nulls):
     if raw:
         # XXX: NPY_COMPLEX128 is the only 128 bit wide Numpy type, and GUIDs are 128 bits wide
@@ -384,6 +653,24 @@ cpdef function_call(self, args, no_gil):
     return factory(<uintptr_t>core.ee(_function_call_dot(_k(self), _k(args), no_gil)), False)
 
 
+def primitive_call(fn, *args):
+    """Applies the q function `fn` to `args` using `dot`, converting arguments to q as needed.
+
+    Unlike calling `fn`, this builds the argument list directly from the arguments, rather than
+    converting a Python list of them to q.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(args)
+    items = [x if isinstance(x, wrappers.K) else wrappers.K(x) for x in args]
+    cdef core.K kargs = core.ktn(0, n)
+    for i in range(n):
+        (<core.K*>kargs.G0)[i] = core.r1(_k(items[i]))
+    try:
+        return factory(<uintptr_t>core.ee(_function_call_dot(_k(fn), kargs, False)), False)
+    finally:
+        core.r0(kargs)
+
+
 cdef object q_table_type(core.K val):
     cdef core.K x
     x = core.k(0, <char* const>'.Q.qp', core.r1(val), NULL)
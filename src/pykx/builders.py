@@ -0,0 +1,266 @@
+"""
+_This page documents the API for incrementally building q vectors and tables with amortized
+    appends._
+"""
+
+from typing import Any, Dict, Union
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+
+from . import wrappers as k
+from .exceptions import PyKXException
+
+
+__all__ = [
+    'TableBuilder',
+    'VectorBuilder',
+]
+
+
+def _init(_q):
+    global q
+    q = _q
+
+
+# Imported on first use after `import pykx` has created the embedded q instance
+from .embedded_q import q as _embedded_q # noqa: E402
+_init(_embedded_q)
+
+
+def __dir__():
+    return __all__
+
+
+def _builder_dtype(ktype):
+    if ktype is k.BooleanVector:
+        return np.bool_
+    if ktype is k.CharVector:
+        return 'S1'
+    if ktype in (k.List, k.SymbolVector, k.GUIDVector):
+        return object
+    return np.dtype(ktype._np_dtype)
+
+
+def _builder_null(ktype, dtype):
+    if ktype is k.List:
+        return None
+    if ktype is k.SymbolVector:
+        return ''
+    if ktype is k.GUIDVector:
+        return UUID(int=0)
+    if ktype is k.CharVector:
+        return b' '
+    if dtype.kind in 'mM':
+        return dtype.type('NaT')
+    if dtype.kind == 'f':
+        return np.nan
+    return getattr(ktype, '_base_null_value', 0)
+
+
+class VectorBuilder:
+    """Incrementally build a q vector using a capacity doubling buffer.
+
+    Appending to a `pykx.Vector` creates a new q object each time, so building a vector one
+    element at a time is quadratic in the number of elements. A `VectorBuilder` instead stores the
+    data in a Numpy buffer whose capacity doubles when full, and copies it to q once when
+    [`build`][pykx.builders.VectorBuilder.build] is called.
+
+    Parameters:
+        ktype: The `pykx.Vector` type to build, or the equivalent `pykx.Atom` type or q type
+            number.
+        capacity: The initial capacity of the buffer.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> builder = kx.VectorBuilder(kx.FloatVector)
+    >>> for i in range(3):
+    ...     builder.append(i / 2)
+    >>> builder.extend([10.0, 20.0])
+    >>> builder.build()
+    pykx.FloatVector(pykx.q('0 0.5 1 10 20'))
+    ```
+    """
+    def __init__(self, ktype: Union[type, int], *, capacity: int = 16):
+        if isinstance(ktype, int):
+            ktype = k.type_number_to_pykx_k_type[ktype]
+        ktype = k.atom_to_vector.get(ktype, ktype)
+        if not (isinstance(ktype, type) and issubclass(ktype, k.Vector)) \
+                or ktype in (k.EnumVector, k.Anymap, k.DatetimeVector):
+            raise TypeError(f'Unsupported type for VectorBuilder: {ktype!r}')
+        self.ktype = ktype
+        self._data = np.empty(max(capacity, 1), dtype=_builder_dtype(ktype))
+        self._null = _builder_null(ktype, self._data.dtype)
+        self._n = 0
+
+    def __len__(self):
+        return self._n
+
+    def __repr__(self):
+        return (f'pykx.VectorBuilder(pykx.{self.ktype.__name__}, '
+                f'length={self._n}, capacity={self.capacity})')
+
+    @property
+    def capacity(self) -> int:
+        """The number of elements which can be held before the buffer is next grown."""
+        return len(self._data)
+
+    def _reserve(self, n: int):
+        if n > len(self._data):
+            data = np.empty(max(n, 2 * len(self._data)), dtype=self._data.dtype)
+            data[:self._n] = self._data[:self._n]
+            self._data = data
+
+    def _value(self, x):
+        if x is None:
+            return self._null
+        if isinstance(x, k.K):
+            return x if self.ktype is k.List else x.np()
+        return x
+
+    def append(self, x: Any):
+        """Append a single element, where `None` is appended as a q null."""
+        self._reserve(self._n + 1)
+        self._data[self._n] = self._value(x)
+        self._n += 1
+
+    def extend(self, x: Any):
+        """Append a sequence of elements, such as a list, Numpy array or `pykx.Vector`."""
+        if isinstance(x, k.Vector):
+            x = [y for y in x] if self.ktype is k.List else x.np()
+        elif isinstance(x, (pd.Series, pd.Index)):
+            x = x.to_numpy()
+        elif not isinstance(x, np.ndarray):
+            x = [self._value(y) for y in x]
+        n = len(x)
+        self._reserve(self._n + n)
+        if self.ktype is k.List:
+            for i, y in enumerate(x):
+                self._data[self._n + i] = y
+        else:
+            self._data[self._n:self._n + n] = x
+        self._n += n
+
+    def clear(self):
+        """Remove all elements, retaining the allocated capacity."""
+        self._n = 0
+
+    def build(self) -> k.Vector:
+        """Copy the elements appended so far into a new q vector."""
+        data = self._data[:self._n]
+        if self.ktype is k.List:
+            return k.toq.from_list(data.tolist(), ktype=k.List)
+        return k.toq(data, ktype=self.ktype, handle_nulls=data.dtype.kind in 'mM')
+
+
+class TableBuilder:
+    """Incrementally build a q table using a capacity doubling buffer for each column.
+
+    Rows can be appended individually as dictionaries, named tuples or tuples, or in chunks as a
+    `pandas.DataFrame`, a dictionary of column arrays or a list of rows. Each column is built
+    with a [`VectorBuilder`][pykx.builders.VectorBuilder], so the table is copied to q once when
+    [`build`][pykx.builders.TableBuilder.build] is called.
+
+    Parameters:
+        schema: A dictionary mapping column names to `pykx.K` types, or a table such as one
+            generated by [`pykx.schema.builder`][pykx.schema.builder].
+        capacity: The initial capacity of the buffer for each column.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> builder = kx.TableBuilder({'sym': kx.SymbolAtom, 'px': kx.FloatAtom})
+    >>> builder.append({'sym': 'a', 'px': 1.5})
+    >>> builder.append(('b', 2.5))
+    >>> builder.extend({'sym': ['c', 'd'], 'px': [3.5, 4.5]})
+    >>> builder.build()
+    pykx.Table(pykx.q('
+    sym px
+    -------
+    a   1.5
+    b   2.5
+    c   3.5
+    d   4.5
+    '))
+    ```
+    """
+    def __init__(self, schema: Union[Dict, k.Table, k.KeyedTable], *, capacity: int = 16):
+        columns, self._key = k.toq._schema_columns(schema)
+        self._names = [c for c, _ in columns]
+        self._columns = {c: VectorBuilder(t, capacity=capacity) for c, t in columns}
+
+    def __len__(self):
+        return len(self._columns[self._names[0]]) if self._names else 0
+
+    def __repr__(self):
+        cols = ', '.join(f'{c!r}: pykx.{b.ktype.__name__}' for c, b in self._columns.items())
+        return f'pykx.TableBuilder({{{cols}}}, length={len(self)})'
+
+    def append(self, row: Any):
+        """Append a single row as a dictionary, named tuple or tuple ordered as the schema.
+
+        Missing dictionary keys and `None` values are appended as q nulls.
+        """
+        if not isinstance(row, dict) and len(row) != len(self._names):
+            raise PyKXException(f'Row of length {len(row)} does not match the '
+                                f'{len(self._names)} columns of the schema')
+        n = len(self)
+        try:
+            if isinstance(row, dict):
+                for c in self._names:
+                    self._columns[c].append(row.get(c))
+            else:
+                for c, x in zip(self._names, row):
+                    self._columns[c].append(x)
+        except BaseException:
+            self._truncate(n)
+            raise
+
+    def _truncate(self, n: int):
+        # Keeps all columns the same length if appending part of a row or chunk failed
+        for b in self._columns.values():
+            b._n = min(b._n, n)
+
+    def extend(self, rows: Any):
+        """Append multiple rows.
+
+        Parameters:
+            rows: A `pandas.DataFrame` or a dictionary mapping column names to sequences of
+                equal length, each of which are appended column-wise, or an iterable of rows
+                accepted by [`append`][pykx.builders.TableBuilder.append].
+        """
+        if isinstance(rows, pd.DataFrame):
+            rows = {c: rows[c] for c in rows.columns}
+        if isinstance(rows, dict):
+            if set(rows) != set(self._names):
+                raise PyKXException(f'Columns {list(rows)} do not match the columns of the '
+                                    f'schema {self._names}')
+            if len({len(v) for v in rows.values()}) > 1:
+                raise PyKXException('All columns must be of equal length')
+            n = len(self)
+            try:
+                for c in self._names:
+                    self._columns[c].extend(rows[c])
+            except BaseException:
+                self._truncate(n)
+                raise
+        else:
+            for row in rows:
+                self.append(row)
+
+    def clear(self):
+        """Remove all rows, retaining the allocated capacity."""
+        for b in self._columns.values():
+            b.clear()
+
+    def build(self) -> Union[k.Table, k.KeyedTable]:
+        """Copy the rows appended so far into a new q table."""
+        names = k.toq(np.array(self._names, dtype='U'))
+        res = k.toq._table_from_columns(names, [self._columns[c].build() for c in self._names])
+        if self._key:
+            res = q.xkey(self._key, res)
+        return res
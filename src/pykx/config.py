@@ -393,6 +393,13 @@ no_pykx_signal = _is_enabled('PYKX_NO_SIGNAL')
 ignore_qhome = _is_enabled('PYKX_IGNORE_QHOME', '--ignore-qhome')
 keep_local_times = _is_enabled('PYKX_KEEP_LOCAL_TIMES')
 max_error_length = int(_get_config_value('PYKX_MAX_ERROR_LENGTH', 256))
+query_cache_size = int(_get_config_value('PYKX_QUERY_CACHE_SIZE', 256))
+cache_dir = Path(_get_config_value(
+    'PYKX_CACHE_DIR',
+    Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'pykx'
+))
+async_queue_size = int(_get_config_value('PYKX_ASYNC_QUEUE_SIZE', 128))
+pykx_trace = _get_config_value('PYKX_TRACE', None)
 
 allocator = _is_enabled('PYKX_ALLOCATOR', '--pykxalloc')
 if allocator:
@@ -470,6 +477,10 @@ __all__ = [
     'ignore_qhome',
     'keep_local_times',
     'max_error_length',
+    'query_cache_size',
+    'cache_dir',
+    'async_queue_size',
+    'pykx_trace',
 
     'k_allocator',
     'k_gc',
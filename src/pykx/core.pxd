@@ -58,6 +58,9 @@ cdef double* (*kF)(K x)
 cdef K* (*kK)(K x)
 
 cdef void (*_shutdown_thread)()
+cdef void (*_k_batch)(int n, int* handles, const char** queries, int* argcs, K* args, K* results) nogil
+cdef void (*_queue_stats)(long long* out)
+cdef void (*_reset_queue_stats)()
 cdef K (*b9)(int mode, K x)
 cdef K (*d9)(K x)
 cdef int (*dj)(int date)
@@ -85,7 +85,7 @@ if qinit_check_data is not None:
 
 
 from libc.string cimport strncpy
-from cpython.mem cimport PyMem_Malloc
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
 from libc.stdint cimport *
 
 from warnings import warn
@@ -424,6 +424,81 @@ cpdef shutdown_thread():
     if pykx_threading:
         _shutdown_thread()
 
+if pykx_threading:
+    _k_batch = <void (*)(int, int*, const char**, int*, K*, K*) nogil>dlsym(_q_handle, 'k_batch')
+    _queue_stats = <void (*)(long long*)>dlsym(_q_handle, 'queue_stats')
+    _reset_queue_stats = <void (*)()>dlsym(_q_handle, 'reset_queue_stats')
+
+
+def keval_batch(calls):
+    # Runs each `(code, args)` pair of `calls`, returning the address of each result. With
+    # PYKX_THREADING all calls are handed to the q thread together.
+    cdef int n = len(calls)
+    # Every call is checked before any of them is run or any reference is taken, so a bad call
+    # can't leak the results or argument references of the calls before it
+    addrs = []
+    for code, call_args in calls:
+        if not isinstance(code, bytes):
+            raise TypeError(f'Expected q code as bytes, not {type(code).__name__}')
+        if len(call_args) > 8:
+            raise TypeError('Too many arguments - q queries cannot have more than 8 parameters')
+        addrs.append([<uintptr_t>x._addr for x in call_args])
+    if not pykx_threading:
+        return [keval(code, *args) for code, args in calls]
+    if n == 0:
+        return []
+    cdef int* handles = <int*>PyMem_Malloc(sizeof(int) * n)
+    cdef const char** queries = <const char**>PyMem_Malloc(sizeof(char*) * n)
+    cdef int* argcs = <int*>PyMem_Malloc(sizeof(int) * n)
+    cdef K* args = <K*>PyMem_Malloc(sizeof(K) * 8 * n)
+    cdef K* results = <K*>PyMem_Malloc(sizeof(K) * n)
+    cdef bint submitted = False
+    cdef int i
+    cdef int j
+    try:
+        for i in range(8 * n):
+            args[i] = NULL
+        for i in range(n):
+            handles[i] = 0
+            queries[i] = <const char*>calls[i][0]
+            argcs[i] = len(addrs[i])
+            for j in range(argcs[i]):
+                args[8 * i + j] = r1(<K><uintptr_t>addrs[i][j])
+        with q_lock:
+            submitted = True
+            with nogil:
+                _k_batch(n, handles, queries, argcs, args, results)
+        return [<uintptr_t>results[i] for i in range(n)]
+    finally:
+        # The calls take ownership of their arguments, which must be released here if the
+        # calls were never submitted
+        if not submitted:
+            for i in range(8 * n):
+                if args[i] != NULL:
+                    r0(args[i])
+        PyMem_Free(handles)
+        PyMem_Free(queries)
+        PyMem_Free(argcs)
+        PyMem_Free(args)
+        PyMem_Free(results)
+
+
+def queue_stats(reset=False):
+    cdef long long out[6]
+    if not pykx_threading:
+        raise PyKXException('Queue statistics are only available when PYKX_THREADING is enabled')
+    _queue_stats(out)
+    if reset:
+        _reset_queue_stats()
+    return {
+        'pending': out[0],
+        'calls': out[1],
+        'wakeups': out[2],
+        'max_depth': out[3],
+        'mean_wait': out[4] / out[1] / 1e9 if out[1] else 0.0,
+        'max_wait': out[5] / 1e9,
+    }
+
 
 b9 = <K (*)(int mode, K x)>dlsym(_q_handle, sym_name('b9'))
 d9 = <K (*)(K x)>dlsym(_q_handle, sym_name('d9'))
@@ -22,6 +22,11 @@ def _init(_q):
     q = _q
 
 
+# Imported on first use after `import pykx` has created the embedded q instance
+from .embedded_q import q as _embedded_q # noqa: E402
+_init(_embedded_q)
+
+
 def __dir__():
     return __all__
 
@@ -1,9 +1,13 @@
 from abc import ABCMeta
+import asyncio
+from collections import deque, OrderedDict
+import hashlib
 import os
 from pathlib import Path
 import sys
 import platform
-from typing import Any, Optional, Union
+import threading
+from typing import Any, List, Optional, Union
 from warnings import warn
 
 from . import ipc
@@ -12,15 +16,19 @@ from . import Q
 from . import toq
 from . import wrappers
 from . import schema
-from .config import find_core_lib, licensed, no_qce, pykx_dir, pykx_libs_dir, pykx_qdebug, pykx_threading, qargs, skip_under_q, suppress_warnings, pykx_debug_insights # noqa
-from .core import keval as _keval
+from .config import async_queue_size, cache_dir, find_core_lib, licensed, no_qce, pykx_dir, pykx_libs_dir, pykx_qdebug, pykx_threading, qargs, query_cache_size, skip_under_q, suppress_warnings, pykx_debug_insights # noqa
+from .core import keval as _keval, keval_batch as _keval_batch, queue_stats as _queue_stats
 from .exceptions import FutureCancelled, LicenseException, NoResults, PyKXException, PyKXWarning, QError # noqa
 from ._wrappers import _factory as factory
+from ._wrappers import list_from_items
+from ._version import version as __version__
 
 
 __all__ = [
+    'AsyncCallQueue',
     'EmbeddedQ',
     'EmbeddedQFuture',
+    'QueryCache',
     'q',
 ]
 
@@ -101,6 +109,221 @@ def __dir__():
     return __all__
 
 
+def _is_lambda(query: Union[str, bytes]) -> bool:
+    # Whether the query is a single lambda, i.e. its opening brace is only closed by its last
+    # character. Braces within strings are ignored.
+    query = query.strip()
+    if isinstance(query, bytes):
+        query = query.decode(errors='replace')
+    if not (query.startswith('{') and query.endswith('}')):
+        return False
+    depth = 0
+    in_string = False
+    escaped = False
+    for i, c in enumerate(query):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i == len(query) - 1
+    return False
+
+
+class QueryCache:
+    """A least recently used cache of the q functions compiled from lambda queries.
+
+    When `pykx.q` is called with arguments, such as `kx.q('{x+y}', a, b)`, q parses and compiles
+    the query every time it is called. Queries which consist of a single lambda are instead
+    compiled once and the resulting function is reused by later calls with the same query text.
+    This includes the many lambdas used internally by PyKX.
+
+    The cache is available as `kx.q.query_cache`, and its initial size is set by the
+    `PYKX_QUERY_CACHE_SIZE` configuration option. A size of `0` disables the cache. Queries which
+    rely on being re-evaluated, for example because they are run within a different namespace
+    set by `\\d`, can be run with `kx.q(query, *args, cache=False)`.
+
+    Attributes:
+        maxsize: The maximum number of compiled functions to hold.
+        hits: The number of calls which reused a compiled function.
+        misses: The number of calls which compiled a lambda query.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> kx.q('{x+y}', 1, 2)
+    pykx.LongAtom(pykx.q('3'))
+    >>> kx.q('{x+y}', 3, 4)
+    pykx.LongAtom(pykx.q('7'))
+    >>> kx.q.query_cache.hits >= 1
+    True
+    >>> kx.q.query_cache.clear()
+    ```
+    """
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __repr__(self):
+        return (f'pykx.QueryCache(maxsize={self.maxsize}, size={len(self)}, hits={self.hits}, '
+                f'misses={self.misses})')
+
+    def clear(self):
+        """Remove all compiled functions from the cache and reset its statistics."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, query: Union[str, bytes]):
+        # Returns the cached function and name for a lambda query, compiling it if it is not
+        # cached yet, or `None` if the query cannot be cached
+        if self.maxsize <= 0 or not isinstance(query, (str, bytes)):
+            return None
+        try:
+            res = self._cache[query]
+        except KeyError:
+            pass
+        else:
+            self._cache.move_to_end(query)
+            self.hits += 1
+            return res
+        if not _is_lambda(query):
+            return None
+        name = wrappers.CharVector(query)
+        fn = factory(_keval(bytes(name)), False, name=name.__str__())
+        if not isinstance(fn, wrappers.Lambda):
+            return None
+        self.misses += 1
+        self._cache[query] = res = (fn, name.__str__())
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return res
+
+
+def _resolve(fut: asyncio.Future, result: Any, err: Optional[BaseException]):
+    # Run on the event loop of the awaiting coroutine, which may have been cancelled since the
+    # call started
+    if fut.done():
+        return
+    if err is not None:
+        fut.set_exception(err)
+    else:
+        fut.set_result(result)
+
+
+class AsyncCallQueue:
+    """The bounded queue of calls made using [`EmbeddedQ.async_call`][pykx.EmbeddedQ.async_call].
+
+    Calls are run in order by a dedicated thread, which hands each to the q thread created by
+    `PYKX_THREADING`, so the event loop awaiting them is never blocked by q. When `maxsize`
+    calls are waiting to start, further calls wait asynchronously for space in the queue.
+
+    Calls which have not started can be cancelled by cancelling the task awaiting them, or all
+    at once using [`cancel_pending`][pykx.embedded_q.AsyncCallQueue.cancel_pending]. A call which
+    has started runs to completion, and its result is discarded if it was cancelled.
+
+    The queue is available as `kx.q.async_queue`, and its initial size is set by the
+    `PYKX_ASYNC_QUEUE_SIZE` configuration option.
+
+    Attributes:
+        maxsize: The maximum number of calls waiting to start.
+    """
+    def __init__(self, q, maxsize: int):
+        self.maxsize = maxsize
+        self._q = q
+        self._pending = deque()
+        self._space = []
+        self._lock = threading.Condition()
+        self._thread = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __repr__(self):
+        return f'pykx.AsyncCallQueue(maxsize={self.maxsize}, pending={len(self)})'
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._lock.wait()
+                fut, loop, query, args, kwargs = self._pending.popleft()
+                space, self._space = self._space, []
+            for waiter_loop, waiter in space:
+                self._call_soon(waiter_loop, _resolve, waiter, None, None)
+            result, err = None, None
+            try:
+                result = self._q(query, *args, **kwargs)
+            except BaseException as e:
+                err = e
+            self._call_soon(loop, _resolve, fut, result, err)
+
+    @staticmethod
+    def _call_soon(loop, fn, *args):
+        try:
+            loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            # The event loop has been closed, so nothing is awaiting the result
+            pass
+
+    async def _submit(self, query, args, kwargs):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name='pykx-async-call', daemon=True)
+                    self._thread.start()
+                if len(self._pending) < max(self.maxsize, 1):
+                    item = (loop.create_future(), loop, query, args, kwargs)
+                    self._pending.append(item)
+                    self._lock.notify()
+                    break
+                waiter = loop.create_future()
+                self._space.append((loop, waiter))
+            await waiter
+        try:
+            return await item[0]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._pending.remove(item)
+                except ValueError:
+                    space = []
+                else:
+                    space, self._space = self._space, []
+            for waiter_loop, waiter in space:
+                self._call_soon(waiter_loop, _resolve, waiter, None, None)
+            raise
+
+    def cancel_pending(self) -> int:
+        """Cancel all calls which have not started, returning the number cancelled."""
+        with self._lock:
+            cancelled = list(self._pending)
+            self._pending.clear()
+            space, self._space = self._space, []
+        for fut, loop, *_ in cancelled:
+            self._call_soon(loop, fut.cancel)
+        for waiter_loop, waiter in space:
+            self._call_soon(waiter_loop, _resolve, waiter, None, None)
+        return len(cancelled)
+
+
 # The metaclass of a derived class (EmbeddedQ) must be a (non-strict) subclass of the metaclasses of
 # all its bases (ABCMeta from Q).
 class ABCMetaSingleton(ABCMeta):
@@ -117,6 +340,8 @@ class ABCMetaSingleton(ABCMeta):
 class EmbeddedQ(Q, metaclass=ABCMetaSingleton):
     """Interface for using q within the current python process. Call this to execute q code."""
     def __init__(self): # noqa
+        object.__setattr__(self, 'query_cache', QueryCache(query_cache_size))
+        object.__setattr__(self, 'async_queue', AsyncCallQueue(self, async_queue_size))
         if licensed:
             kxic_path = pykx_libs_dir.as_posix()
             kxic_file = 'kxic.k'
@@ -186,17 +411,44 @@ class EmbeddedQ(Q, metaclass=ABCMetaSingleton):
                 pykx_qini_path = Path(__file__).parent.absolute().as_posix()
                 self._call(f'.pykx.util.loadfile["{pykx_qini_path}";"pykx_init.q_"]', skip_debug=True) # noqa
                 pykx_q_path = (Path(__file__).parent.absolute()/'pykx.q')
-                with open(pykx_q_path, 'r') as f:
-                    code = f.read()
-                code = [wrappers.CharVector(x) for x in code.split('\n')][:-1]
                 self._call(
-                    "{[code;file] value (@';last file;enlist[file],/:.Q.pykxld code)}",
-                    code,
+                    "{[statements;file] value (@';last file;statements)}",
+                    self._pykx_q_statements(pykx_q_path),
                     b'pykx.q', skip_debug=True
                 )
                 self._call('.pykx.setdefault[enlist"k"]', skip_debug=True)
         super().__init__()
 
+    def _pykx_q_statements(self, path: Path) -> wrappers.List:
+        # Splitting pykx.q into statements with `.Q.pykxld` requires converting each of its lines
+        # to q, so the statements are cached in a file keyed by the versions of PyKX and q and the
+        # pykx.q file, and read with a single deserialization on later imports. The namespaces
+        # created by the statements can't be cached instead, as they hold functions loaded from
+        # shared libraries and the statements have side effects on the q process.
+        stat = path.stat()
+        key = '|'.join((__version__, str(self._call('.z.K,.z.k', skip_debug=True).py()),
+                        str(path), str(stat.st_mtime_ns), str(stat.st_size)))
+        cache_file = cache_dir / f'pykx_q_{hashlib.sha1(key.encode()).hexdigest()[:16]}.bin'
+        if cache_file.exists():
+            try:
+                return self._call('{-9!read1 hsym`$x}', cache_file.as_posix(), skip_debug=True)
+            except QError:
+                pass
+        with open(path, 'r') as f:
+            code = f.read()
+        code = [wrappers.CharVector(x) for x in code.split('\n')][:-1]
+        statements = self._call('{[code;file] enlist[file],/:.Q.pykxld code}', code, b'pykx.q',
+                                skip_debug=True)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Written to a temporary file first so other processes never read a partial file
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            self._call('{(hsym`$x) 1: -8!y}', tmp_file.as_posix(), statements, skip_debug=True)
+            os.replace(tmp_file, cache_file)
+        except (OSError, QError): # nocov
+            pass
+        return statements
+
     def __repr__(self):
         return 'pykx.q'
 
@@ -206,6 +458,7 @@ class EmbeddedQ(Q, metaclass=ABCMetaSingleton):
                  wait: Optional[bool] = None,
                  debug: bool = False,
                  skip_debug: bool = False,
+                 cache: bool = True,
                  **kwargs # since sync got removed this is added to ensure it doesn't break
     ) -> wrappers.K:
         """Run q code in the q instance.
@@ -219,6 +472,8 @@ class EmbeddedQ(Q, metaclass=ABCMetaSingleton):
                 `#!python pykx.QConnection` instance the same way. All queries executed by this
                 function are synchronous on the embedded q instance. Using a `#!python False`
                 argument for this parameter returns a q generic null (`#!q ::`).
+            cache: Whether a query consisting of a single lambda may be compiled once and reused
+                from `kx.q.query_cache` when called with arguments.
 
         Returns:
             The value obtained by evaluating the `query` within the current process.
@@ -232,8 +487,16 @@ class EmbeddedQ(Q, metaclass=ABCMetaSingleton):
             raise LicenseException("run q code via 'pykx.q'")
         if len(args) > 8:
             raise TypeError('Too many arguments - q queries cannot have more than 8 parameters')
+        debugging = (not skip_debug) and (debug or pykx_qdebug)
+        cached = self.query_cache._get(query) if cache and args and not debugging else None
+        if cached is not None:
+            fn, name = cached
+            result = _keval(b'.', fn, list_from_items([wrappers.K(x) for x in args]))
+            if wait is None or wait:
+                return factory(result, False, name=name)
+            return self('::', wait=True)
         query = wrappers.CharVector(query)
-        if (not skip_debug) and (debug or pykx_qdebug):
+        if debugging:
             if 0 != len(args):
                 query = wrappers.List([query, *[wrappers.K(x) for x in args]])
             result = _keval(
@@ -246,6 +509,115 @@ class EmbeddedQ(Q, metaclass=ABCMetaSingleton):
             return factory(result, False, name=query.__str__())
         return self('::', wait=True)
 
+    def batch(
+        self,
+        queries: List[Union[str, bytes, wrappers.CharVector, tuple]],
+    ) -> List[wrappers.K]:
+        """Run several queries in the q instance with a single handoff to q.
+
+        When `PYKX_THREADING` is enabled each call into q from Python is passed to a background
+        thread which runs q, and the calling thread waits for it to complete. A batch is passed
+        to that thread together, so the cost of waking it and waiting for the result is paid
+        once rather than per query. Without `PYKX_THREADING` the queries are run in turn.
+
+        Parameters:
+            queries: The queries to run, in order. Each is either q code, or a tuple of q code
+                followed by up to 8 arguments which are converted to `pykx.K` objects.
+
+        Returns:
+            The result of each query. Every query is run even if an earlier one fails, in which
+                case the error raised by the first failing query is raised once all have run.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> kx.q.batch(['til 3', ('{x+y}', 1, 2)])
+        [pykx.LongVector(pykx.q('0 1 2')), pykx.LongAtom(pykx.q('3'))]
+        ```
+        """
+        if not licensed:
+            raise LicenseException("run q code via 'pykx.q'")
+        calls = []
+        for x in queries:
+            query, *args = (x,) if isinstance(x, (str, bytes, wrappers.CharVector)) else x
+            if len(args) > 8:
+                raise TypeError('Too many arguments - q queries cannot have more than 8 '
+                                'parameters')
+            calls.append((bytes(wrappers.CharVector(query)), [wrappers.K(a) for a in args]))
+        results = []
+        error = None
+        for (query, _), result in zip(calls, _keval_batch(calls)):
+            try:
+                results.append(factory(result, False, name=query.decode()))
+            except QError as err:
+                error = error or err
+        if error is not None:
+            raise error
+        return results
+
+    async def async_call(self, query: Union[str, bytes, wrappers.CharVector], *args: Any,
+                         **kwargs) -> wrappers.K:
+        """Run q code in the q instance without blocking the running asyncio event loop.
+
+        The call is added to the bounded [`kx.q.async_queue`][pykx.embedded_q.AsyncCallQueue]
+        and run by a dedicated thread on the q thread created by `PYKX_THREADING`, while the
+        event loop continues to run other tasks. Cancelling the awaiting task before the call
+        starts removes it from the queue.
+
+        Parameters:
+            query: The code to run in the q instance.
+            *args: Arguments to the q query, as for [`EmbeddedQ.__call__`][pykx.EmbeddedQ].
+            **kwargs: Keyword arguments passed to `EmbeddedQ.__call__`.
+
+        Returns:
+            The value obtained by evaluating the `query`.
+
+        Raises:
+            PyKXException: `PYKX_THREADING` is not enabled.
+
+        Examples:
+
+        ```python
+        >>> import os
+        >>> os.environ['PYKX_THREADING'] = '1'
+        >>> import asyncio
+        >>> import pykx as kx
+        >>> async def main():
+        ...     return await asyncio.gather(
+        ...         kx.q.async_call('{system"sleep 1";x}', 1),
+        ...         kx.q.async_call('til 3'),
+        ...     )
+        >>> asyncio.run(main())
+        [pykx.LongAtom(pykx.q('1')), pykx.LongVector(pykx.q('0 1 2'))]
+        >>> kx.shutdown_thread()
+        ```
+        """
+        if not licensed:
+            raise LicenseException("run q code via 'pykx.q'")
+        if not pykx_threading:
+            raise PyKXException('kx.q.async_call requires PYKX_THREADING to be enabled')
+        return await self.async_queue._submit(query, args, kwargs)
+
+    def queue_stats(self, reset: bool = False) -> dict:
+        """Statistics for the queue of calls passed to the q thread when `PYKX_THREADING` is
+        enabled.
+
+        Parameters:
+            reset: Whether to reset the statistics after reading them.
+
+        Returns:
+            A dictionary containing the number of calls waiting to be run (`pending`), the number
+                of calls run (`calls`), the number of times the q thread woke to run queued calls
+                (`wakeups`), the largest number of calls run per wakeup (`max_depth`), and the
+                mean and maximum time in seconds calls waited in the queue before being run
+                (`mean_wait`, `max_wait`).
+
+        Raises:
+            PyKXException: `PYKX_THREADING` is not enabled.
+        """
+        return _queue_stats(reset)
+
     # Asynchronous q calls internally use a _call method to run q code synchronously, so this has
     # been added in order to provide a consistent interface across all subclasses of `Q`.
     _call = __call__
@@ -0,0 +1,342 @@
+"""
+_This page documents the API for finding the Python code holding references to q memory._
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional
+import weakref
+
+from . import _wrappers
+from .config import k_allocator, licensed
+from .exceptions import PyKXException
+
+
+__all__ = [
+    'MemoryDiff',
+    'MemorySnapshot',
+    'TrackedObject',
+    'diff',
+    'is_tracking',
+    'snapshot',
+    'start',
+    'stop',
+]
+
+
+def _init(_q):
+    global q
+    q = _q
+
+
+# Imported on first use after `import pykx` has created the embedded q instance
+from .embedded_q import q as _embedded_q # noqa: E402
+_init(_embedded_q)
+
+
+def __dir__():
+    return __all__
+
+
+_pykx_dir = os.path.dirname(os.path.abspath(__file__))
+_group_keys = ('site', 'type', 'stack')
+_state = threading.local()
+_depth = 0
+_serial = 0
+
+
+def _creation_stack(depth: int) -> tuple:
+    # The frames which created the object, starting from the innermost frame outside of PyKX, as
+    # the frames within PyKX are the same for every object created by a given operation. Every
+    # frame from this one outwards is checked, as the PyKX frames are skipped by their filename.
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_pykx_dir):
+        frame = frame.f_back
+    stack = []
+    while frame is not None and len(stack) < depth:
+        stack.append((frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name))
+        frame = frame.f_back
+    return tuple(stack)
+
+
+def _record(_k, cls, addr):
+    global _serial
+    if getattr(_state, 'paused', False):
+        return
+    _serial += 1
+    _wrappers._tracked_objects[id(_k)] = (
+        _serial, weakref.ref(_k), cls, addr, time.time(), _creation_stack(_depth))
+
+
+def start(depth: int = 8):
+    """Start recording the K objects wrapped by Python objects, and where they were created.
+
+    Tracking adds the cost of recording the creation stack to every `pykx.K` object created, so
+    it is intended to be enabled while investigating q memory which is not being released.
+    Objects created before tracking started are not recorded.
+
+    Parameters:
+        depth: The number of stack frames recorded for each object, starting from the innermost
+            frame outside of PyKX.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> kx.memory.start()
+    >>> tables = [kx.q('([] x: til 1000000)') for _ in range(3)]
+    >>> kx.memory.snapshot().top(1)
+    [{'site': '<stdin>:1', 'count': 3, 'bytes': 24000093}]
+    ```
+    """
+    global _depth
+    if depth < 1:
+        raise ValueError('depth must be at least 1')
+    _depth = depth
+    _wrappers.set_memory_hook(_record)
+
+
+def stop():
+    """Stop recording K objects, and forget the objects recorded so far."""
+    _wrappers.set_memory_hook(None)
+    _wrappers._tracked_objects.clear()
+
+
+def is_tracking() -> bool:
+    """Whether K objects are being recorded, as enabled by [`start`][pykx.memory.start]."""
+    return _wrappers._memory_hook is not None
+
+
+class TrackedObject:
+    """A K object wrapped by a Python object which was alive when a snapshot was taken.
+
+    Attributes:
+        serial: A number identifying the object, which increases with each object recorded.
+        type: The `pykx.K` subclass which wraps the object.
+        address: The address of the K object.
+        size: The size in bytes of the object when serialized by q, as returned by `-22!`.
+        refcount: The q reference count of the object, which includes references held by q and
+            by other Python objects.
+        created: The time at which the object was created, in seconds since the epoch.
+        stack: The frames which created the object, starting from the innermost frame outside
+            of PyKX.
+    """
+    def __init__(self, serial, type, address, size, refcount, created, stack):
+        self.serial = serial
+        self.type = type
+        self.address = address
+        self.size = size
+        self.refcount = refcount
+        self.created = created
+        self.stack = traceback.StackSummary.from_list(stack)
+
+    def __repr__(self):
+        return (f'pykx.memory.TrackedObject(pykx.{self.type.__name__}, size={self.size}, '
+                f'site={self.site!r})')
+
+    @property
+    def site(self) -> str:
+        """The file and line which created the object."""
+        if not self.stack:
+            return '<unknown>'
+        return f'{self.stack[0].filename}:{self.stack[0].lineno}'
+
+    def _key(self, group_by: str) -> str:
+        if group_by == 'site':
+            return self.site
+        if group_by == 'type':
+            return f'pykx.{self.type.__name__}'
+        return ''.join(self.stack.format()).rstrip()
+
+
+def _check_group_by(group_by: str):
+    if group_by not in _group_keys:
+        raise ValueError(f'Invalid group_by {group_by!r}, expected one of {_group_keys}')
+
+
+def _group(objects: List[TrackedObject], group_by: str) -> Dict[str, list]:
+    groups = {}
+    for x in objects:
+        group = groups.setdefault(x._key(group_by), [0, 0])
+        group[0] += 1
+        group[1] += x.size
+    return groups
+
+
+def _sizes(objects: list) -> List[int]:
+    if not objects:
+        return []
+    if licensed:
+        return q("-22!'", _wrappers.list_from_items(objects)).py()
+    return [len(_wrappers.k_pickle(x)) for x in objects]
+
+
+class MemorySnapshot:
+    """The K objects held by Python and the memory usage of q and Numpy at a point in time.
+
+    Attributes:
+        time: The time at which the snapshot was taken, in seconds since the epoch.
+        objects: The tracked objects which were alive, ordered by when they were created.
+        q: The memory usage of q as returned by `.Q.w[]`, or `None` in unlicensed mode.
+        numpy: The memory allocated for Numpy arrays by the PyKX Numpy allocator, as a
+            dictionary of the current and peak `bytes` and the number of `arrays`, or `None`
+            if the allocator is not enabled.
+    """
+    def __init__(self, time, objects, q, numpy):
+        self.time = time
+        self.objects = objects
+        self.q = q
+        self.numpy = numpy
+
+    def __repr__(self):
+        return (f'pykx.memory.MemorySnapshot(objects={len(self.objects)}, '
+                f'bytes={self.total_bytes})')
+
+    @property
+    def total_bytes(self) -> int:
+        """The total size of the tracked objects, counting each K object once."""
+        return sum({x.address: x.size for x in self.objects}.values())
+
+    def top(self, limit: Optional[int] = 10, group_by: str = 'site') -> List[dict]:
+        """The largest holders of q memory, grouping the tracked objects.
+
+        Parameters:
+            limit: The number of groups returned, or `None` for all groups.
+            group_by: Either `'site'` to group objects by the line which created them, `'type'`
+                to group them by their `pykx.K` subclass, or `'stack'` to group them by their
+                full creation stack.
+
+        Returns:
+            A list of dictionaries holding the `count` and total size in `bytes` of the objects
+                in each group, ordered from the largest.
+        """
+        _check_group_by(group_by)
+        groups = _group(self.objects, group_by)
+        res = [{group_by: key, 'count': count, 'bytes': size}
+               for key, (count, size) in groups.items()]
+        res.sort(key=lambda x: x['bytes'], reverse=True)
+        return res if limit is None else res[:limit]
+
+
+def snapshot() -> MemorySnapshot:
+    """Take a snapshot of the K objects held by Python, and the memory usage of q and Numpy.
+
+    The size of each object is computed when the snapshot is taken, so it reflects any changes
+    made to the object in place since it was created.
+
+    Returns:
+        A [`MemorySnapshot`][pykx.memory.MemorySnapshot].
+
+    Raises:
+        PyKXException: Tracking has not been started using [`start`][pykx.memory.start].
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> kx.memory.start()
+    >>> before = kx.memory.snapshot()
+    >>> cache = {i: kx.q('{([] x: til x)}', 100000) for i in range(5)}
+    >>> after = kx.memory.snapshot()
+    >>> kx.memory.diff(before, after).top(1)
+    [{'site': '<stdin>:1', 'count': 5, 'bytes': 4000155}]
+    >>> after.q['used'], after.numpy
+    (4756432, {'bytes': 0, 'arrays': 0, 'peak_bytes': 1024})
+    ```
+    """
+    if not is_tracking():
+        raise PyKXException('Memory tracking has not been started, call kx.memory.start() first')
+    _state.paused = True
+    try:
+        records, held, objects = [], [], []
+        for serial, ref, cls, addr, created, stack in list(_wrappers._tracked_objects.values()):
+            # Holding the `_K` object keeps the K object alive while its size is computed
+            _k = ref()
+            if _k is None:
+                continue
+            held.append(_k)
+            records.append((serial, cls, addr, created, stack))
+            objects.append(_wrappers._factory(addr, True))
+        sizes = _sizes(objects)
+        tracked = [TrackedObject(serial, cls, addr, size, _wrappers.k_r(x) - 1, created, stack)
+                   for (serial, cls, addr, created, stack), size, x
+                   in zip(records, sizes, objects)]
+        tracked.sort(key=lambda x: x.serial)
+        workspace = q('.Q.w[]').py() if licensed else None
+    finally:
+        _state.paused = False
+    numpy = None
+    if k_allocator:
+        from . import _numpy
+        numpy = _numpy.allocator_stats()
+    return MemorySnapshot(time.time(), tracked, workspace, numpy)
+
+
+class MemoryDiff:
+    """The change in the K objects held by Python and the memory usage of q and Numpy between two
+    snapshots.
+
+    Attributes:
+        new: The tracked objects alive in the later snapshot which were not in the earlier one.
+        freed: The tracked objects alive in the earlier snapshot which were released.
+        q: The change in each value of `.Q.w[]`, or `None` in unlicensed mode.
+        numpy: The change in the memory allocated by the PyKX Numpy allocator, or `None` if the
+            allocator is not enabled.
+    """
+    def __init__(self, old: MemorySnapshot, new: MemorySnapshot):
+        old_serials = {x.serial for x in old.objects}
+        new_serials = {x.serial for x in new.objects}
+        self.new = [x for x in new.objects if x.serial not in old_serials]
+        self.freed = [x for x in old.objects if x.serial not in new_serials]
+        self.q = None if old.q is None or new.q is None \
+            else {n: new.q[n] - old.q.get(n, 0) for n in new.q}
+        self.numpy = None if old.numpy is None or new.numpy is None \
+            else {n: new.numpy[n] - old.numpy[n] for n in new.numpy}
+
+    def __repr__(self):
+        return (f'pykx.memory.MemoryDiff(new={len(self.new)}, freed={len(self.freed)}, '
+                f'bytes={self.total_bytes:+})')
+
+    @property
+    def total_bytes(self) -> int:
+        """The change in the total size of the tracked objects."""
+        return sum(x.size for x in self.new) - sum(x.size for x in self.freed)
+
+    def top(self, limit: Optional[int] = 10, group_by: str = 'site') -> List[dict]:
+        """The groups of tracked objects whose memory grew or shrank the most.
+
+        Parameters:
+            limit: The number of groups returned, or `None` for all groups.
+            group_by: Either `'site'`, `'type'` or `'stack'`, as for
+                [`MemorySnapshot.top`][pykx.memory.MemorySnapshot.top].
+
+        Returns:
+            A list of dictionaries holding the change in the `count` and total size in `bytes`
+                of the objects in each group, ordered by the largest absolute change in size.
+        """
+        _check_group_by(group_by)
+        groups = _group(self.new, group_by)
+        for key, (count, size) in _group(self.freed, group_by).items():
+            group = groups.setdefault(key, [0, 0])
+            group[0] -= count
+            group[1] -= size
+        res = [{group_by: key, 'count': count, 'bytes': size}
+               for key, (count, size) in groups.items() if count or size]
+        res.sort(key=lambda x: abs(x['bytes']), reverse=True)
+        return res if limit is None else res[:limit]
+
+
+def diff(old: MemorySnapshot, new: Optional[MemorySnapshot] = None) -> MemoryDiff:
+    """Compare two snapshots to find the code responsible for growth in q memory.
+
+    Parameters:
+        old: The earlier snapshot.
+        new: The later snapshot, defaulting to a snapshot taken now.
+
+    Returns:
+        A [`MemoryDiff`][pykx.memory.MemoryDiff].
+    """
+    return MemoryDiff(old, snapshot() if new is None else new)
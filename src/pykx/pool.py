@@ -0,0 +1,202 @@
+"""
+_This page documents the API for running Python functions over q data in parallel worker
+    processes._
+"""
+
+from concurrent.futures import Future
+import importlib
+import multiprocessing
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+from . import shared
+from . import wrappers as k
+from .reimporter import PyKXReimport
+from .util import num_available_cores
+
+
+__all__ = [
+    'ProcessPool',
+]
+
+
+def __dir__():
+    return __all__
+
+
+class _SharedArgument:
+    # Marks a table argument placed in shared memory, which the worker attaches before calling
+    # the function
+    def __init__(self, handle: shared.SharedTable):
+        self.handle = handle
+
+
+def _worker_init(preload: Sequence[str], initializer: Optional[Callable], initargs: tuple):
+    # Imported eagerly so that the cost of importing PyKX and the preloaded libraries is paid when
+    # the pool starts rather than by the first task each worker runs
+    importlib.import_module('pykx')
+    for module in preload:
+        importlib.import_module(module)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _worker_arg(x):
+    return shared.attach(x.handle) if isinstance(x, _SharedArgument) else x
+
+
+def _worker_call(fn: Callable, args: tuple, kwargs: dict):
+    return fn(*[_worker_arg(x) for x in args], **{n: _worker_arg(x) for n, x in kwargs.items()})
+
+
+def _worker_chunk(fn: Callable, chunk: list):
+    return [_worker_call(fn, args, {}) for args in chunk]
+
+
+class ProcessPool:
+    """A pool of worker processes, each running its own embedded q, for parallel Python and q work.
+
+    Embedded q runs within a single Python process, so Python functions called from q, such as
+    through `peach`, cannot run in parallel. A `ProcessPool` instead starts `n` Python processes
+    which each import PyKX, and runs functions submitted to it in those processes. Arguments and
+    results, including `pykx.K` objects, are passed between processes using q serialization.
+    In-memory tables with at least `share_threshold` rows are instead placed in shared memory using
+    [`pykx.shared`][pykx.shared], so they are written once rather than sent through a pipe.
+
+    Workers are started using the `spawn` method when the pool is created, and each imports PyKX
+    and the modules in `preload` before running `initializer`, so libraries and q code used by
+    the submitted functions are loaded once per worker. As with `multiprocessing`, submitted
+    functions must be importable by the workers, and scripts which create a pool should do so
+    within an `if __name__ == '__main__':` block.
+
+    Parameters:
+        n: The number of worker processes, defaulting to the number of cores available.
+        preload: Modules imported by each worker when it starts.
+        initializer: A function called by each worker when it starts, such as to load q code.
+        initargs: The arguments passed to `initializer`.
+        share_threshold: The number of rows above which table arguments are passed through
+            shared memory, or `None` to always serialize them.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> def vwap(t):
+    ...     return kx.q('{x wavg y}', t['size'], t['price'])
+    >>> trades = kx.q('([] sym: `a`b`a`b; price: 1 2 3 4f; size: 10 10 30 30)')
+    >>> syms = kx.q('distinct', trades['sym'])
+    >>> with kx.ProcessPool(2) as pool:
+    ...     res = pool.map(vwap, [trades.select(where=kx.Column('sym') == s) for s in syms])
+    ...     dict(zip(syms.py(), [x.py() for x in res]))
+    {'a': 2.5, 'b': 3.5}
+    ```
+    """
+    def __init__(
+        self,
+        n: Optional[int] = None,
+        *,
+        preload: Sequence[str] = (),
+        initializer: Optional[Callable] = None,
+        initargs: tuple = (),
+        share_threshold: Optional[int] = 100000,
+    ):
+        self.n = num_available_cores() if n is None else n
+        self.share_threshold = share_threshold
+        # The workers are started while the environment variables PyKX sets for the current
+        # process are reset, so each initializes PyKX as a new process
+        with PyKXReimport():
+            self._pool = multiprocessing.get_context('spawn').Pool(
+                self.n, _worker_init, (tuple(preload), initializer, initargs))
+
+    def __repr__(self):
+        return f'pykx.ProcessPool({self.n})'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def _share(self, x: Any, handles: list):
+        if (
+            self.share_threshold is not None
+            and isinstance(x, (k.Table, k.KeyedTable))
+            and not isinstance(x, (k.SplayedTable, k.PartitionedTable))
+            and len(x) >= self.share_threshold
+        ):
+            handle = shared.share(x)
+            handles.append(handle)
+            return _SharedArgument(handle)
+        return x
+
+    def _apply(self, fn: Callable, args: tuple, handles: list) -> Future:
+        # Converts the AsyncResult of the pool into a Future, releasing the shared memory used by
+        # the arguments once the call completes
+        fut = Future()
+        fut.set_running_or_notify_cancel()
+
+        def done(res, err=None):
+            for handle in handles:
+                handle.close()
+            if err is not None:
+                fut.set_exception(err)
+            else:
+                fut.set_result(res)
+
+        try:
+            self._pool.apply_async(fn, args, callback=done,
+                                   error_callback=lambda err: done(None, err))
+        except BaseException:
+            for handle in handles:
+                handle.close()
+            raise
+        return fut
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Run `fn(*args, **kwargs)` in a worker process.
+
+        Returns:
+            A `concurrent.futures.Future` which holds the result of the call once it completes.
+        """
+        handles = []
+        args = tuple(self._share(x, handles) for x in args)
+        kwargs = {n: self._share(x, handles) for n, x in kwargs.items()}
+        return self._apply(_worker_call, (fn, args, kwargs), handles)
+
+    def map(self, fn: Callable, *iterables: Iterable, chunksize: int = 1) -> Iterator:
+        """Apply `fn` to each item of `iterables` in parallel across the workers.
+
+        Parameters:
+            fn: The function to apply, which takes an argument from each of `iterables`.
+            *iterables: The arguments to apply `fn` to, which are consumed immediately.
+            chunksize: The number of calls sent to a worker at a time. Larger chunks reduce the
+                overhead of many short calls.
+
+        Returns:
+            An iterator over the results of the calls, in the order of the arguments.
+        """
+        futures = []
+        calls = list(zip(*iterables))
+        for i in range(0, len(calls), max(chunksize, 1)):
+            handles = []
+            chunk = [tuple(self._share(x, handles) for x in args)
+                     for args in calls[i:i + max(chunksize, 1)]]
+            futures.append(self._apply(_worker_chunk, (fn, chunk), handles))
+
+        def results():
+            for fut in futures:
+                yield from fut.result()
+
+        return results()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes.
+
+        Parameters:
+            wait: Whether to wait for submitted calls to complete. Otherwise the workers are
+                terminated immediately.
+        """
+        if wait:
+            self._pool.close()
+            self._pool.join()
+        else:
+            self._pool.terminate()
@@ -0,0 +1,376 @@
+"""
+_This page documents the API for tracing where time is spent in calls to q from Python._
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+from types import FunctionType
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Union
+
+from . import _wrappers
+from . import embedded_q
+from . import ipc
+from . import wrappers
+from .exceptions import PyKXException
+
+
+__all__ = [
+    'Profile',
+    'Span',
+    'profile',
+]
+
+
+def __dir__():
+    return __all__
+
+
+# The profiles which are recording, and the functions replaced by traced versions of them while
+# any profile is recording. Nothing is traced while no profile is recording, so tracing has no
+# overhead when it is not in use.
+_active = []
+_patched = []
+_lock = threading.Lock()
+_local = threading.local()
+
+# The methods of `pykx.K` subclasses which convert q data to Python
+_conversions = ('py', 'np', 'pd', 'pa', 'pl')
+
+
+class Span:
+    """A timed operation within a call to q.
+
+    Attributes:
+        category: The kind of operation, which is one of `'q'` for a call to embedded q, `'ipc'`
+            for a call over IPC, `'toq'` for converting a Python object to q, `'execute'` for
+            running a query in embedded q, `'wrap'` for wrapping the result of a query as a
+            `pykx.K` object, `'send'` and `'receive'` for sending a query over IPC and receiving
+            its result, or `'convert'` for converting q data to Python.
+        name: The name of the operation, which is the query for calls to q.
+        args: Details of the operation, such as the types and sizes of the arguments of a query.
+        thread: The identifier of the thread which ran the operation.
+        start: The time at which the operation started, in nanoseconds, as returned by
+            `time.perf_counter_ns`.
+        end: The time at which the operation ended, in nanoseconds.
+        parent: The span within which the operation ran, if any.
+        children: The total time in nanoseconds spent in spans directly within this span, by
+            category.
+    """
+    __slots__ = ('category', 'name', 'args', 'thread', 'start', 'end', 'parent', 'children')
+
+    def __init__(self, category, name, args, thread, parent):
+        self.category = category
+        self.name = name
+        self.args = args
+        self.thread = thread
+        self.parent = parent
+        self.children = {}
+        self.start = self.end = 0
+
+    def __repr__(self):
+        return (f'pykx.profiler.Span({self.category!r}, {self.name!r}, '
+                f'duration={self.duration / 1e9:.6f})')
+
+    @property
+    def duration(self) -> int:
+        """The duration of the operation in nanoseconds."""
+        return self.end - self.start
+
+    @property
+    def self_time(self) -> int:
+        """The duration of the operation in nanoseconds, excluding the spans within it."""
+        return self.duration - sum(self.children.values())
+
+    @property
+    def key(self) -> tuple:
+        # The key of the span in a `pstats` profile, which identifies functions by filename, line
+        # number and function name
+        return (f'pykx.{self.category}', 0, self.name)
+
+
+def _describe(x: Any) -> str:
+    desc = type(x).__name__
+    try:
+        return f'{desc}[{len(x)}]'
+    except Exception:
+        return desc
+
+
+def _query_text(query: Any, limit: int = 200) -> str:
+    if isinstance(query, bytes):
+        query = query.decode(errors='replace')
+    elif isinstance(query, wrappers.CharVector):
+        # Read directly so that describing the query isn't itself traced as a conversion
+        query = _wrappers.vector_buffer(query).tobytes().decode(errors='replace')
+    elif not isinstance(query, str):
+        query = _describe(query)
+    return query if len(query) <= limit else query[:limit - 3] + '...'
+
+
+def _query_args(args: tuple, kwargs: dict) -> dict:
+    # The arguments of the query follow the instance it is run on and the query
+    return {'args': [_describe(x) for x in args[2:]]}
+
+
+def _begin(category: str, name: str, args: Optional[dict]) -> Span:
+    stack = _local.__dict__.setdefault('stack', [])
+    span = Span(category, name, args or {}, threading.get_ident(), stack[-1] if stack else None)
+    stack.append(span)
+    for p in _active:
+        p.spans.append(span)
+    span.start = perf_counter_ns()
+    return span
+
+
+def _end(span: Span):
+    span.end = perf_counter_ns()
+    _local.stack.pop()
+    if span.parent is not None:
+        children = span.parent.children
+        children[span.category] = children.get(span.category, 0) + span.duration
+
+
+def _traced(fn, category: str, name=None, describe=None):
+    # Wraps `fn` to record a span each time it is called. `name` is either the name of the span,
+    # or a function which computes it from the arguments.
+    @functools.wraps(fn, updated=())
+    def traced(*args, **kwargs):
+        span = _begin(
+            category,
+            name if isinstance(name, str) else name(args, kwargs),
+            None if describe is None else describe(args, kwargs),
+        )
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _end(span)
+    return traced
+
+
+def _patch(owner: Any, attr: str, replacement: Any):
+    _patched.append((owner, attr, owner.__dict__[attr]))
+    setattr(owner, attr, replacement)
+
+
+def _subclasses(cls: type) -> List[type]:
+    res = [cls]
+    for sub in cls.__subclasses__():
+        res.extend(x for x in _subclasses(sub) if x not in res)
+    return res
+
+
+def _install():
+    call = embedded_q.EmbeddedQ.__dict__['__call__']
+    traced_call = _traced(call, 'q', lambda a, kw: _query_text(a[1]), _query_args)
+    _patch(embedded_q.EmbeddedQ, '__call__', traced_call)
+    if embedded_q.EmbeddedQ.__dict__.get('_call') is call:
+        _patch(embedded_q.EmbeddedQ, '_call', traced_call)
+    _patch(embedded_q, '_keval', _traced(embedded_q._keval, 'execute', 'execute'))
+    _patch(embedded_q, '_keval_batch', _traced(embedded_q._keval_batch, 'execute', 'batch'))
+    # Operators on K objects call q primitives directly rather than through `EmbeddedQ.__call__`
+    _patch(wrappers, '_primitive', _traced(wrappers._primitive, 'execute', lambda a, kw: a[0]))
+    _patch(embedded_q, 'factory', _traced(embedded_q.factory, 'wrap', 'wrap'))
+    _patch(wrappers, 'toq', _traced(wrappers.toq, 'toq', lambda a, kw: _describe(a[0])))
+    for cls in _subclasses(ipc.QConnection):
+        call = cls.__dict__.get('__call__')
+        if call is not None and not getattr(call, '__isabstractmethod__', False):
+            _patch(cls, '__call__', _traced(cls.__dict__['__call__'], 'ipc',
+                                            lambda a, kw: _query_text(a[1]), _query_args))
+    _patch(ipc.QConnection, '_send', _traced(ipc.QConnection._send, 'send', 'send'))
+    _patch(ipc.QConnection, '_recv', _traced(ipc.QConnection._recv, 'receive', 'receive'))
+    for cls in _subclasses(wrappers.K):
+        for attr in _conversions:
+            # Conversions defined as properties, such as those of compositions, are not traced
+            if isinstance(cls.__dict__.get(attr), FunctionType):
+                _patch(cls, attr, _traced(cls.__dict__[attr], 'convert',
+                                          f'{cls.__name__}.{attr}'))
+
+
+def _uninstall():
+    while _patched:
+        owner, attr, original = _patched.pop()
+        setattr(owner, attr, original)
+
+
+class Profile:
+    """Records a [`Span`][pykx.profiler.Span] for each call to q made from Python and the
+    operations within it.
+
+    Calls to embedded q are split into converting their arguments to q (`toq`), running the query
+    (`execute`) and wrapping the result (`wrap`), and calls over IPC into sending the query
+    (`send`) and receiving the result (`receive`). The conversion of results back to Python
+    through methods such as `py`, `np` and `pd` are recorded as `convert` spans, and operators
+    on `pykx.K` objects such as `a + b` as `execute` spans named after the operator. The spans
+    of each call record the time spent in each of these operations.
+
+    Use [`profile`][pykx.profiler.profile] to create a profile which records within a `with`
+    block.
+
+    Attributes:
+        spans: The spans recorded, in the order they started.
+    """
+    def __init__(self):
+        self.spans = []
+        self._origin = None
+
+    def __repr__(self):
+        return f'pykx.profiler.Profile(spans={len(self.spans)})'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def recording(self) -> bool:
+        """Whether spans are being recorded."""
+        return self in _active
+
+    def start(self):
+        """Start recording spans, continuing any recorded previously."""
+        with _lock:
+            if self in _active:
+                raise PyKXException('Profile is already recording')
+            if not _active:
+                _install()
+            if self._origin is None:
+                self._origin = perf_counter_ns()
+            _active.append(self)
+
+    def stop(self):
+        """Stop recording spans."""
+        with _lock:
+            if self in _active:
+                _active.remove(self)
+                if not _active:
+                    _uninstall()
+
+    def totals(self) -> Dict[str, float]:
+        """The total time in seconds spent in each category of span, excluding time spent in
+        the spans within them, such as the time spent converting arguments within a call."""
+        res = {}
+        for span in self.spans:
+            res[span.category] = res.get(span.category, 0) + span.self_time / 1e9
+        return res
+
+    def chrome_trace(self) -> dict:
+        """The recorded spans as a Chrome trace, which can be viewed using Perfetto or
+        `chrome://tracing`.
+
+        The arguments of each span include its self time, and the time spent in each category
+        of span directly within it, in microseconds.
+        """
+        pid = os.getpid()
+        origin = self._origin or 0
+        events = []
+        for span in self.spans:
+            if not span.end:
+                continue
+            args = dict(span.args)
+            args['self_us'] = span.self_time / 1e3
+            args.update({f'{c}_us': t / 1e3 for c, t in span.children.items()})
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': (span.start - origin) / 1e3,
+                'dur': span.duration / 1e3,
+                'pid': pid,
+                'tid': span.thread,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: Union[str, os.PathLike]):
+        """Write the recorded spans to a file as a Chrome trace."""
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def create_stats(self):
+        """Summarize the recorded spans into `self.stats` in the format used by `pstats`.
+
+        Each distinct query and operation is reported as a function, so the profile can be
+        loaded using `pstats.Stats(profile)`.
+        """
+        stats = {}
+        for span in self.spans:
+            if not span.end:
+                continue
+            key = span.key
+            cc, nc, tt, ct, callers = stats.get(key, (0, 0, 0.0, 0.0, {}))
+            # As with `cProfile`, the cumulative time of recursive calls is counted once
+            parent, recursive = span.parent, False
+            while parent is not None and not recursive:
+                recursive = parent.key == key
+                parent = parent.parent
+            cumulative = 0.0 if recursive else span.duration / 1e9
+            stats[key] = (cc + (not recursive), nc + 1, tt + span.self_time / 1e9,
+                          ct + cumulative, callers)
+            if span.parent is not None:
+                c = callers.get(span.parent.key, (0, 0, 0.0, 0.0))
+                callers[span.parent.key] = (c[0] + 1, c[1] + (not recursive),
+                                            c[2] + span.self_time / 1e9, c[3] + cumulative)
+        self.stats = stats
+
+    def print_stats(self, sort: Union[str, int] = 'cumulative'):
+        """Print a summary of the recorded spans, as for `cProfile.Profile.print_stats`."""
+        import pstats
+        pstats.Stats(self).strip_dirs().sort_stats(sort).print_stats()
+
+    def dump_stats(self, path: Union[str, os.PathLike]):
+        """Write a summary of the recorded spans to a file which can be loaded by `pstats` and
+        tools such as SnakeViz."""
+        import pstats
+        pstats.Stats(self).dump_stats(path)
+
+
+def profile() -> Profile:
+    """Trace where time is spent in calls to q made from Python within a `with` block.
+
+    While a profile is recording, each call to q made through embedded q or an IPC connection
+    is recorded along with the conversion of its arguments to q, its execution and the
+    conversion of its result back to Python. Tracing can also be enabled for a whole process
+    by setting the `PYKX_TRACE` configuration option to the file the trace is written to when
+    Python exits.
+
+    Returns:
+        A [`Profile`][pykx.profiler.Profile] which records while the `with` block runs.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> with kx.profile() as prof:
+    ...     kx.q('{x+y}', [1, 2, 3], 10).py()
+    [11, 12, 13]
+    >>> prof.spans[0]
+    pykx.profiler.Span('q', '{x+y}', duration=0.000071)
+    >>> prof.totals()
+    {'q': 9e-06, 'toq': 2.1e-05, 'execute': 8e-06, 'wrap': 3e-06, 'convert': 3e-05}
+    >>> prof.write_chrome_trace('trace.json')
+    >>> prof.print_stats()
+    ```
+    """
+    return Profile()
+
+
+def _trace_to_file(path: str):
+    # Records spans from when PyKX is imported, writing them to `path` when Python exits
+    prof = Profile()
+    prof.start()
+
+    def write():
+        prof.stop()
+        if os.path.splitext(path)[1] in ('.prof', '.pstats'):
+            prof.dump_stats(path)
+        else:
+            prof.write_chrome_trace(path)
+
+    atexit.register(write)
+    return prof
@@ -1,17 +1,15 @@
 """
 _This page documents the API for generation and management of remote Python function execution._
 """
+import importlib.util
 import inspect
 from typing import Union
 
 from .ipc import SyncQConnection
 
 
-try:
-    import dill
-    import_success = True
-except BaseException:
-    import_success = False
+# Only checked for here as importing dill is slow, it is imported when a remote function is called
+import_success = importlib.util.find_spec('dill') is not None
 
 
 __all__ = [
@@ -218,6 +216,7 @@ def function(remote_session: session, *args) -> None:
                 raise Exception("Supplied remote_session instance must "
                                 "be a kx.remote.session object")
             try:
+                import dill
                 src = dill.source.getsource(_function)
             except BaseException:
                 src = inspect.getsource(_function)
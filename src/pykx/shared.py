@@ -0,0 +1,264 @@
+"""
+_This page documents the API for sharing q tables between processes without copying them._
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Dict, Tuple, Union
+import uuid
+import weakref
+
+import numpy as np
+
+from . import _wrappers
+from . import wrappers as k
+from .config import licensed
+
+
+__all__ = [
+    'SharedTable',
+    'attach',
+    'share',
+]
+
+
+def _init(_q):
+    global q
+    q = _q
+
+
+# Imported on first use after `import pykx` has created the embedded q instance
+from .embedded_q import q as _embedded_q # noqa: E402
+_init(_embedded_q)
+
+
+def __dir__():
+    return __all__
+
+
+# The Numpy types which view the raw data of q vectors, as returned by `.np(raw=True)`
+_raw_dtypes = {
+    1: np.bool_, 2: np.complex128, 4: np.uint8, 5: np.int16, 6: np.int32, 7: np.int64,
+    8: np.float32, 9: np.float64, 10: '|S1', 12: np.int64, 13: np.int32, 14: np.int32,
+    15: np.float64, 16: np.int64, 17: np.int32, 18: np.int32, 19: np.int32,
+}
+
+
+def _shared_directory() -> str:
+    # /dev/shm is the tmpfs which backs POSIX shared memory, so files created in it are never
+    # written to disk
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+def _remove(path: str, pid: int):
+    # Forked children inherit the finalizer, so only the process which shared the table removes it
+    if os.getpid() == pid:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _write_column(path: str, column: k.K) -> bool:
+    # Vectors with inline data are written in the layout of a q vector file, a 16 byte header
+    # followed by the data, which q memory maps when loaded with `get`. Other columns are written
+    # using q serialization. Returns whether the column was serialized.
+    data = _wrappers.vector_buffer(column) if isinstance(column, k.Vector) else None
+    with open(path, 'wb') as f:
+        if data is None:
+            f.write(_wrappers.k_pickle(column))
+            return True
+        # Attributes other than sorted are backed by index structures which are not written
+        attr = 1 if _wrappers.k_u(column) == 1 else 0
+        f.write(bytes((0xfe, 0x20, _wrappers.k_t(column), attr, 0, 0, 0, 0)))
+        f.write(len(column).to_bytes(8, 'little'))
+        f.write(data)
+    return False
+
+
+def _table_columns(table: Union[k.Table, k.KeyedTable]) -> Tuple[list, list]:
+    names = table._keys.py()
+    values = table._values
+    return names, [values._unlicensed_getitem(i) for i in range(len(values))]
+
+
+class SharedTable:
+    """A handle to a table placed in shared memory by [`share`][pykx.shared.share].
+
+    The handle is small and can be pickled, so it can be passed to worker processes which call
+    [`attach`][pykx.shared.attach] to access the table. The shared memory is owned by the handle
+    returned by `share`, and is removed when that handle is closed or garbage collected, or when
+    the owning process exits. Handles unpickled in other processes never remove it.
+
+    Attributes:
+        path: The directory holding a file for each column of the table.
+        columns: A tuple of `(name, q type number, serialized)` for each column.
+        length: The number of rows in the table.
+        keys: The number of key columns, which is nonzero for a keyed table.
+    """
+    def __init__(self, path: str, columns: tuple, length: int, keys: int = 0, *, _owner=None):
+        self.path = path
+        self.columns = columns
+        self.length = length
+        self.keys = keys
+        self._finalizer = None if _owner is None else weakref.finalize(self, _remove, path, _owner)
+
+    def __reduce__(self):
+        return (SharedTable, (self.path, self.columns, self.length, self.keys))
+
+    def __repr__(self):
+        return (f'pykx.shared.SharedTable({self.path!r}, columns={[c[0] for c in self.columns]}, '
+                f'length={self.length})')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def owner(self) -> bool:
+        """Whether this handle owns the shared memory and will remove it when closed."""
+        return self._finalizer is not None and self._finalizer.alive
+
+    def close(self):
+        """Remove the shared memory if this handle owns it.
+
+        Processes which have already attached the table as a `pykx.Table` or Numpy arrays can
+        continue to use it, as the memory is only released once it is no longer mapped.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def share(table: Union[k.Table, k.KeyedTable]) -> SharedTable:
+    """Place a table in shared memory so that other processes can attach it without copying.
+
+    Each column is written to a file on the tmpfs which backs POSIX shared memory (`/dev/shm`),
+    falling back to the temporary directory on systems without one. Vectors such as numeric and
+    temporal columns are written in the layout q uses for vector files, so they can be memory
+    mapped, while other columns such as symbols and nested columns are written using q
+    serialization.
+
+    Parameters:
+        table: The in-memory table or keyed table to share.
+
+    Returns:
+        A [`SharedTable`][pykx.shared.SharedTable] handle which owns the shared memory, and can be
+            pickled and passed to other processes.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> from multiprocessing import Pool
+    >>> def total(handle):
+    ...     return kx.shared.attach(handle)['x'].sum().py()
+    >>> table = kx.q('([] x: til 1000000; y: 1000000?`a`b`c)')
+    >>> with kx.shared.share(table) as handle, Pool(4) as pool:
+    ...     pool.map(total, [handle] * 4)
+    [499999500000, 499999500000, 499999500000, 499999500000]
+    ```
+    """
+    keys = 0
+    if isinstance(table, k.KeyedTable):
+        keys = len(table._keys._keys)
+        key_names, key_columns = _table_columns(table._keys)
+        names, columns = _table_columns(table._values)
+        names, columns = key_names + names, key_columns + columns
+    elif isinstance(table, k.Table) and table._values is not None:
+        names, columns = _table_columns(table)
+    else:
+        raise TypeError(f'Only in-memory tables and keyed tables can be shared, not {type(table)}')
+    path = os.path.join(_shared_directory(), f'pykx_shared_{uuid.uuid4().hex}')
+    os.mkdir(path)
+    try:
+        layout = tuple(
+            (name, _wrappers.k_t(column), _write_column(os.path.join(path, str(i)), column))
+            for i, (name, column) in enumerate(zip(names, columns))
+        )
+    except BaseException:
+        shutil.rmtree(path, ignore_errors=True)
+        raise
+    return SharedTable(path, layout, len(table), keys, _owner=os.getpid())
+
+
+def _attach_numpy(path: str, t: int, serialized: bool, length: int) -> np.ndarray:
+    if serialized:
+        res = _wrappers.k_unpickle(np.fromfile(path, dtype=np.uint8)).np()
+        res.flags.writeable = False
+        return res
+    if length == 0:
+        res = np.empty(0, dtype=_raw_dtypes[t])
+        res.flags.writeable = False
+        return res
+    return np.memmap(path, dtype=_raw_dtypes[t], mode='r', offset=16, shape=(length,))
+
+
+def _attach_q(path: str, t: int, serialized: bool) -> k.K:
+    if serialized:
+        return _wrappers.k_unpickle(np.fromfile(path, dtype=np.uint8))
+    if licensed:
+        return q('{get hsym x}', path)
+    with open(path, 'rb') as f:
+        attr = f.read(16)[3]
+        return _wrappers.vector_from_buffer(t, attr, f.read())
+
+
+def attach(
+    handle: SharedTable,
+    *,
+    format: str = 'q',
+) -> Union[k.Table, k.KeyedTable, Dict[str, np.ndarray]]:
+    """Access a table placed in shared memory by [`share`][pykx.shared.share].
+
+    Parameters:
+        handle: The handle returned by `share`, which may have been pickled and passed from
+            another process.
+        format: Either `'q'` to return a `pykx.Table` or `pykx.KeyedTable`, or `'numpy'` to
+            return a dictionary of read-only Numpy arrays keyed by column name.
+
+    Returns:
+        The shared table. In licensed mode, vector columns of a `pykx.Table` are memory mapped
+            by q rather than copied. The Numpy arrays for vector columns are read-only views of
+            the shared memory holding the raw q representation of the data, as returned by
+            `.np(raw=True)`. Serialized columns, such as symbol columns, are deserialized into
+            the memory of the attaching process, as are all columns of a `pykx.Table` in
+            unlicensed mode.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> handle = kx.shared.share(kx.q('([] x: 1 2 3; y: `a`b`c)'))
+    >>> kx.shared.attach(handle)
+    pykx.Table(pykx.q('
+    x y
+    ---
+    1 a
+    2 b
+    3 c
+    '))
+    >>> kx.shared.attach(handle, format='numpy')['x']
+    memmap([1, 2, 3])
+    ```
+    """
+    files = [(os.path.join(handle.path, str(i)), t, serialized)
+             for i, (_, t, serialized) in enumerate(handle.columns)]
+    names = [c[0] for c in handle.columns]
+    if format == 'numpy':
+        return {n: _attach_numpy(*f, handle.length) for n, f in zip(names, files)}
+    if format != 'q':
+        raise ValueError(f"Invalid format {format!r}, expected one of 'q' or 'numpy'")
+    columns = [_attach_q(*f) for f in files]
+
+    def table(names, columns):
+        return _wrappers.dictionary_from_parts(
+            k.toq(np.array(names, dtype='U')), _wrappers.list_from_items(columns), True)
+
+    if handle.keys:
+        return _wrappers.dictionary_from_parts(
+            table(names[:handle.keys], columns[:handle.keys]),
+            table(names[handle.keys:], columns[handle.keys:]),
+        )
+    return table(names, columns)
@@ -14,7 +14,6 @@ import os
 import time
 from typing import Callable, Union
 
-import dill
 
 __all__ = [
     'TICK',
@@ -30,10 +29,21 @@ def _init(_q):
     q = _q
 
 
+# Imported on first use after `import pykx` has created the embedded q instance
+from .embedded_q import q as _embedded_q # noqa: E402
+_init(_embedded_q)
+
+
 def __dir__():
     return __all__
 
 
+def _getsource(function: Callable) -> str:
+    # dill is slow to import, so is only imported when a function is first sent to a process
+    import dill
+    return dill.source.getsource(function)
+
+
 class STREAMING:
     """
     The `STREAMING` class acts as a base parent class for the TICK, RTP, HDB and GATEWAY
@@ -251,7 +261,7 @@ class STREAMING:
             self._connection('set', api_name, function)
         else:
             try:
-                src = dill.source.getsource(function)
+                src = _getsource(function)
             except BaseException:
                 src = inspect.getsource(function)
             self._connection('{.pykx.pyexec x;z set .pykx.get[y;<]}',
@@ -950,7 +960,7 @@ class RTP(STREAMING):
             self._connection('set', '.tick.RTPPreProc', function)
             return None
         try:
-            src = dill.source.getsource(function)
+            src = _getsource(function)
         except BaseException:
             src = inspect.getsource(function)
         self._connection('{.pykx.pyexec x;z set .pykx.get[y;<]}',
@@ -1017,7 +1027,7 @@ class RTP(STREAMING):
             self._connection('set', '.tick.RTPPostProc', function)
             return None
         try:
-            src = dill.source.getsource(function)
+            src = _getsource(function)
         except BaseException:
             src = inspect.getsource(function)
         self._connection('{.pykx.pyexec x;z set .pykx.get[y;<]}',
@@ -1533,7 +1543,7 @@ class GATEWAY(STREAMING):
             self._connection('set', '.z.pw', function)
             return None
         try:
-            src = dill.source.getsource(function)
+            src = _getsource(function)
         except BaseException:
             src = inspect.getsource(function)
         self._connection('{.pykx.pyexec x;z set .pykx.get[y;<]}',
@@ -93,13 +93,14 @@ import pytz
 import sys
 import re
 from types import ModuleType
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from uuid import UUID, uuid4 as random_uuid
 from warnings import warn
 
 import numpy as np
 import pandas as pd
 
+from . import _wrappers
 from . import wrappers as k
 from ._pyarrow import pyarrow as pa
 from .cast import *
@@ -115,6 +116,8 @@ _torch_unavailable = importlib.util.find_spec('torch') is None
 
 
 __all__ = [
+    'adopt',
+    'compile',
     'from_arrow',
     'from_bytes',
     'from_callable',
@@ -138,6 +141,7 @@ __all__ = [
     'from_pandas_index',
     'from_pandas_series',
     'from_pathlib_path',
+    'from_polars',
     'from_range',
     'from_slice',
     'from_str',
@@ -893,6 +897,59 @@ def from_uuid_UUID(x: UUID,
     return factory(<uintptr_t>core.ku(guid), False)
 
 
+_homogeneous_list_types = frozenset((bool, int, float, str, datetime.datetime, UUID))
+
+
+def _from_homogeneous_list(list x, bint strings_as_char):
+    # Fast path for lists whose items all share one type, producing the same typed vector as
+    # converting each item and collapsing the resulting general list, without the intermediate
+    # atoms. Returns `None` if the generic conversion must be used.
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(x)
+    cdef core.K kx
+    cdef bytes as_bytes
+    if n == 0:
+        return None
+    ty = type(x[0])
+    if ty not in _homogeneous_list_types or (ty is str and strings_as_char):
+        return None
+    for i in range(1, n):
+        if type(x[i]) is not ty:
+            return None
+    if ty is datetime.datetime:
+        if any(item.tzinfo is not None for item in x):
+            return None
+        try:
+            arr = np.array(x, dtype='datetime64[ns]')
+        except (OverflowError, ValueError):
+            return None
+        return from_numpy_ndarray(arr, ktype=k.TimestampVector)
+    if ty is UUID:
+        return from_numpy_ndarray(np.array(x, dtype=object), ktype=k.GUIDVector)
+    if ty is int:
+        kx = core.ktn(7, n)
+        try:
+            for i in range(n):
+                (<long long*>kx.G0)[i] = x[i]
+        except OverflowError:
+            core.r0(kx)
+            return None
+    elif ty is float:
+        kx = core.ktn(9, n)
+        for i in range(n):
+            (<double*>kx.G0)[i] = x[i]
+    elif ty is bool:
+        kx = core.ktn(1, n)
+        for i in range(n):
+            (<unsigned char*>kx.G0)[i] = x[i]
+    else:
+        kx = core.ktn(11, n)
+        for i in range(n):
+            as_bytes = x[i].encode('utf-8')
+            (<char**>kx.G0)[i] = core.sn(as_bytes, len(as_bytes))
+    return factory(<uintptr_t>kx, False)
+
+
 def from_list(x: list,
               ktype: Optional[KType] = None,
               *,
@@ -961,6 +1018,10 @@ def from_list(x: list,
             return from_numpy_ndarray(np.array(x, dtype=np_type), ktype, cast=cast, handle_nulls=handle_nulls, strings_as_char=strings_as_char)
         except TypeError as ex:
             raise _conversion_TypeError(x, 'Python list', ktype) from ex
+    if licensed and ktype is None and type(x) is list:
+        res = _from_homogeneous_list(x, strings_as_char)
+        if res is not None:
+            return res
     cdef core.K kx = core.ktn(0, len(x))
     for i, item in enumerate(x):
         # No good way to specify the ktype for nested types
@@ -1121,7 +1182,28 @@ def _listify(x: np.ndarray):
     """Convert all arrays except the lowest level into lists."""
     if len(x.shape) > 1:
         return [_listify(y) for y in list(x)]
-    return np.array(x) if k_allocator else x
+    return x
+
+
+# Set by `adopt` to shift the epoch of temporal arrays allocated by the PyKX allocator in place
+_inplace_epoch = False
+
+
+def _k_allocated(x: np.ndarray) -> bool:
+    # Whether the data of `x` is exactly a buffer allocated by the PyKX Numpy allocator, and so is
+    # preceded by the header of the q vector which owns the buffer. Views which start at the buffer
+    # but cover only part of it, such as the first column of a 2-D pandas block, are excluded as
+    # the header describes the whole buffer.
+    if not k_allocator or not x.flags.c_contiguous:
+        return False
+    base = x
+    while not base.flags.owndata:
+        base = base.base
+        if not isinstance(base, np.ndarray):
+            return False
+    return np.core.multiarray.get_handler_name(base) == 'pykx_allocator' \
+        and base.__array_interface__['data'][0] == x.__array_interface__['data'][0] \
+        and base.nbytes == x.nbytes
 
 
 _dtype_to_ktype = {
@@ -1203,7 +1285,9 @@ def from_numpy_ndarray(x: np.ndarray,
     `pykx.Vector._np_dtype` property of the type you want to create.
     Note that when these 0 copy conversions are done both the numpy array and the resulting
     `pykx.Vector` refer to the same area of memory and changes made to one will be present in the
-    other object.
+    other object. Arrays whose data does not start a buffer allocated by the PyKX allocator, such as
+    slices or the columns of a multi-column pandas block, are copied instead. Use
+    [`adopt`][pykx.toq.adopt] to see which columns of a `pandas.DataFrame` were copied.
 
     Because q only supports 1-dimensional arrays (vectors), Numpy arrays with more than 1 dimension
     will have all every level converted into a list of lists except for the lowest, for which each
@@ -1450,6 +1534,8 @@ def from_numpy_ndarray(x: np.ndarray,
                         x = (x if mul is None else (x*mul)) - offset
                     else:
                         x[mask] = (x[mask] if mul is None else (x[mask]*mul)) - offset
+                elif mul is None and _inplace_epoch and _k_allocated(x):
+                    x -= offset
                 else:
                     x = (x if mul is None else (x*mul)) - offset
             else:
@@ -1459,7 +1545,7 @@ def from_numpy_ndarray(x: np.ndarray,
                 core.r0(kx)
                 raise TypeError('Item size mismatch when converting Numpy ndarray to q: q item size '
                                 f'({itemsize}) != Numpy item size ({x.itemsize})')
-            if not k_allocator:
+            if not _k_allocated(x):
                 kx = core.ktn(ktype.t, n)
                 data = x.__array_interface__['data'][0]
                 memcpy(<void *> kx.G0, <void *> data, n * itemsize)
@@ -1510,7 +1596,7 @@ def from_numpy_ndarray(x: np.ndarray,
             core.r0(kx)
             raise TypeError('Item size mismatch when converting Numpy ndarray to q: q item size '
                             f'({itemsize}) != Numpy item size ({x.itemsize})')
-        if not k_allocator:
+        if not _k_allocated(x):
             kx = core.ktn(ktype.t, n)
             data = x.__array_interface__['data'][0]
             memcpy(<void *> kx.G0, <void *> data, n * itemsize)
@@ -1568,20 +1654,16 @@ def _to_numpy_or_categorical(x, col_name=None, df=None):
                     dtype = np.timedelta64()
                 elif x.dtype.kind == 'M':
                     dtype =  np.datetime64()
-                if k_allocator:
-                    return np.array(x.to_numpy(copy=False, na_value=_size_to_nan[x.dtype.itemsize], dtype=dtype))
                 return x.to_numpy(copy=False, na_value=_size_to_nan[x.dtype.itemsize], dtype=dtype)
             elif x.dtype.kind == 'f' and hasattr(x, 'isnull') and x.isnull().values.any():
                 float_class = _float_size_to_class[x.dtype.itemsize]
-                if k_allocator:
-                    return np.array(x.to_numpy(copy=False, dtype=float_class))
                 return x.to_numpy(copy=False, dtype=float_class)
             else:
-                return np.array(x) if k_allocator else x.to_numpy(copy=False)
+                return x.to_numpy(copy=False)
         else:
-            return np.array(x.values) if k_allocator else x.values
+            return x.values
     else:
-        return np.array(x) if k_allocator else np.array(x, copy=False)
+        return np.asarray(x)
 
 
 def from_pandas_dataframe(x: pd.DataFrame,
@@ -1682,6 +1764,397 @@ def from_pandas_dataframe(x: pd.DataFrame,
     return factory(<uintptr_t>kx, False).astype(convert_dict)
 
 
+def _adopt_copy_reason(x) -> str:
+    # Best explanation of why the data of a column could not be shared with q
+    if not isinstance(x, np.ndarray):
+        return f'{type(x).__name__} data is converted through an intermediate array'
+    if not x.flags.c_contiguous:
+        return 'array is not C-contiguous'
+    if not _k_allocated(x):
+        return ('array data was not allocated by the PyKX allocator, or is a view into a larger '
+                'allocation such as a multi-column pandas block')
+    if x.dtype.kind == 'M' and x.dtype != np.dtype('datetime64[ns]'):
+        return f'{x.dtype} data must be converted to nanoseconds'
+    if x.dtype.kind == 'M' and not _inplace_epoch:
+        return 'the epoch offset must be applied, use inplace_epoch=True to apply it in place'
+    return f'{x.dtype} data must be converted to the q type'
+
+
+def adopt(x: Union[pd.DataFrame, np.ndarray],
+          *,
+          inplace_epoch: bool = False,
+) -> Tuple[k.K, Dict[Any, str]]:
+    """Converts a `pandas.DataFrame` or `numpy.ndarray` into q, sharing memory where possible.
+
+    When the PyKX Numpy allocator is enabled with the environment variable `PYKX_ALLOCATOR`, arrays
+    whose data was allocated by it are preceded by a q vector header, so they can be adopted by q
+    without copying. This applies to `numpy.ndarray` objects and the columns of a
+    `pandas.DataFrame` backed by such arrays, including boolean, numeric, `timedelta64[ns]` and
+    `datetime64[ns]` data. Columns which cannot be shared, such as those which are views into a
+    multi-column pandas block or are not C-contiguous, are copied as they would be by
+    [`from_pandas_dataframe`][pykx.toq.from_pandas_dataframe].
+
+    Warning: Adopted data is shared between Python and q.
+        Changes made to the Numpy array or DataFrame column are visible in the resulting q object,
+        and vice versa. With `inplace_epoch=True`, the data of `datetime64[ns]` arrays is shifted
+        to the q epoch in place, so the Numpy array no longer holds the original timestamps.
+
+    Parameters:
+        x: The `pandas.DataFrame` or `numpy.ndarray` to convert.
+        inplace_epoch: Whether to adjust the data of `datetime64[ns]` arrays from the Unix epoch
+            to the q epoch in place, allowing it to be adopted by q rather than copied.
+
+    Returns:
+        A tuple of the converted q object and a dictionary mapping the name of each column which
+        was copied rather than adopted to the reason it was copied. For a `numpy.ndarray` the key
+        is `None`. For a `pandas.DataFrame` with an index which is converted to the keys of a
+        `pykx.KeyedTable`, only the value columns are reported.
+
+    Raises:
+        PyKXException: The PyKX Numpy allocator is not enabled.
+
+    Examples:
+
+    ```python
+    >>> import os
+    >>> os.environ['PYKX_ALLOCATOR'] = 'True'
+    >>> import numpy as np, pandas as pd, pykx as kx
+    >>> df = pd.DataFrame({'a': np.arange(3), 'b': np.array([1.5, 2.5, 3.5])}, copy=False)
+    >>> tab, copied = kx.toq.adopt(df)
+    >>> copied
+    {}
+    ```
+    """
+    if not k_allocator:
+        raise PyKXException('Adopting Numpy data requires the PyKX Numpy allocator, enabled with '
+                            'the environment variable PYKX_ALLOCATOR')
+    global _inplace_epoch
+    _inplace_epoch = inplace_epoch
+    try:
+        if isinstance(x, pd.DataFrame):
+            res = from_pandas_dataframe(x)
+            table = res._values if isinstance(res, k.KeyedTable) else res
+            vectors = dict(zip(table._keys.py(), table._values))
+            columns = {c: x[c].values for c in x.columns}
+        elif isinstance(x, np.ndarray):
+            res = from_numpy_ndarray(x)
+            vectors = {None: res}
+            columns = {None: x}
+        else:
+            raise TypeError(f'Only pandas.DataFrame and numpy.ndarray can be adopted, not {type(x)}')
+        copied = {}
+        for c, values in columns.items():
+            vec = vectors[c]
+            if isinstance(values, np.ndarray) and isinstance(vec, k.Vector) \
+                    and <uintptr_t><void*>_k(vec).G0 == values.__array_interface__['data'][0]:
+                continue
+            copied[c] = _adopt_copy_reason(values)
+        return res, copied
+    finally:
+        _inplace_epoch = False
+
+
+def _table_from_columns(names, columns):
+    # Builds a table from a symbol vector of column names and a list of equal length vectors
+    cdef core.K values = core.ktn(0, len(columns))
+    cdef Py_ssize_t i
+    for i in range(len(columns)):
+        (<core.K*>values.G0)[i] = core.r1(_k(columns[i]))
+    cdef core.K kx = core.xT(core.xD(core.r1(_k(names)), values))
+    if kx == NULL:
+        raise PyKXException('Failed to create table from columns')
+    return factory(<uintptr_t>kx, False)
+
+
+def _schema_columns(schema):
+    # Resolves a schema dictionary or table into a list of (name, vector type) pairs, and the key
+    # columns of a keyed table schema
+    key = None
+    if isinstance(schema, (k.Table, k.KeyedTable)):
+        tables = (schema,)
+        if isinstance(schema, k.KeyedTable):
+            key = schema._keys._keys.py()
+            tables = (schema._keys, schema._values)
+        schema = {str(c): type(v) for t in tables for c, v in zip(t._keys.py(), t._values)}
+    if not isinstance(schema, dict):
+        raise TypeError(f'Unsupported schema type {type(schema)}, expected a dict or pykx.Table')
+    columns = []
+    for name, ktype in schema.items():
+        ktype = _resolve_k_type(ktype)
+        ktype = k.atom_to_vector.get(ktype, ktype)
+        if ktype not in supported_ndarray_k_types:
+            raise TypeError(f'Unsupported type {ktype!r} for column {name!r}')
+        columns.append((str(name), ktype))
+    return columns, key
+
+
+class CompiledConverter:
+    """A reusable converter from `pandas.DataFrame` objects sharing one schema to q tables.
+
+    Instances are created using [`compile`][pykx.toq.compile]. Column types are resolved once when
+    the converter is created, so each call skips type inference, the check of whether the index
+    should be used as keys, and the dispatch performed by `pykx.toq` for every column.
+    """
+    def __init__(self, columns, key, cast, handle_nulls, strings_as_char):
+        self.columns = tuple(columns)
+        self.key = tuple(key)
+        self._value_columns = tuple((c, t) for c, t in self.columns if c not in self.key)
+        self._key_columns = tuple((c, t) for c, t in self.columns if c in self.key)
+        self._value_names = from_numpy_ndarray(
+            np.array([c for c, _ in self._value_columns], dtype='U'))
+        self._key_names = from_numpy_ndarray(
+            np.array([c for c, _ in self._key_columns], dtype='U'))
+        self._value_set = frozenset(c for c, _ in self._value_columns)
+        self._kwargs = {'cast': cast, 'handle_nulls': handle_nulls,
+                        'strings_as_char': strings_as_char}
+
+    def __repr__(self):
+        cols = ', '.join(f'{c!r}: pykx.{t.__name__}' for c, t in self.columns)
+        return f'pykx.toq.CompiledConverter({{{cols}}}, key={list(self.key)!r})'
+
+    def _convert_column(self, x, name, ktype):
+        arr = _to_numpy_or_categorical(x, name)
+        if isinstance(arr, k.K):
+            return arr
+        return from_numpy_ndarray(arr, ktype=ktype, **self._kwargs)
+
+    def __call__(self, x: pd.DataFrame) -> Union[k.Table, k.KeyedTable]:
+        """Convert a `pandas.DataFrame` matching the compiled schema into a q table.
+
+        Parameters:
+            x: The `pandas.DataFrame` to convert. Its columns must match the non-key columns of the
+                schema. For a keyed schema the key columns are taken from the index of `x`.
+
+        Returns:
+            A `pykx.Table`, or a `pykx.KeyedTable` when the schema defines key columns.
+        """
+        if not isinstance(x, pd.DataFrame):
+            raise TypeError(f'Compiled converters only support pandas.DataFrame, not {type(x)}')
+        if len(x.columns) != len(self._value_columns) or not self._value_set.issuperset(x.columns):
+            raise ValueError(f'DataFrame columns {list(x.columns)} do not match compiled '
+                             f'schema columns {[c for c, _ in self._value_columns]}')
+        values = _table_from_columns(
+            self._value_names,
+            [self._convert_column(x[c], c, t) for c, t in self._value_columns]
+        )
+        if not self.key:
+            return values
+        if list(x.index.names) != list(self.key):
+            raise ValueError(f'DataFrame index {list(x.index.names)} does not match compiled '
+                             f'schema key {list(self.key)}')
+        keys = _table_from_columns(
+            self._key_names,
+            [self._convert_column(x.index.get_level_values(c), c, t)
+             for c, t in self._key_columns]
+        )
+        cdef core.K kx = core.xD(core.r1(_k(keys)), core.r1(_k(values)))
+        if kx == NULL:
+            raise PyKXException('Failed to create keyed table from compiled conversion')
+        return factory(<uintptr_t>kx, False)
+
+
+def compile(schema: Union[dict, k.Table, k.KeyedTable],
+            *,
+            key: Optional[Union[str, list]] = None,
+            cast: bool = False,
+            handle_nulls: bool = False,
+            strings_as_char: bool = False,
+) -> CompiledConverter:
+    """Create a reusable converter from `pandas.DataFrame` objects with a fixed schema to q tables.
+
+    When many DataFrames with the same columns and types are converted, such as when publishing
+    small batches of data, resolving the conversion for each column once rather than on every
+    call reduces the per-call overhead of `pykx.toq`.
+
+    Parameters:
+        schema: A dictionary mapping column names to `pykx.K` vector or atom types (or type
+            numbers), or an empty `pykx.Table`/`pykx.KeyedTable` such as one generated by
+            [`pykx.schema.builder`][pykx.schema.builder] whose column types are used.
+        key: The column name(s) in `schema` to be treated as primary keys. Key columns are taken
+            from the index of the converted DataFrame. When `schema` is a `pykx.KeyedTable` its
+            keys are used.
+        cast: Apply a cast to the data of each column before converting it to q.
+        handle_nulls: Convert `pd.NaT` to corresponding q null values.
+        strings_as_char: Convert string columns of type `pykx.List` to lists of char vectors.
+
+    Returns:
+        A `CompiledConverter` which converts a `pandas.DataFrame` into a `pykx.Table`, or a
+            `pykx.KeyedTable` if key columns were specified.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> import pandas as pd
+    >>> convert = kx.toq.compile({'sym': kx.SymbolAtom, 'px': kx.FloatAtom, 'sz': kx.LongAtom})
+    >>> convert(pd.DataFrame({'sym': ['a', 'b'], 'px': [1.5, 2.5], 'sz': [100, 200]}))
+    pykx.Table(pykx.q('
+    sym px  sz
+    ----------
+    a   1.5 100
+    b   2.5 200
+    '))
+    ```
+    """
+    columns, schema_key = _schema_columns(schema)
+    if key is None:
+        key = [] if schema_key is None else schema_key
+    elif isinstance(key, str):
+        key = [key]
+    missing = set(key).difference(c for c, _ in columns)
+    if missing:
+        raise ValueError(f'Key columns {sorted(missing)} are not present in the schema')
+    return CompiledConverter(columns, key, cast, handle_nulls, strings_as_char)
+
+
+# Vector types inferred for columns of records from the Python types of their values
+_record_type_to_ktype = {
+    bool: k.BooleanVector,
+    int: k.LongVector,
+    float: k.FloatVector,
+    str: k.SymbolVector,
+    datetime.datetime: k.TimestampVector,
+    datetime.date: k.DateVector,
+    datetime.timedelta: k.TimespanVector,
+    UUID: k.GUIDVector,
+}
+
+
+# Vector types which `_from_records` populates directly, other types are converted per column
+_record_direct_types = frozenset((1, 2, 4, 5, 6, 7, 8, 9, 11, 12))
+
+
+def _infer_record_ktype(values):
+    types = {type(v) for v in values if v is not None}
+    if types == {int, float}:
+        return k.FloatVector
+    if len(types) == 1:
+        return _record_type_to_ktype.get(types.pop(), k.List)
+    return k.List
+
+
+cdef long long _record_timestamp(x) except? -1:
+    epoch = datetime.datetime(2000, 1, 1)
+    if x.tzinfo is not None:
+        if config.keep_local_times:
+            x = x.replace(tzinfo=None)
+        else:
+            epoch = epoch.replace(tzinfo=pytz.utc)
+    d = x - epoch
+    return 1000 * (d.microseconds + 1000000 * (d.seconds + d.days * 86400))
+
+
+cdef _set_record_value(core.K col, Py_ssize_t i, x):
+    cdef signed char t = col.t
+    cdef bytes as_bytes
+    if t == 1:
+        if x is not None and not isinstance(x, (bool, np.bool_)):
+            raise TypeError(f'Expected a boolean, not {type(x).__name__}')
+        (<unsigned char*>col.G0)[i] = 0 if x is None else x
+    elif t == 4:
+        (<unsigned char*>col.G0)[i] = 0 if x is None else x
+    elif t == 5:
+        (<short*>col.G0)[i] = NULL_INT16 if x is None else x
+    elif t == 6:
+        (<int*>col.G0)[i] = NULL_INT32 if x is None else x
+    elif t == 7:
+        (<long long*>col.G0)[i] = NULL_INT64 if x is None else x
+    elif t == 8:
+        (<float*>col.G0)[i] = math.nan if x is None else x
+    elif t == 9:
+        (<double*>col.G0)[i] = math.nan if x is None else x
+    elif t == 11:
+        if x is not None and not isinstance(x, str):
+            raise TypeError(f'Expected a str, not {type(x).__name__}')
+        as_bytes = b'' if x is None else x.encode('utf-8')
+        (<char**>col.G0)[i] = core.sn(as_bytes, len(as_bytes))
+    elif t == 12:
+        (<long long*>col.G0)[i] = NULL_INT64 if x is None else _record_timestamp(x)
+    elif t == 2:
+        as_bytes = bytes(16) if x is None else x.bytes
+        memcpy(<void*>&(<core.U*>col.G0)[i], <char*>as_bytes, 16)
+
+
+def _from_records(records, schema=None, *, infer_rows: int = 100):
+    if not isinstance(records, (list, tuple)):
+        records = list(records)
+    cdef Py_ssize_t n = len(records)
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n_cols
+    key = None
+    first = records[0] if n else None
+    if schema is not None:
+        columns, key = _schema_columns(schema)
+        names = [c for c, _ in columns]
+    elif first is None:
+        raise ValueError('A schema must be provided to create a table from no records')
+    else:
+        sample = records[:infer_rows]
+        if isinstance(first, dict):
+            names = list(dict.fromkeys(c for row in sample for c in row))
+            sample_cols = [[row.get(c) for row in sample] for c in names]
+        else:
+            names = list(getattr(first, '_fields', ()))
+            if not names:
+                names = ['x'] + [f'x{j}' for j in range(1, len(first))]
+            # Rows of the wrong length are reported once the rows are read below
+            sample_cols = [[row[j] if j < len(row) else None for row in sample]
+                           for j in range(len(names))]
+        columns = [(str(c), _infer_record_ktype(v)) for c, v in zip(names, sample_cols)]
+        names = [c for c, _ in columns]
+    n_cols = len(columns)
+    is_dict = isinstance(first, dict)
+
+    # Columns of directly supported types are allocated once and filled in a single pass over the
+    # records, values of any other columns are gathered and converted once all rows are scanned.
+    direct = [ktype.t in _record_direct_types for _, ktype in columns]
+    cols = [factory(<uintptr_t>core.ktn(ktype.t, n), False) if direct[j] else []
+            for j, (_, ktype) in enumerate(columns)]
+    cdef core.K col_ptr
+    # Named tuples are matched to the columns by field name, and other rows by position
+    positions = list(range(n_cols))
+    row_type = None
+    for i in range(n):
+        row = records[i]
+        if not is_dict:
+            if type(row) is not row_type:
+                row_type = type(row)
+                fields = getattr(row, '_fields', None)
+                if fields is not None:
+                    missing = [c for c in names if c not in fields]
+                    if missing:
+                        raise KeyError(f'Fields {missing} not found in record {row!r}')
+                    positions = [fields.index(c) for c in names]
+                else:
+                    positions = list(range(n_cols))
+            if fields is None and len(row) != n_cols:
+                raise ValueError(f'Row {i} has {len(row)} values, but the table has {n_cols} '
+                                 'columns')
+        for j in range(n_cols):
+            x = row.get(names[j]) if is_dict else row[positions[j]]
+            if direct[j]:
+                col_ptr = _k(cols[j])
+                try:
+                    _set_record_value(col_ptr, i, x)
+                except (TypeError, ValueError, AttributeError, OverflowError) as err:
+                    raise TypeError(f'Could not convert value {x!r} in row {i} of column '
+                                    f'{names[j]!r} to {columns[j][1].__name__}') from err
+            else:
+                cols[j].append(x)
+    for j in range(n_cols):
+        if not direct[j]:
+            ktype = columns[j][1]
+            # Missing values are gathered as `None`, which must become q nulls rather than being
+            # converted as the raw value of a Numpy null such as NaT
+            cols[j] = (from_list(cols[j], ktype=k.List) if ktype is k.List
+                       else toq(cols[j], ktype=ktype, handle_nulls=True))
+    names_k = from_numpy_ndarray(np.array(names, dtype='U'))
+    res = _table_from_columns(names_k, cols)
+    if key:
+        res = q.xkey(key, res)
+    return res
+
+
 def from_pandas_series(x: pd.Series,
                        ktype: Optional[KType] = None,
                        *,
@@ -1953,8 +2426,105 @@ def from_arrow(x: Union['pa.Array', 'pa.Table'],
         raise PyArrowUnavailable
     if isinstance(x, pa.ExtensionArray):
         raise _conversion_TypeError(x, 'Arrow extension array', ktype)
+    if (isinstance(x, pa.Array) and (ktype is None or ktype is k.List)
+            and len(x) and not x.null_count):
+        res = _from_arrow_nested(x, cast=cast, handle_nulls=handle_nulls,
+                                 strings_as_char=strings_as_char)
+        if res is not None:
+            return res
     return toq(x.to_pandas(), ktype=ktype, cast=cast, handle_nulls=handle_nulls)
 
+
+def _from_arrow_nested(x, *, cast, handle_nulls, strings_as_char):
+    # Nested list and string arrays are split into a q list from their offsets and flattened
+    # values, avoiding the creation of a Pandas object column holding one array per item.
+    if isinstance(x, (pa.ListArray, pa.LargeListArray)):
+        offsets = np.asarray(x.offsets, dtype=np.int64)
+        values = x.values.slice(offsets[0], offsets[-1] - offsets[0])
+        values = from_arrow(values, cast=cast, handle_nulls=handle_nulls,
+                            strings_as_char=strings_as_char)
+        if not isinstance(values, k.Vector) or values.t not in _wrappers._k_type_itemsize:
+            return None
+        return _wrappers.list_from_offsets(values, offsets - offsets[0], values.t)
+    if strings_as_char and isinstance(x, (pa.StringArray, pa.LargeStringArray)):
+        buffers = x.buffers()
+        offset_type = np.int64 if isinstance(x, pa.LargeStringArray) else np.int32
+        offsets = np.frombuffer(buffers[1], dtype=offset_type)[x.offset:x.offset + len(x) + 1]
+        offsets = offsets.astype(np.int64)
+        if buffers[2] is None:
+            data = np.empty(0, dtype=np.uint8)
+        else:
+            data = np.frombuffer(buffers[2], dtype=np.uint8)[offsets[0]:offsets[-1]]
+        chars = from_numpy_ndarray(data, ktype=k.ByteVector)
+        return _wrappers.list_from_offsets(chars, offsets - offsets[0], k.CharVector.t)
+    return None
+
+
+def _from_polars_arrow(x):
+    # Polars categorical and enum columns are Arrow dictionary arrays, which are decoded to strings
+    # so that they are converted to symbols rather than q enumerations, and Polars times are the
+    # nanoseconds since midnight, which are converted exactly as timespans.
+    if pa.types.is_dictionary(x.type):
+        return x.cast(x.type.value_type)
+    if pa.types.is_time64(x.type):
+        return x.cast(pa.int64()).cast(pa.duration(x.type.unit))
+    return x
+
+
+def from_polars(x: Union['pl.DataFrame', 'pl.Series'],
+                ktype: Optional[KType] = None,
+                *,
+                cast: bool = False,
+                handle_nulls: bool = False,
+                strings_as_char: bool = False,
+) -> Union[k.Vector, k.Table]:
+    """Converts Polars series/dataframes into PyKX vectors/tables, respectively.
+
+    The Polars object is exported as Arrow and then converted to q using
+    [`from_arrow`][pykx.toq.from_arrow]. A `polars.Series` is converted from its Arrow array,
+    which shares the buffers of the series. A `polars.DataFrame` is converted from an Arrow table,
+    which `from_arrow` converts through Pandas, so its columns are copied. Categorical and enum
+    columns are converted to symbols, and times to timespans.
+
+    Parameters:
+        x: The `polars.Series` that will be converted into a `pykx.Vector`, or the
+            `polars.DataFrame` that will be converted into a `pykx.Table`.
+        ktype: Desired `pykx.K` subclass (or type number) for the returned value. If `None`,
+            the type is inferred from `x`.
+        cast: Unused.
+        handle_nulls: Unused.
+        strings_as_char: Whether to convert string columns to q char vectors rather than
+            symbols.
+
+    Returns:
+        An instance of `pykx.Vector` or `pykx.Table`.
+
+    Examples:
+
+    ```python
+    >>> import polars as pl
+    >>> kx.toq(pl.DataFrame({'sym': ['a', 'b'], 'px': [1.5, 2.5]}))
+    pykx.Table(pykx.q('
+    sym px
+    ------
+    a   1.5
+    b   2.5
+    '))
+    ```
+    """
+    if pa is None:
+        raise PyArrowUnavailable
+    arrow = x.to_arrow()
+    if isinstance(arrow, pa.Table):
+        arrow = pa.Table.from_arrays(
+            [_from_polars_arrow(c) for c in arrow.columns], names=arrow.column_names
+        )
+    else:
+        arrow = _from_polars_arrow(arrow)
+    return from_arrow(arrow, ktype=ktype, cast=cast, handle_nulls=handle_nulls,
+                      strings_as_char=strings_as_char)
+
+
 def from_arrow_py(x,
                ktype: Optional[KType] = None,
                *,
@@ -2923,6 +3493,8 @@ class ToqModule(ModuleType):
                 converter = from_pathlib_path
             elif x is Ellipsis:
                 converter = from_ellipsis
+            elif type(x).__module__.startswith('polars') and hasattr(x, 'to_arrow'):
+                converter = from_polars
             elif pa is not None and type(x).__module__.startswith('pyarrow') and hasattr(x, 'to_pandas'):
                 converter = from_arrow
             elif pa is not None and type(x).__module__.startswith('pyarrow') and hasattr(x, 'as_py'):
@@ -163,7 +163,7 @@ graph LR
 """
 
 from abc import ABCMeta
-from collections import abc
+from collections import abc, namedtuple
 import copy
 from datetime import datetime, timedelta
 import importlib
@@ -171,10 +171,12 @@ from inspect import signature
 import math
 from numbers import Integral, Number, Real
 import operator
+from pickle import PickleBuffer
 from uuid import UUID
 from typing import Any, Optional, Tuple, Union
 from warnings import warn
 from io import StringIO
+from itertools import count
 
 import numpy as np
 import pandas as pd
@@ -194,14 +196,32 @@ _torch_unavailable = importlib.util.find_spec('torch') is None
 if not _torch_unavailable:
     beta_features.append('PyTorch Conversions')
 
+_polars_unavailable = importlib.util.find_spec('polars') is None
+
 q_initialized = False
 
 
+# The q primitives used by the operators of `K`, which are resolved once by `_init` so that they
+# are applied directly, rather than having q evaluate the operator on every call
+_primitive_ops = ('+', '-', '*', '%', '<', '<=', '=', '>', '>=', '~', 'div', 'mod', 'neg', 'abs')
+_primitives = {}
+
+
 def _init(_q):
     global q
     global q_initialized
     q = _q
     q_initialized = True
+    if licensed:
+        _primitives.update((op, _q(op)) for op in _primitive_ops)
+
+
+def _primitive(op: str, *args):
+    try:
+        fn = _primitives[op]
+    except KeyError:
+        return q(op, *args)
+    return _wrappers.primitive_call(fn, *args)
 
 
 # nanoseconds between 1970-01-01 and 2000-01-01
@@ -291,9 +311,22 @@ class K:
     def __reduce__(self):
         return (_wrappers.k_unpickle, (_wrappers.k_pickle(self),))
 
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            res = self._reduce_out_of_band()
+            if res is not None:
+                return res
+        return self.__reduce__()
+
+    def _reduce_out_of_band(self):
+        # Returns a reduction which exposes the data of the object as `pickle.PickleBuffer`
+        # objects, allowing pickle protocol 5 to transfer them out-of-band, or `None` if the
+        # object must be pickled using q serialization
+        return None
+
     def _compare(self, other, op_str, *, failure=False):
         try:
-            r = q(op_str, self, other)
+            r = _primitive(op_str, self, other)
         except Exception as ex:
             ex_str = str(ex)
             if ex_str.startswith('length') or ex_str.startswith('type'):
@@ -303,7 +336,7 @@ class K:
             if hasattr(r, '__len__') and len(r) == 0:
                 # Handle comparisons of empty objects
                 if op_str == '=':
-                    return q('~', self, other)
+                    return _primitive('~', self, other)
                 elif op_str == '{not x=y}':
                     return q('{not x~y}', self, other)
             return r
@@ -333,40 +366,40 @@ class K:
         return self._compare(other, '>=')
 
     def __add__(self, other):
-        return q('+', self, other)
+        return _primitive('+', self, other)
 
     __radd__ = __add__
 
     def __sub__(self, other):
-        return q('-', self, other)
+        return _primitive('-', self, other)
 
     def __rsub__(self, other):
-        return q('-', other, self)
+        return _primitive('-', other, self)
 
     def __mul__(self, other):
-        return q('*', self, other)
+        return _primitive('*', self, other)
 
     __rmul__ = __mul__
 
     def __truediv__(self, other):
-        return q('%', self, other)
+        return _primitive('%', self, other)
 
     # __rtruediv__ only has priority over __truediv__ if the right-hand operand
     # is an instance of a subclass of the left-hand operand's class
     def __rtruediv__(self, other):
-        return q('%', other, self)
+        return _primitive('%', other, self)
 
     def __floordiv__(self, other):
-        return q('div', self, other)
+        return _primitive('div', self, other)
 
     def __rfloordiv__(self, other):
-        return q('div', other, self)
+        return _primitive('div', other, self)
 
     def __mod__(self, other):
-        return q('mod', self, other)
+        return _primitive('mod', self, other)
 
     def __rmod__(self, other):
-        return q('mod', other, self)
+        return _primitive('mod', other, self)
 
     def __divmod__(self, other):
         return tuple(q('{(x div y;x mod y)}', self, other))
@@ -395,13 +428,13 @@ class K:
         return q('.pykx.modpow', other, self, modulo)
 
     def __neg__(self):
-        return q('neg', self)
+        return _primitive('neg', self)
 
     def __pos__(self):
         return self
 
     def __abs__(self):
-        return q('abs', self)
+        return _primitive('abs', self)
 
     def __bool__(self):
         if self.is_null:
@@ -1771,67 +1804,174 @@ class Collection(K):
         return q('@', self, _idx_to_k(key, _wrappers.k_n(self)))
 
 
-if pandas_2 and pa is not None:
-    _as_arrow_map = {
-        'List': 'object',
-        'BooleanVector': 'bool[pyarrow]',
-        'GUIDVector': 'object',
-        'ByteVector': 'uint8[pyarrow]',
-        'ShortVector': 'int16[pyarrow]',
-        'IntVector': 'int32[pyarrow]',
-        'LongVector': 'int64[pyarrow]',
-        'RealVector': 'float[pyarrow]',
-        'FloatVector': 'double[pyarrow]',
-        'CharVector': pd.ArrowDtype(pa.binary(1)),
-        'SymbolVector': 'string[pyarrow]',
-        'TimestampVector': 'timestamp[ns][pyarrow]',
-        'MonthVector': 'timestamp[s][pyarrow]',
-        'DateVector': 'timestamp[s][pyarrow]',
-        'TimespanVector': 'duration[ns][pyarrow]',
-        'MinuteVector': 'duration[s][pyarrow]',
-        'SecondVector': 'duration[s][pyarrow]',
-        'TimeVector': 'duration[ms][pyarrow]'
-    }
-
-    _as_arrow_raw_map = {
-        'List': 'object',
-        'BooleanVector': 'bool[pyarrow]',
-        'GUIDVector': 'object',
-        'ByteVector': 'uint8[pyarrow]',
-        'ShortVector': 'int16[pyarrow]',
-        'IntVector': 'int32[pyarrow]',
-        'LongVector': 'int64[pyarrow]',
-        'RealVector': 'float[pyarrow]',
-        'FloatVector': 'double[pyarrow]',
-        'CharVector': pd.ArrowDtype(pa.binary(1)),
-        'SymbolVector': pd.ArrowDtype(pa.binary()),
-        'TimestampVector': 'int64[pyarrow]',
-        'DatetimeVector': 'double[pyarrow]',
-        'MonthVector': 'int32[pyarrow]',
-        'DateVector': 'int32[pyarrow]',
-        'TimespanVector': 'int64[pyarrow]',
-        'MinuteVector': 'int32[pyarrow]',
-        'SecondVector': 'int32[pyarrow]',
-        'TimeVector': 'int32[pyarrow]',
-    }
+_as_arrow_maps = None
+
+
+def _as_arrow_map(raw: bool = False) -> dict:
+    # The Pandas dtypes used for each vector type by `as_arrow=True`, built on first use as the
+    # dtypes of char and symbol vectors need PyArrow to be loaded
+    global _as_arrow_maps
+    if _as_arrow_maps is None:
+        _as_arrow_maps = (
+            {
+                'List': 'object',
+                'BooleanVector': 'bool[pyarrow]',
+                'GUIDVector': 'object',
+                'ByteVector': 'uint8[pyarrow]',
+                'ShortVector': 'int16[pyarrow]',
+                'IntVector': 'int32[pyarrow]',
+                'LongVector': 'int64[pyarrow]',
+                'RealVector': 'float[pyarrow]',
+                'FloatVector': 'double[pyarrow]',
+                'CharVector': pd.ArrowDtype(pa.binary(1)),
+                'SymbolVector': 'string[pyarrow]',
+                'TimestampVector': 'timestamp[ns][pyarrow]',
+                'MonthVector': 'timestamp[s][pyarrow]',
+                'DateVector': 'timestamp[s][pyarrow]',
+                'TimespanVector': 'duration[ns][pyarrow]',
+                'MinuteVector': 'duration[s][pyarrow]',
+                'SecondVector': 'duration[s][pyarrow]',
+                'TimeVector': 'duration[ms][pyarrow]'
+            },
+            {
+                'List': 'object',
+                'BooleanVector': 'bool[pyarrow]',
+                'GUIDVector': 'object',
+                'ByteVector': 'uint8[pyarrow]',
+                'ShortVector': 'int16[pyarrow]',
+                'IntVector': 'int32[pyarrow]',
+                'LongVector': 'int64[pyarrow]',
+                'RealVector': 'float[pyarrow]',
+                'FloatVector': 'double[pyarrow]',
+                'CharVector': pd.ArrowDtype(pa.binary(1)),
+                'SymbolVector': pd.ArrowDtype(pa.binary()),
+                'TimestampVector': 'int64[pyarrow]',
+                'DatetimeVector': 'double[pyarrow]',
+                'MonthVector': 'int32[pyarrow]',
+                'DateVector': 'int32[pyarrow]',
+                'TimespanVector': 'int64[pyarrow]',
+                'MinuteVector': 'int32[pyarrow]',
+                'SecondVector': 'int32[pyarrow]',
+                'TimeVector': 'int32[pyarrow]',
+            },
+        )
+    return _as_arrow_maps[raw]
+
+
+def _arrow_zero_copy_type(ktype, raw: bool = False):
+    """Arrow type for vectors whose q memory layout matches Arrow, or `None` if a copy is needed."""
+    if pa is None:
+        raise PyArrowUnavailable # nocov
+    if ktype is TimespanVector:
+        return pa.int64() if raw else pa.duration('ns')
+    return {
+        ByteVector: pa.uint8(),
+        ShortVector: pa.int16(),
+        IntVector: pa.int32(),
+        LongVector: pa.int64(),
+        RealVector: pa.float32(),
+        FloatVector: pa.float64(),
+    }.get(ktype)
+
+
+def _import_polars():
+    # Polars objects are created from Arrow data, so PyArrow is required as well
+    if pa is None:
+        raise PyArrowUnavailable # nocov
+    if _polars_unavailable:
+        raise PyKXException('Polars not available, please install Polars')
+    import polars
+    return polars
+
+
+def _arrow_array_from_raw(arrow_type, data, null_value=None, nulls=None):
+    """Wrap raw q vector data in an Arrow array without copying.
+
+    Items equal to `null_value`, or marked in the boolean array `nulls`, are masked as null.
+    """
+    n = len(data)
+    validity = None
+    null_count = 0
+    if nulls is None and null_value is not None:
+        nulls = data == null_value
+    if nulls is not None:
+        valid = ~nulls
+        null_count = n - int(np.count_nonzero(valid))
+        if null_count:
+            validity = pa.py_buffer(np.packbits(valid, bitorder='little'))
+    return pa.Array.from_buffers(
+        arrow_type, n, [validity, pa.py_buffer(data)], null_count=null_count
+    )
+
+
+def _arrow_c_export(arrow_obj, method: str, requested_schema=None):
+    if not hasattr(arrow_obj, method):
+        raise PyKXException('The Arrow PyCapsule interface requires PyArrow>=14.0, '
+                            f'found PyArrow {pa.__version__}')
+    return getattr(arrow_obj, method)(requested_schema)
+
+
+# Numpy 2.1 added the `max_version`, `dl_device` and `copy` keywords of `__dlpack__`, which
+# earlier versions reject
+_numpy_dlpack_versioned = tuple(int(x) for x in np.__version__.split('.')[:2]) >= (2, 1)
 
 
 class Vector(Collection, abc.Sequence):
     """Base type for all q vectors, which are ordered collections of a particular type."""
     @property
     def has_nulls(self) -> bool:
-        return q('{any null x}', self).py()
+        count = _wrappers.null_count(self, stop=True)
+        if count is None:
+            return q('{any null x}', self).py()
+        return count > 0
 
     @property
     def has_infs(self) -> bool:
         if self.t in {1, 2, 4, 10, 11}:
             return False
+        count = _wrappers.null_count(self, infs=True, stop=True)
+        if count is not None:
+            return count > 0
         try:
             type_char = ' bg xhijefcspmdznuvts'[self.t]
         except IndexError:
             return False
         return q(f'{{any -0W 0W{type_char}=\\:x}}')(self).py()
 
+    def null_count(self) -> int:
+        """Count the null items of the vector.
+
+        The scan is performed natively over the vector data, and does not require a license. For
+        a `pykx.List` only the items which are atoms are considered.
+        """
+        count = _wrappers.null_count(self)
+        if count is None:
+            return q('{sum null x}', self).py()
+        return count
+
+    def null_mask(self) -> np.ndarray:
+        """Return a boolean Numpy array marking the null items of the vector.
+
+        The scan is performed natively over the vector data, and does not require a license. For
+        a `pykx.List` only the items which are atoms are considered.
+        """
+        mask = _wrappers.null_mask(self)
+        if mask is None:
+            return q('null', self).np().astype(bool)
+        return mask
+
+    def inf_mask(self) -> np.ndarray:
+        """Return a boolean Numpy array marking the positive and negative infinite items of the
+        vector.
+
+        The scan is performed natively over the vector data, and does not require a license. For
+        a `pykx.List` only the items which are atoms are considered.
+        """
+        mask = _wrappers.null_mask(self, infs=True)
+        if mask is None:
+            return np.zeros(len(self), dtype=bool)
+        return mask
+
     def __len__(self):
         return _wrappers.k_n(self)
 
@@ -1839,6 +1979,65 @@ class Vector(Collection, abc.Sequence):
         for i in range(_wrappers.k_n(self)):
             yield self._unlicensed_getitem(i)
 
+    def _reduce_out_of_band(self):
+        # Attributes other than sorted are backed by q index structures which must be rebuilt
+        if _wrappers.k_u(self) not in (0, 1):
+            return None
+        data = _wrappers.vector_buffer(self)
+        if data is None:
+            return None
+        return (_wrappers.vector_from_buffer,
+                (_wrappers.k_t(self), _wrappers.k_u(self), PickleBuffer(data)))
+
+    def _slice(self, start: int, stop: int):
+        res = _wrappers.vector_slice(self, start, stop)
+        if res is None:
+            n = len(self)
+            start = min(max(start, 0), n)
+            return q('sublist', [start, min(max(stop, start), n) - start], self)
+        return res
+
+    def lazy(self) -> 'LazyExpression':
+        """Wrap the vector in a [`LazyExpression`][pykx.LazyExpression].
+
+        Chained operations on the result are evaluated in a single call to q by `.eval()`.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> x = kx.q('1 2 3').lazy()
+        >>> (x * 2 + x).eval()
+        pykx.LongVector(pykx.q('3 6 9'))
+        ```
+        """
+        return LazyExpression(self)
+
+    def iter_py(self, *, chunk: int = 1024, raw: bool = False, stdlib: bool = True):
+        """Iterate over the items of the vector as Python objects, converting them in chunks.
+
+        Iterating over a vector directly creates a `pykx.Atom` for every item. This instead copies
+        `chunk` items at a time into a new vector and converts it using `.py()`, which avoids the
+        per-item overhead while keeping memory usage bounded.
+
+        Parameters:
+            chunk: The number of items to convert at a time.
+            raw: Whether to convert the items as raw values, see `.py()`.
+            stdlib: Whether to convert the items to Python standard library types, see `.py()`.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> sum(x for x in kx.q('til 1000000').iter_py(chunk=10000))
+        499999500000
+        ```
+        """
+        if chunk < 1:
+            raise ValueError('chunk must be a positive integer')
+        for start in range(0, len(self), chunk):
+            yield from self._slice(start, start + chunk).py(raw=raw, stdlib=stdlib)
+
     def __reversed__(self):
         for i in reversed(range(_wrappers.k_n(self))):
             yield self._unlicensed_getitem(i)
@@ -1867,6 +2066,67 @@ class Vector(Collection, abc.Sequence):
             raise PyArrowUnavailable # nocov
         return self.pa()
 
+    def __arrow_c_array__(self, requested_schema=None):
+        """Export the vector using the Arrow PyCapsule interface.
+
+        Numeric vectors and timespan vectors are exported without copying their data. The exported
+        buffers hold a reference to the q object, which is kept alive until the consumer releases
+        them.
+        """
+        if pa is None:
+            raise PyArrowUnavailable # nocov
+        return _arrow_c_export(self._arrow_array(), '__arrow_c_array__', requested_schema)
+
+    def _arrow_array(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        arrow_type = _arrow_zero_copy_type(type(self), raw)
+        if arrow_type is None:
+            return self.pa(raw=raw, has_nulls=has_nulls)
+        # The Numpy array references this vector, so the Arrow buffer created over it keeps the
+        # q object alive for as long as Arrow is using the data.
+        data = _wrappers.k_vec_to_array(self, getattr(self, '_np_base_type', self._np_type))
+        nulls = None
+        if not raw and has_nulls is not False and hasattr(self, '_base_null_value'):
+            if has_nulls or _wrappers.null_count(self, stop=True):
+                nulls = _wrappers.null_mask(self)
+        return _arrow_array_from_raw(arrow_type, data, nulls=nulls)
+
+    def _buffer_array(self):
+        if not isinstance(self, (NumericVector, TemporalVector)):
+            raise TypeError(f'{type(self).__name__} does not support the buffer protocol')
+        # Temporal vectors are exported as their underlying q epoch values, as the epoch offset
+        # cannot be applied without copying the data.
+        return _wrappers.k_vec_to_array(self, getattr(self, '_np_base_type', self._np_type))
+
+    def __buffer__(self, flags):
+        """Expose the vector data using the Python buffer protocol.
+
+        Python only uses `__buffer__` from Python 3.12 onwards, so on earlier versions
+        `memoryview(vector)` raises a `TypeError`, and `np` or `__dlpack__` should be used instead.
+
+        The returned `memoryview` shares memory with the q object and keeps it alive. Temporal
+        vectors are exposed as their raw q epoch values.
+        """
+        return memoryview(self._buffer_array())
+
+    def __dlpack__(self, *, stream=None, max_version=None, dl_device=None, copy=None):
+        """Export the vector data as a DLPack capsule for consumers such as PyTorch or JAX.
+
+        The capsule shares memory with the q object and keeps it alive, unless `copy=True`.
+        Temporal vectors are exported as their raw q epoch values. `max_version` is only passed
+        on to Numpy 2.1 and later, which can produce versioned capsules.
+        """
+        if stream is not None:
+            raise BufferError('PyKX vectors reside on the CPU, stream must be None')
+        if dl_device is not None and tuple(dl_device) != self.__dlpack_device__():
+            raise BufferError('PyKX vectors reside on the CPU, dl_device must be the CPU')
+        arr = self._buffer_array()
+        if not _numpy_dlpack_versioned:
+            return (arr.copy() if copy else arr).__dlpack__()
+        return arr.__dlpack__(max_version=max_version, dl_device=dl_device, copy=copy)
+
+    def __dlpack_device__(self):
+        return (1, 0) # (kDLCPU, device_id)
+
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
         return self.np(raw=raw, has_nulls=has_nulls).tolist()
 
@@ -1878,14 +2138,11 @@ class Vector(Collection, abc.Sequence):
         as_arrow: Optional[bool] = False,
     ):
         res = pd.Series(self.np(raw=raw, has_nulls=has_nulls), copy=False)
-        if not raw:
-            null_inds = []
-            for i in range(len(self)):
-                if isinstance(self._unlicensed_getitem(i), IntegralNumericAtom)\
-                        and self._unlicensed_getitem(i).is_null:
-                    null_inds.append(i)
-            if not 0 == len(null_inds):
-                res[null_inds] = pd.NA
+        if not raw and isinstance(self, List):
+            # Integral nulls within a general list are converted to `pd.NA`
+            nulls = _wrappers.null_mask(self, integral=True)
+            if nulls.any():
+                res[nulls] = pd.NA
         if as_arrow:
             if not pandas_2:
                 raise RuntimeError('Pandas Version must be at least 2.0 to use as_arrow=True')
@@ -1893,24 +2150,22 @@ class Vector(Collection, abc.Sequence):
                 raise PyArrowUnavailable # nocov
             if raw:
                 if type(self).__name__ != 'GUIDVector':
-                    res = res.astype(_as_arrow_raw_map[type(self).__name__])
+                    res = res.astype(_as_arrow_map(True)[type(self).__name__])
             else:
-                res = res.astype(_as_arrow_map[type(self).__name__])
+                res = res.astype(_as_arrow_map()[type(self).__name__])
         return res
 
     def pa(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
         if pa is None:
             raise PyArrowUnavailable # nocov
+        if _arrow_zero_copy_type(type(self), raw) is not None:
+            return self._arrow_array(raw=raw, has_nulls=has_nulls)
         try:
             np_array = self.np(raw=raw, has_nulls=has_nulls)
             if not raw and isinstance(self, List):
-                null_inds = []
-                for i in range(len(self)):
-                    if isinstance(self._unlicensed_getitem(i), IntegralNumericAtom)\
-                            and self._unlicensed_getitem(i).is_null:
-                        null_inds.append(i)
-                if not 0 == len(null_inds):
-                    np_array[null_inds] = None
+                nulls = _wrappers.null_mask(self, integral=True)
+                if nulls.any():
+                    np_array[nulls] = None
             return pa.array(np_array)
         except (pa.lib.ArrowNotImplementedError, pa.lib.ArrowInvalid) as err:
             if isinstance(self, List):
@@ -1918,6 +2173,65 @@ class Vector(Collection, abc.Sequence):
                              f'to PyArrow,\n        failed with error: {err}')
             raise err
 
+    def _arrow_polars(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        # Arrow array for `.pl()`, which uses the Polars type closest to the q type where it
+        # differs from the Arrow type returned by `.pa()`
+        if raw or _arrow_zero_copy_type(type(self)) is not None:
+            return self._arrow_array(raw=raw, has_nulls=has_nulls)
+        if isinstance(self, SymbolVector):
+            return pa.array(self.np(), pa.string()).dictionary_encode()
+        if isinstance(self, TimeVector):
+            # Polars times are the nanoseconds since midnight, so q times are scaled exactly
+            nulls = None if has_nulls is False else _wrappers.null_mask(self)
+            data = self.np(raw=True).astype(np.int64) * 1000000
+            return pa.array(data, pa.int64(), mask=nulls).cast(pa.time64('ns'))
+        if isinstance(self, TemporalVector) and not isinstance(self, DatetimeVector):
+            array = self.np(has_nulls=has_nulls)
+            # Polars has no month type, and only supports durations of at least millisecond
+            # precision, so these are converted exactly to dates and millisecond durations
+            if array.dtype == np.dtype('datetime64[M]'):
+                array = array.astype('datetime64[D]')
+            elif array.dtype in (np.dtype('timedelta64[m]'), np.dtype('timedelta64[s]')):
+                array = array.astype('timedelta64[ms]')
+            return pa.array(array, from_pandas=True)
+        return self.pa(raw=raw, has_nulls=has_nulls)
+
+    def pl(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        """Provides a Polars representation of the vector as a `polars.Series`.
+
+        The vector is converted via Arrow, sharing memory with q for numeric and timespan vectors.
+        Symbols are converted to a Polars categorical, timestamps to nanosecond datetimes, dates
+        to dates, timespans to nanosecond durations and times to times, each of which hold the q
+        values exactly. Polars has no equivalent of the other q temporal types, so:
+
+        - Months are converted to the date of the first day of the month.
+        - Minutes and seconds are converted to millisecond durations.
+
+        These values are preserved, but the q type is not restored when converting back using
+        `kx.toq`, which returns a `pykx.DateVector` or `pykx.TimespanVector` respectively. Polars
+        times are also converted back to a `pykx.TimespanVector`, as they have nanosecond
+        precision.
+
+        Parameters:
+            raw: Whether to return the raw representation of the data, as for `.pa()`.
+            has_nulls: Whether the vector contains nulls, or `None` to check.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> kx.q('`a`b`a').pl()
+        shape: (3,)
+        Series: '' [cat]
+        [
+            "a"
+            "b"
+            "a"
+        ]
+        ```
+        """
+        return _import_polars().from_arrow(self._arrow_polars(raw=raw, has_nulls=has_nulls))
+
     def apply(self, func, *args, **kwargs):
         if not callable(func):
             raise RuntimeError("Provided value 'func' is not callable")
@@ -2336,13 +2650,25 @@ class List(Vector):
     def _unlicensed_getitem(self, index):
         return _wrappers.list_unlicensed_getitem(self, index)
 
+    def _reduce_out_of_band(self):
+        # Only lists of vectors whose data can be exported are pickled item by item, as a reduction
+        # per atom or small item is slower and larger than q serialization. Subclasses such as
+        # `Anymap` are serialized by q to keep their type.
+        if type(self) is not List:
+            return None
+        items = [self._unlicensed_getitem(i) for i in range(len(self))]
+        if not items or not all(isinstance(x, Vector) and x._reduce_out_of_band() is not None
+                                for x in items):
+            return None
+        return (_wrappers.list_from_items, (items,))
+
     @property
     def has_nulls(self) -> bool:
-        return any(x.is_null if x.is_atom else False for x in self)
+        return _wrappers.null_count(self, stop=True) > 0
 
     @property
     def has_infs(self) -> bool:
-        return any(x.is_inf if x.is_atom else False for x in self)
+        return _wrappers.null_count(self, infs=True, stop=True) > 0
 
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
         return [_rich_convert(x, stdlib, raw) for x in self]
@@ -2361,6 +2687,69 @@ class List(Vector):
         razed = q('(raze/)', self)
         return razed.np().reshape(dims)
 
+    def _flatten(self):
+        flat = _wrappers.list_flatten(self)
+        if flat is None or flat[2] not in _flat_list_dtypes:
+            return None
+        offsets, data, t = flat
+        return offsets, data.view(_flat_list_dtypes[t]), type_number_to_pykx_k_type[t]
+
+    def ragged(self, *, raw: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Flatten a list of vectors of the same type into an offsets and values pair.
+
+        The data of every item is copied into a single Numpy array in one pass, avoiding the
+        creation of a Numpy object array holding one array per item. The values of item `i` are
+        `values[offsets[i]:offsets[i+1]]`.
+
+        Parameters:
+            raw: Whether to return the raw q representation of temporal values. Null values in
+                numeric vectors are always returned as their underlying q representation.
+
+        Returns:
+            A tuple of an int64 offsets array of length `len(self) + 1` and the flattened values.
+
+        Raises:
+            TypeError: The items of the list are not all numeric, temporal or char vectors of
+                the same type.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> offsets, values = kx.q('(1 2 3f;();4 5f)').ragged()
+        >>> offsets
+        array([0, 3, 3, 5])
+        >>> values
+        array([1., 2., 3., 4., 5.])
+        ```
+        """
+        flat = self._flatten()
+        if flat is None:
+            raise TypeError('Only lists of numeric, temporal or char vectors of the same type can '
+                            'be flattened')
+        offsets, values, ktype = flat
+        if not raw:
+            values = _flat_list_values(ktype, values)
+        return offsets, values
+
+    def pa(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        if pa is None:
+            raise PyArrowUnavailable # nocov
+        if not raw:
+            flat = self._flatten()
+            if flat is not None:
+                return _flat_list_to_arrow(*flat)
+        return super().pa(raw=raw, has_nulls=has_nulls)
+
+    def _buffer_array(self):
+        # The items of a list are separate allocations, so a rectangular list must be copied once
+        # into contiguous memory before it can be exported.
+        try:
+            return self.np(reshape=True)
+        except (TypeError, QError) as err:
+            raise TypeError('Only rectangular lists of numeric vectors can be exported using '
+                            'the buffer protocol') from err
+
     def pt(self, *, reshape: Union[bool, list] = True):
         _check_beta('PyTorch Conversion')
         if _torch_unavailable:
@@ -2369,6 +2758,45 @@ class List(Vector):
         return torch.from_numpy(self.np(reshape=reshape))
 
 
+# Numpy dtypes of the raw data of the vector types supported by `List.ragged`
+_flat_list_dtypes = {
+    1: np.bool_, 4: np.uint8, 5: np.int16, 6: np.int32, 7: np.int64, 8: np.float32,
+    9: np.float64, 10: np.uint8, 12: np.int64, 13: np.int32, 14: np.int32, 16: np.int64,
+    17: np.int32, 18: np.int32, 19: np.int32,
+}
+
+
+def _flat_list_values(ktype, values):
+    # `values` is a private copy of the list data, so it can be modified in place
+    if ktype is CharVector:
+        return values.view('S1')
+    if not issubclass(ktype, TemporalVector):
+        return values
+    nulls = values == ktype._base_null_value
+    is_fixed = issubclass(ktype, TemporalFixedVector)
+    if is_fixed:
+        values += ktype._epoch_offset
+    values = values.astype(ktype._np_dtype, copy=False)
+    values[nulls] = np.datetime64('NaT') if is_fixed else np.timedelta64('NaT')
+    return values
+
+
+def _flat_list_to_arrow(offsets, values, ktype):
+    n = len(offsets) - 1
+    if ktype is CharVector:
+        return pa.LargeStringArray.from_buffers(n, pa.py_buffer(offsets), pa.py_buffer(values))
+    arrow_type = _arrow_zero_copy_type(ktype)
+    if arrow_type is None:
+        values = pa.array(_flat_list_values(ktype, values))
+    else:
+        values = _arrow_array_from_raw(
+            arrow_type, values, getattr(ktype, '_base_null_value', None)
+        )
+    if offsets[-1] < 2 ** 31:
+        return pa.ListArray.from_arrays(pa.array(offsets.astype(np.int32)), values)
+    return pa.LargeListArray.from_arrays(pa.array(offsets), values)
+
+
 class NumericVector(Vector):
     """Base type for all q numeric vectors."""
     pass
@@ -2378,30 +2806,32 @@ class IntegralNumericVector(NumericVector):
     """Base type for all q integral numeric vectors."""
     @property
     def has_nulls(self) -> bool:
-        return (self._base_null_value == self.np(raw=True)).any()
+        return _wrappers.null_count(self, stop=True) > 0
 
     @property
     def has_infs(self) -> bool:
-        a = self.np(raw=True)
-        return (a == self._base_inf_value).any() or (a == -self._base_inf_value).any()
+        return _wrappers.null_count(self, infs=True, stop=True) > 0
 
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
+        res = self.np(raw=True, has_nulls=has_nulls).tolist()
         if raw:
-            return self.np(raw=True, has_nulls=has_nulls).tolist()
-        return [pd.NA if x.is_null else x.py() for x in self]
+            return res
+        for i in np.flatnonzero(_wrappers.null_mask(self)):
+            res[i] = pd.NA
+        for i in np.flatnonzero(_wrappers.null_mask(self, infs=True)):
+            res[i] = math.inf if res[i] > 0 else -math.inf
+        return res
 
     def np(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
         if raw:
             has_nulls = False
-        if has_nulls is None or has_nulls:
-            nulls = self.np(raw=True) == self._base_null_value
-            if has_nulls is None:
-                has_nulls = nulls.any()
+        if has_nulls is None:
+            has_nulls = self.has_nulls
         arr = _wrappers.k_vec_to_array(self, self._np_type)
         if has_nulls:
             return np.ma.MaskedArray(
                 arr,
-                mask=nulls,
+                mask=_wrappers.null_mask(self),
                 copy=False,
                 # Set the fill value to the value of the underlying null in q
                 fill_value=-2 ** (arr.itemsize * 8 - 1)
@@ -2424,9 +2854,9 @@ class IntegralNumericVector(NumericVector):
         if as_arrow:
             arr = pa.array(arr)
             if raw:
-                res = pd.Series(arr, copy=False, dtype=_as_arrow_raw_map[type(self).__name__])
+                res = pd.Series(arr, copy=False, dtype=_as_arrow_map(True)[type(self).__name__])
             else:
-                res = pd.Series(arr, copy=False, dtype=_as_arrow_map[type(self).__name__])
+                res = pd.Series(arr, copy=False, dtype=_as_arrow_map()[type(self).__name__])
         else:
             if isinstance(arr, np.ma.MaskedArray):
                 arr = pd.arrays.IntegerArray(arr, mask=arr.mask, copy=False)
@@ -2473,7 +2903,7 @@ def _raw_guids_to_arrow(guids):
     if pa is None:
         raise PyArrowUnavailable # nocov
     return pa.ExtensionArray.from_storage(
-        arrow_uuid_type,
+        _arrow_uuid_type(),
         pa.array(guids.view('S16'), pa.binary(16)),
     )
 
@@ -2541,27 +2971,34 @@ class PandasUUIDArray(pd.api.extensions.ExtensionArray):
         raise NotImplementedError
 
 
-if pa is not None:
-    class ArrowUUIDType(pa.ExtensionType):
-        def __init__(self):
-            if pa is None:
-                raise PyArrowUnavailable # nocov
-            pa.ExtensionType.__init__(self, pa.binary(16), 'pykx.uuid')
+_arrow_uuid_types = {}
+
 
-        def __arrow_ext_serialize__(self):
-            return b''
+def _arrow_uuid_type():
+    # The Arrow extension type of GUIDs is defined and registered on first use, so that importing
+    # PyKX doesn't load PyArrow
+    if not _arrow_uuid_types:
+        if pa is None:
+            raise PyArrowUnavailable # nocov
 
-        @classmethod
-        def __arrow_ext_deserialize__(cls, storage_type, serialized):
-            return ArrowUUIDType()
+        class ArrowUUIDType(pa.ExtensionType):
+            def __init__(self):
+                pa.ExtensionType.__init__(self, pa.binary(16), 'pykx.uuid')
 
-        def to_pandas_dtype(self):
-            return PandasUUIDType()
+            def __arrow_ext_serialize__(self):
+                return b''
 
-    arrow_uuid_type = ArrowUUIDType()
-    pa.register_extension_type(arrow_uuid_type)
-else: # nocov
-    pass
+            @classmethod
+            def __arrow_ext_deserialize__(cls, storage_type, serialized):
+                return ArrowUUIDType()
+
+            def to_pandas_dtype(self):
+                return PandasUUIDType()
+
+        _arrow_uuid_types['ArrowUUIDType'] = ArrowUUIDType
+        _arrow_uuid_types['arrow_uuid_type'] = ArrowUUIDType()
+        pa.register_extension_type(_arrow_uuid_types['arrow_uuid_type'])
+    return _arrow_uuid_types['arrow_uuid_type']
 
 
 class GUIDVector(Vector):
@@ -2577,7 +3014,7 @@ class GUIDVector(Vector):
 
     @property
     def has_nulls(self) -> bool:
-        return (0j == self.np(raw=True)).any()
+        return _wrappers.null_count(self, stop=True) > 0
 
     @property
     def has_infs(self) -> bool:
@@ -2670,12 +3107,11 @@ class NonIntegralNumericVector(NumericVector):
     """Base type for all q non-integral numeric vectors."""
     @property
     def has_nulls(self) -> bool:
-        a = self.np()
-        return np.isnan(np.dot(a, a)) # `np.dot` can be used as a high-performance NaN check
+        return _wrappers.null_count(self, stop=True) > 0
 
     @property
     def has_infs(self) -> bool:
-        return (self.np() == np.inf).any()
+        return _wrappers.null_count(self, infs=True, stop=True) > 0
 
     def __pow__(self, other, mod=None):
         if mod is None:
@@ -2778,12 +3214,11 @@ class TemporalVector(Vector):
     """Base type for all q temporal vectors."""
     @property
     def has_nulls(self) -> bool:
-        return (self._base_null_value == self.np(raw=True)).any()
+        return _wrappers.null_count(self, stop=True) > 0
 
     @property
     def has_infs(self) -> bool:
-        a = self.np(raw=True)
-        return (a == self._base_inf_value).any() or (a == -self._base_inf_value).any()
+        return _wrappers.null_count(self, infs=True, stop=True) > 0
 
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
         if raw:
@@ -2809,13 +3244,12 @@ class TemporalVector(Vector):
             array = array.astype(self._np_type, copy=False)
         if raw:
             has_nulls = False
-        if has_nulls is None or has_nulls:
-            nulls = base_array == self._base_null_value
-            if has_nulls is None:
-                has_nulls = nulls.any()
+        if has_nulls is None:
+            has_nulls = self.has_nulls
         if has_nulls:
             is_fixed = isinstance(self, TemporalFixedVector)
-            array[nulls] = np.datetime64('NaT') if is_fixed else np.timedelta64('NaT')
+            array[_wrappers.null_mask(self)] = \
+                np.datetime64('NaT') if is_fixed else np.timedelta64('NaT')
         return array
 
 
@@ -3017,6 +3451,10 @@ class TimeVector(TemporalSpanVector):
         return TimeVector([np.timedelta64(59789214, 'ms'), np.timedelta64(59789214, 'ms')])
 
 
+# Pandas 2.1 added the option to skip validating the codes of a categorical
+_from_codes_validates = 'validate' in signature(pd.Categorical.from_codes).parameters
+
+
 class EnumVector(Vector):
     """Wrapper for q enum vectors.
 
@@ -3064,6 +3502,7 @@ class EnumVector(Vector):
         raw: bool = False,
         has_nulls: Optional[bool] = None,
         as_arrow: Optional[bool] = False,
+        as_category: bool = False,
     ):
         if raw:
             res = super().pd(raw=raw, has_nulls=has_nulls)
@@ -3074,9 +3513,27 @@ class EnumVector(Vector):
                     raise PyArrowUnavailable # nocov
                 res = res.astype('int64[pyarrow]')
             return res
+        if as_category:
+            return pd.Series(self._categorical(), copy=False)
         res = pd.Series(self.np(raw=raw, has_nulls=has_nulls), dtype='category')
         return res
 
+    def _categorical(self):
+        # The enum indices are the category codes, so only the domain needs to be converted. Pandas
+        # stores codes in the smallest integer type which fits the categories, so the 64-bit
+        # indices are narrowed to it in a single copy, which Pandas then uses without validating.
+        categories = q('{value key x}', self).np()
+        indices = self.np(raw=True)
+        for code_type in (np.int8, np.int16, np.int32, np.int64):
+            if len(categories) < np.iinfo(code_type).max:
+                break
+        codes = indices.astype(code_type)
+        codes[indices == NULL_INT64] = -1
+        dtype = pd.CategoricalDtype(categories)
+        if _from_codes_validates:
+            return pd.Categorical.from_codes(codes, dtype=dtype, validate=False)
+        return pd.Categorical.from_codes(codes, dtype=dtype)
+
 
 class Anymap(List):
     """Wrapper for q mapped lists, also known as "anymaps"."""
@@ -3218,6 +3675,48 @@ class Table(PandasAPI, Mapping):
             Mapping.__init__(self, *args, **kwargs)
             _wrappers.table_init(self)
 
+    @classmethod
+    def from_records(cls, records, schema=None, *, infer_rows: int = 100):
+        """Create a table from a sequence of records without an intermediate DataFrame.
+
+        The records are scanned once, with the values of each column written directly into a
+        q vector of the column's type.
+
+        Parameters:
+            records: An iterable of dictionaries, named tuples, or tuples/lists of values ordered
+                as the columns of `schema`. Missing dictionary keys and `None` values are
+                converted to q nulls. Dictionary keys which are not columns are ignored.
+            schema: A dictionary mapping column names to `pykx.K` types, or a table such as one
+                generated by [`pykx.schema.builder`][pykx.schema.builder]. If `None`, the columns
+                and their types are inferred from the first `infer_rows` records, with unnamed
+                tuple columns named `x`, `x1`, `x2`, etc.
+            infer_rows: The number of records used to infer the schema when it is not provided.
+
+        Returns:
+            A `pykx.Table`, or a `pykx.KeyedTable` if `schema` is a keyed table.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> kx.Table.from_records([{'sym': 'a', 'px': 1.5}, {'sym': 'b', 'px': 2.5}])
+        pykx.Table(pykx.q('
+        sym px
+        -------
+        a   1.5
+        b   2.5
+        '))
+        >>> kx.Table.from_records([('a', 1), ('b', None)],
+        ...                       {'sym': kx.SymbolAtom, 'sz': kx.LongAtom})
+        pykx.Table(pykx.q('
+        sym sz
+        ------
+        a   1
+        b
+        '))
+        ```
+        """
+        return toq._from_records(records, schema, infer_rows=infer_rows)
 
     def prototype(self={}): # noqa
         _map = {}
@@ -3249,6 +3748,12 @@ class Table(PandasAPI, Mapping):
     def flip(self):
         return _wrappers.k_from_addr(Dictionary, _wrappers.k_k(self), True)
 
+    def _reduce_out_of_band(self):
+        if self._values is None:
+            # Splayed and partitioned tables cannot be pickled
+            return None
+        return (_wrappers.dictionary_from_parts, (self._keys, self._values, True))
+
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
         return dict(zip(
             self._keys.py(raw=raw, has_nulls=has_nulls, stdlib=stdlib),
@@ -3262,12 +3767,17 @@ class Table(PandasAPI, Mapping):
         has_nulls: Optional[bool] = None,
         raw_guids=False,
         as_arrow: Optional[bool] = False,
+        as_category: bool = False,
     ):
+        # Enum columns converted to categoricals only need their indices
+        as_category = as_category and not raw
         if raw_guids and not raw:
-            v = [x.np(raw=isinstance(x, GUIDVector), has_nulls=has_nulls) for x in self._values]
+            v = [x.np(raw=isinstance(x, GUIDVector) or (as_category and isinstance(x, EnumVector)),
+                      has_nulls=has_nulls) for x in self._values]
             v = [PandasUUIDArray(x) if x.dtype == complex else x for x in v]
         else:
-            v = [x.np(raw=raw, has_nulls=has_nulls) for x in self._values]
+            v = [x.np(raw=raw or (as_category and isinstance(x, EnumVector)), has_nulls=has_nulls)
+                 for x in self._values]
         if pandas_2:
             # The current behavior is a bug and will raise an error in the future, this change
             # proactively fixes that for us
@@ -3279,7 +3789,9 @@ class Table(PandasAPI, Mapping):
         df = df_from_arrays(pd.Index(self._keys), v, pd.RangeIndex(len(self)))
         _pykx_base_types = {}
         for i, v in enumerate(self._values):
-            if not raw and isinstance(v, EnumVector):
+            if as_category and isinstance(v, EnumVector):
+                df[self._keys.py()[i]] = v._categorical()
+            elif not raw and isinstance(v, EnumVector):
                 df = df.astype({self._keys.py()[i]: 'category'})
             _pykx_base_types[self._keys.py()[i]] = str(type(v).__name__)
         df.attrs['_PyKX_base_types'] = _pykx_base_types
@@ -3290,10 +3802,10 @@ class Table(PandasAPI, Mapping):
                 raise PyArrowUnavailable # nocov
             if raw:
                 t_dict = dict(filter(lambda i: i[1] != 'GUIDVector', _pykx_base_types.items()))
-                df = df.astype(dict([(k, _as_arrow_raw_map[v])
+                df = df.astype(dict([(k, _as_arrow_map(True)[v])
                                     for k, v in t_dict.items()]))
             else:
-                df = df.astype(dict([(k, _as_arrow_map[v]) for k, v in _pykx_base_types.items()]))
+                df = df.astype(dict([(k, _as_arrow_map()[v]) for k, v in _pykx_base_types.items()]))
         return df
 
     def pa(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
@@ -3305,9 +3817,194 @@ class Table(PandasAPI, Mapping):
             raise QError('Unable to convert pykx.List column with non conforming types '
                          f'to PyArrow,\n        failed with error: {err}')
 
+    def pl(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        """Provides a Polars representation of the table as a `polars.DataFrame`.
+
+        Each column is converted as by [`Vector.pl`][pykx.Vector.pl], so numeric and timespan
+        columns share memory with q and symbol columns become Polars categoricals.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> kx.q('([] sym:`a`b; px:1.5 2.5)').pl()
+        shape: (2, 2)
+        ┌─────┬─────┐
+        │ sym ┆ px  │
+        │ --- ┆ --- │
+        │ cat ┆ f64 │
+        ╞═════╪═════╡
+        │ a   ┆ 1.5 │
+        │ b   ┆ 2.5 │
+        └─────┴─────┘
+        ```
+        """
+        return _import_polars().from_arrow(
+            pa.Table.from_arrays(
+                self._arrow_polars_columns(raw=raw, has_nulls=has_nulls),
+                names=[str(x) for x in self._keys.py()],
+            ),
+            rechunk=False,
+        )
+
+    def _arrow_polars_columns(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        return [x._arrow_polars(raw=raw, has_nulls=has_nulls) for x in self._values]
+
     def np(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
         return self.pd(raw=raw, has_nulls=has_nulls).to_records(index=False)
 
+    def lazy(self) -> 'LazyExpression':
+        """Wrap the table in a [`LazyExpression`][pykx.LazyExpression].
+
+        Columns of the result are selected by indexing, and chained operations on them are
+        evaluated in a single call to q by `.eval()`.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> t = kx.q('([] x: 1 2 3; y: 4 5 6)').lazy()
+        >>> (t['x'] * t['y']).sum().eval()
+        pykx.LongAtom(pykx.q('32'))
+        ```
+        """
+        return LazyExpression(self)
+
+    def itertuples(
+        self,
+        *,
+        chunk: int = 1024,
+        name: Optional[str] = 'Row',
+        raw: bool = False,
+        stdlib: bool = True,
+    ):
+        """Iterate over the rows of the table as named tuples of Python objects.
+
+        The columns are converted `chunk` rows at a time using
+        [`Vector.iter_py`][pykx.Vector.iter_py], rather than indexing the table one row at a time.
+
+        Parameters:
+            chunk: The number of rows to convert at a time.
+            name: The name of the returned named tuples, or `None` to return regular tuples.
+                Column names which are not valid Python identifiers are replaced with positional
+                names.
+            raw: Whether to convert the values as raw values, see `.py()`.
+            stdlib: Whether to convert the values to Python standard library types, see `.py()`.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> tab = kx.q('([] sym:`a`b; px:1.5 2.5)')
+        >>> list(tab.itertuples())
+        [Row(sym='a', px=1.5), Row(sym='b', px=2.5)]
+        ```
+        """
+        if chunk < 1:
+            raise ValueError('chunk must be a positive integer')
+        row = None if name is None else namedtuple(
+            name, [str(x) for x in self._keys.py()], rename=True
+        )
+        for start in range(0, len(self), chunk):
+            columns = [x._slice(start, start + chunk).py(raw=raw, stdlib=stdlib)
+                       for x in self._values]
+            if row is None:
+                yield from zip(*columns)
+            else:
+                yield from map(row._make, zip(*columns))
+
+    def _batches(self, rows: int, columns: Optional[list] = None):
+        # Yields the row offset and a `pykx.Table` copy of each batch of rows
+        names = self._keys.py()
+        if columns is None:
+            columns = names
+        missing = [c for c in columns if c not in names]
+        if missing:
+            raise KeyError(f'Columns {missing} not found in table')
+        values = list(self._values)
+        values = [values[names.index(c)] for c in columns]
+        columns = SymbolVector(columns)
+        for start in range(0, len(self), rows):
+            yield start, toq._table_from_columns(
+                columns, [x._slice(start, start + rows) for x in values]
+            )
+
+    def iter_batches(
+        self,
+        rows: int = 65536,
+        columns: Optional[list] = None,
+        format: str = 'pandas',
+    ):
+        """Iterate over the table in batches of rows, converting one batch at a time.
+
+        Only the rows of the current batch are copied and converted, so the memory used is bounded
+        by the batch size rather than the size of the table. Batches of splayed tables are read
+        from disk as they are requested, and batches of partitioned tables are read one partition
+        at a time, so a batch never spans more than one partition.
+
+        Parameters:
+            rows: The maximum number of rows in each batch.
+            columns: The names of the columns to include, or `None` to include all columns.
+            format: The format of each batch, one of `'pandas'` for a `pandas.DataFrame` indexed
+                by row number within the table, `'arrow'` for a `pyarrow.RecordBatch`, or
+                `'numpy'` for a Numpy record array.
+
+        Examples:
+
+        ```python
+        >>> import pykx as kx
+        >>> tab = kx.q('([] x:til 5; y:5?1f)')
+        >>> [len(df) for df in tab.iter_batches(2)]
+        [2, 2, 1]
+        >>> next(tab.iter_batches(3, columns=['x'], format='arrow'))
+        pyarrow.RecordBatch
+        x: int64
+        ----
+        x: [0,1,2]
+        ```
+        """
+        if rows < 1:
+            raise ValueError('rows must be a positive integer')
+        if format not in ('pandas', 'arrow', 'numpy'):
+            raise ValueError(f"format must be one of 'pandas', 'arrow' or 'numpy', not {format!r}")
+        if format == 'arrow' and pa is None:
+            raise PyArrowUnavailable # nocov
+        for start, batch in self._batches(rows, None if columns is None else list(columns)):
+            if format == 'arrow':
+                yield batch._arrow_record_batch()
+            elif format == 'numpy':
+                yield batch.np()
+            else:
+                df = batch.pd()
+                df.index = pd.RangeIndex(start, start + len(df))
+                yield df
+
+    def _arrow_record_batch(self):
+        if pa is None:
+            raise PyArrowUnavailable # nocov
+        return pa.RecordBatch.from_arrays(
+            [x._arrow_array() for x in self._values],
+            names=[str(x) for x in self._keys.py()],
+        )
+
+    def __arrow_c_array__(self, requested_schema=None):
+        """Export the table as an Arrow struct array using the Arrow PyCapsule interface.
+
+        Numeric and timespan columns are exported without copying their data.
+        """
+        return _arrow_c_export(self._arrow_record_batch(), '__arrow_c_array__', requested_schema)
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        """Export the table as an Arrow stream using the Arrow PyCapsule interface.
+
+        This allows Arrow consumers such as Polars or DuckDB to read the table directly. Numeric
+        and timespan columns are exported without copying their data.
+        """
+        batch = self._arrow_record_batch()
+        return _arrow_c_export(
+            pa.Table.from_batches([batch]), '__arrow_c_stream__', requested_schema
+        )
+
     def insert(
         self,
         row: Union[list, List],
@@ -4003,9 +4700,26 @@ class SplayedTable(Table):
     def pd(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
         raise NotImplementedError
 
+    def pl(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        raise NotImplementedError
+
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
         raise NotImplementedError
 
+    def _arrow_record_batch(self):
+        raise NotImplementedError
+
+    def _batches(self, rows: int, columns: Optional[list] = None):
+        # Only the rows of each batch are read from the memory mapped columns, which are indexed
+        # directly rather than filtered so that each batch costs time proportional to its size
+        columns = SymbolVector(q.cols(self).py() if columns is None else columns)
+        n = len(self)
+        for start in range(0, n, rows):
+            yield start, q(
+                '{[t;c;s;n] (s;n) sublist ?[t;();0b;c!c]}',
+                self, columns, start, min(rows, n - start)
+            )
+
     def _repr_html_(self):
         if not licensed:
             return self.__repr__()
@@ -4147,6 +4861,19 @@ class PartitionedTable(SplayedTable):
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
         raise NotImplementedError
 
+    def _batches(self, rows: int, columns: Optional[list] = None):
+        # Batches are taken from one partition at a time, indexing the rows of each batch across
+        # the table with `.Q.ind` so that only those rows are read
+        columns = SymbolVector(q.cols(self).py() if columns is None else columns)
+        offset = 0
+        for n in q('.Q.cn', self).py():
+            for start in range(0, n, rows):
+                yield offset + start, q(
+                    '{[t;c;s;n] c#.Q.ind[t;s+til n]}',
+                    self, columns, offset + start, min(rows, n - start)
+                )
+            offset += n
+
     def _repr_html_(self):
         if not licensed:
             return self.__repr__()
@@ -4268,6 +4995,9 @@ class Dictionary(Mapping):
         super().__init__(*args, **kwargs)
         _wrappers.dictionary_init(self)
 
+    def _reduce_out_of_band(self):
+        return (_wrappers.dictionary_from_parts, (self._keys, self._values))
+
     def __getitem__(self, key):
         if not isinstance(key, K):
             original_key = key
@@ -4400,7 +5130,7 @@ class KeyedTable(Dictionary, PandasAPI):
         if not skip:
             vec = q('{x 0}', q('value', q('flip', q('value', self))))
         try:
-            r = q(op_str, vec, other)
+            r = _primitive(op_str, vec, other)
         except Exception as ex:
             ex_str = str(ex)
             if ex_str.startswith('length') or ex_str.startswith('type'):
@@ -4412,7 +5142,7 @@ class KeyedTable(Dictionary, PandasAPI):
             if hasattr(r, '__len__') and len(r) == 0:
                 # Handle comparisons of empty objects
                 if op_str == '=':
-                    return q('~', vec, other)
+                    return _primitive('~', vec, other)
                 elif op_str == '{not x=y}':
                     return q('{not x~y}', vec, other)
             return r
@@ -4503,10 +5233,10 @@ class KeyedTable(Dictionary, PandasAPI):
                 raise PyArrowUnavailable # nocov
             if raw:
                 t_dict = dict(filter(lambda i: i[1] != 'GUIDVector', _pykx_base_types.items()))
-                df = df.astype(dict([(k, _as_arrow_raw_map[v])
+                df = df.astype(dict([(k, _as_arrow_map(True)[v])
                                     for k, v in t_dict.items()]))
             else:
-                df = df.astype(dict([(k, _as_arrow_map[v]) for k, v in _pykx_base_types.items()]))
+                df = df.astype(dict([(k, _as_arrow_map()[v]) for k, v in _pykx_base_types.items()]))
         df.set_index(kk.py(), inplace=True)
         df.attrs['_PyKX_base_types'] = _pykx_base_types
         return df
@@ -4516,6 +5246,21 @@ class KeyedTable(Dictionary, PandasAPI):
             raise PyArrowUnavailable # nocov
         raise NotImplementedError
 
+    def pl(self, *, raw: bool = False, has_nulls: Optional[bool] = None):
+        """Provides a Polars representation of the keyed table as a `polars.DataFrame`.
+
+        Polars has no index, so the key columns are the leading columns of the result. Columns
+        are converted as by [`Table.pl`][pykx.Table.pl].
+        """
+        return _import_polars().from_arrow(
+            pa.Table.from_arrays(
+                self._keys._arrow_polars_columns(raw=raw, has_nulls=has_nulls)
+                + self._values._arrow_polars_columns(raw=raw, has_nulls=has_nulls),
+                names=[str(x) for x in self._keys._keys.py() + self._values._keys.py()],
+            ),
+            rechunk=False,
+        )
+
     def py(self, *, raw: bool = False, has_nulls: Optional[bool] = None, stdlib: bool = True):
         vkp = self._values._keys.py()
         vvp = self._values._values.py
@@ -10814,6 +11559,222 @@ class Column:
         return self.call(fn, iterator=iterator)
 
 
+_lazy_heads = {}
+# Each compiled expression names its temporaries uniquely so that evaluations which are nested or
+# run concurrently don't overwrite each other's intermediate results
+_lazy_ids = count()
+
+
+def _lazy_head(name: str) -> K:
+    # The heads of assignment and sequencing parse tree nodes, `:` and `";"`, can't be created by
+    # evaluating q code, so are taken from a parsed expression on first use
+    if not _lazy_heads:
+        _lazy_heads[':'] = q.parse(CharVector('a:b'))[0]
+        _lazy_heads[';'] = q.parse(CharVector('a;b'))[0]
+        _lazy_heads['!'] = q('!')
+        _lazy_heads['last'] = q('last')
+        _lazy_heads['enlist'] = q('enlist')
+    return _lazy_heads[name]
+
+
+def _lazy_release(temps: list):
+    # The parse tree for `![`.pykx.util;();0b;temps]`, which deletes the temporaries
+    return [
+        _lazy_head('!'),
+        _lazy_quote(SymbolAtom('.pykx.util')),
+        _lazy_quote(q('()')),
+        False,
+        _lazy_quote(SymbolVector(temps)),
+    ]
+
+
+def _lazy_quote(x: K):
+    # Symbols and general lists are evaluated within a parse tree, so are enlisted to be treated
+    # as constants
+    if _wrappers.k_t(x) in (0, -11, 11):
+        return _wrappers.list_from_items([x])
+    return x
+
+
+def _lazy_key(x):
+    if isinstance(x, LazyExpression):
+        return x._key
+    if isinstance(x, K):
+        return ('k', x._addr)
+    if x is None or isinstance(x, (bool, int, float, str, bytes)):
+        return ('py', type(x), x)
+    return ('id', id(x))
+
+
+class LazyExpression(Column):
+    """An expression built from chained operations on q data which is evaluated in one q call.
+
+    Each operation, such as an arithmetic operator or one of the methods of
+    [`Column`][pykx.Column], creates a new node in a graph of expressions rather than calling
+    q. [`eval`][pykx.LazyExpression.eval] compiles the graph to a single parse tree and evaluates
+    it, so intermediate results are never converted between q and Python and only one call is
+    made into q. Expressions which occur more than once in the graph are evaluated once and
+    reused.
+
+    Lazy expressions are created using [`pykx.lazy`][pykx.lazy], or `Vector.lazy()` and
+    `Table.lazy()`, and can be used wherever a `Column` is accepted by the Query API.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> x = kx.lazy(kx.q('1 2 3 4'))
+    >>> y = x * 2
+    >>> ((y + 1) * y).sum().eval()
+    pykx.LongAtom(pykx.q('220'))
+    >>> t = kx.q('([] px: 1 2 3f; size: 10 20 30)').lazy()
+    >>> (t['px'] * t['size']).sum().eval()
+    pykx.FloatAtom(pykx.q('140f'))
+    ```
+    """
+    def __init__(self, value=None, *, _node=None):
+        if not licensed:
+            raise LicenseException('use lazy expressions')
+        self._name = None
+        self._is_tree = False
+        if _node is None:
+            value = value if isinstance(value, K) else toq(value)
+            self._node = None
+            self._leaf = value
+            self._key = ('leaf', value._addr)
+        else:
+            self._node = _node
+            self._leaf = None
+            op, receiver, args, iterator, col_arg_ind, project_args = _node
+            self._key = (
+                _lazy_key(op),
+                receiver._key,
+                tuple(_lazy_key(x) for x in args),
+                iterator if iterator is None or isinstance(iterator, str) else id(iterator),
+                col_arg_ind,
+                None if project_args is None else tuple(project_args),
+            )
+
+    def __repr__(self):
+        if self._node is None:
+            return f'pykx.{type(self).__name__}({self._leaf!r})'
+        return f'pykx.{type(self).__name__}({self._node[0]!r}, inputs={len(self._node[2]) + 1})'
+
+    def call(self, op, *other, iterator=None, col_arg_ind=0, project_args=None):
+        return LazyExpression(_node=(op, self, other, iterator, col_arg_ind, project_args))
+
+    def __getitem__(self, key):
+        return self.call('@', key)
+
+    def __and__(self, other):
+        return self.call('&', other)
+
+    def __or__(self, other):
+        return self.call('|', other)
+
+    @property
+    def _value(self):
+        return self._compile()[0]
+
+    def _compile(self):
+        # Visit the graph in post-order, merging structurally equal nodes and counting how many
+        # distinct nodes use each of them
+        nodes = {}
+        uses = {}
+        stack = [(self, False)]
+        while stack:
+            node, visited = stack.pop()
+            if node._key in nodes and not visited:
+                continue
+            if node._node is None:
+                nodes[node._key] = node
+                continue
+            children = [node._node[1]] + [x for x in node._node[2]
+                                          if isinstance(x, LazyExpression)]
+            if not visited:
+                stack.append((node, True))
+                stack.extend((x, False) for x in children if x._key not in nodes)
+                continue
+            if node._key in nodes:
+                continue
+            nodes[node._key] = node
+            for x in children:
+                uses[x._key] = uses.get(x._key, 0) + 1
+
+        fragments = {}
+        statements = []
+        temps = []
+        prefix = f'lazy{next(_lazy_ids)}_'
+        for key, node in nodes.items():
+            if node._node is None:
+                fragments[key] = _lazy_quote(node._leaf)
+                continue
+            op, receiver, args, iterator, col_arg_ind, project_args = node._node
+            args = [
+                Column(value=fragments[x._key]) if isinstance(x, LazyExpression)
+                else _lazy_quote(x) if isinstance(x, K) else x
+                for x in args
+            ]
+            fragment = Column(value=fragments[receiver._key]).call(
+                op, *args, iterator=iterator, col_arg_ind=col_arg_ind,
+                project_args=None if project_args is None else list(project_args),
+            )._value
+            if uses.get(key, 0) > 1:
+                temp = f'{prefix}{len(temps)}'
+                temps.append(temp)
+                statements.append([_lazy_head(':'), SymbolAtom(f'.pykx.util.{temp}'), fragment])
+                fragment = SymbolAtom(f'.pykx.util.{temp}')
+            fragments[key] = fragment
+
+        result = fragments[self._key]
+        if not temps:
+            return result, temps
+        # q evaluates arguments from right to left, so the result is computed before the
+        # temporaries are deleted and they don't outlive the expression
+        return [
+            _lazy_head(';'),
+            *statements,
+            [_lazy_head('last'), [_lazy_head('enlist'), _lazy_release(temps), result]],
+        ], temps
+
+    @property
+    def tree(self) -> ParseTree:
+        """The parse tree which is evaluated by [`eval`][pykx.LazyExpression.eval]."""
+        return ParseTree(self._compile()[0])
+
+    def eval(self) -> K:
+        """Evaluate the expression in a single call to q."""
+        tree, temps = self._compile()
+        try:
+            return q.eval(tree)
+        finally:
+            # The tree deletes its temporaries once it has been evaluated, but not if evaluation
+            # fails part of the way through
+            if temps:
+                q.eval(_lazy_release(temps))
+
+
+def lazy(x: Any) -> LazyExpression:
+    """Wrap q data in a [`LazyExpression`][pykx.LazyExpression].
+
+    Operations on the result build an expression graph rather than calling q, which is
+    evaluated in one call to q by `.eval()`.
+
+    Parameters:
+        x: The data to wrap, which is converted to q if it is not already a `pykx.K` object.
+
+    Examples:
+
+    ```python
+    >>> import pykx as kx
+    >>> x = kx.lazy(kx.q('til 5'))
+    >>> (x * x + x).eval()
+    pykx.LongVector(pykx.q('0 2 6 12 20'))
+    ```
+    """
+    return x if isinstance(x, LazyExpression) else LazyExpression(x)
+
+
 class QueryPhrase:
     """Special wrapper for a list which will be treated as a QueryPhrase.
         For use with the Query API
@@ -11042,6 +12003,7 @@ __all__ = [
     'K',
     'KeyedTable',
     'Lambda',
+    'LazyExpression',
     'List',
     'LongAtom',
     'LongVector',
@@ -11089,11 +12051,19 @@ __all__ = [
     'Variable',
     'Vector',
     'QueryPhrase',
+    'lazy',
     '_internal_k_list_wrapper',
     '_internal_is_k_dict',
     '_internal_k_dict_to_py',
 ]
 
 
+def __getattr__(name):
+    if name in ('ArrowUUIDType', 'arrow_uuid_type'):
+        _arrow_uuid_type()
+        return _arrow_uuid_types[name]
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 def __dir__():
     return __all__
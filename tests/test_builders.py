@@ -0,0 +1,74 @@
+# Do not import pykx here - use the `kx` fixture instead!
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_vector_builder(q, kx):
+    builder = kx.VectorBuilder(kx.FloatVector, capacity=2)
+    for i in range(5):
+        builder.append(i / 2)
+    assert len(builder) == 5
+    assert builder.capacity == 8
+    builder.extend(np.array([10.0, 20.0]))
+    builder.extend(kx.q('30 40f'))
+    builder.append(None)
+    res = builder.build()
+    assert isinstance(res, kx.FloatVector)
+    assert q('~', res, q('0 0.5 1 1.5 2 10 20 30 40 0n'))
+
+    builder.clear()
+    assert len(builder) == 0
+    assert len(builder.build()) == 0
+
+
+@pytest.mark.parametrize('ktype,values,expected', [
+    ('LongAtom', [1, None, 3], '1 0N 3'),
+    ('IntVector', [1, None], '1 0Ni'),
+    ('BooleanVector', [True, False], '10b'),
+    ('SymbolAtom', ['a', None, 'b'], '`a``b'),
+    ('TimestampVector', [datetime(2020, 1, 1), None], '2020.01.01D 0Np'),
+    ('List', [1, 'a', None], '(1;`a;::)'),
+])
+def test_vector_builder_types(q, kx, ktype, values, expected):
+    builder = kx.VectorBuilder(getattr(kx, ktype))
+    for x in values:
+        builder.append(x)
+    assert q('~', builder.build(), q(expected))
+
+
+def test_vector_builder_errors(kx):
+    with pytest.raises(TypeError):
+        kx.VectorBuilder(kx.Table)
+    builder = kx.VectorBuilder(kx.LongVector)
+    with pytest.raises(ValueError):
+        builder.append('abc')
+
+
+def test_table_builder(q, kx):
+    builder = kx.TableBuilder({'sym': kx.SymbolAtom, 'px': kx.FloatAtom})
+    builder.append({'sym': 'a', 'px': 1.5})
+    builder.append(('b', 2.5))
+    builder.extend({'sym': ['c', 'd'], 'px': np.array([3.5, 4.5])})
+    builder.extend(pd.DataFrame({'sym': ['e'], 'px': [5.5]}))
+    builder.extend([{'sym': 'f'}])
+    assert len(builder) == 6
+    expected = q('([] sym:`a`b`c`d`e`f; px:1.5 2.5 3.5 4.5 5.5 0n)')
+    assert q('~', builder.build(), expected)
+
+    with pytest.raises(kx.PyKXException):
+        builder.append(('g',))
+    with pytest.raises(ValueError):
+        builder.append({'sym': 'g', 'px': 'bad'})
+    assert len(builder) == 6
+    assert q('~', builder.build(), expected)
+
+
+def test_table_builder_schema(q, kx):
+    schema = kx.schema.builder({'sym': kx.SymbolAtom, 'sz': kx.LongAtom}, key='sym')
+    builder = kx.TableBuilder(schema)
+    builder.append(('a', 1))
+    builder.append(('b', 2))
+    assert q('~', builder.build(), q('([sym:`a`b] sz:1 2)'))
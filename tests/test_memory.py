@@ -0,0 +1,41 @@
+# Do not import pykx here - use the `kx` fixture instead!
+import pytest
+
+
+def _make_tables(q, n):
+    return [q('{([] x: til x)}', 1000, cache=False) for _ in range(n)]
+
+
+def test_memory_tracking(q, kx):
+    assert not kx.memory.is_tracking()
+    with pytest.raises(kx.PyKXException):
+        kx.memory.snapshot()
+    kx.memory.start()
+    try:
+        assert kx.memory.is_tracking()
+        before = kx.memory.snapshot()
+        tables = _make_tables(q, 3)
+        after = kx.memory.snapshot()
+        assert isinstance(after.q, dict) and 'used' in after.q
+
+        diff = kx.memory.diff(before, after)
+        assert len(diff.new) >= 3
+        assert diff.total_bytes >= 3 * 8000
+        top = diff.top(1)[0]
+        assert top['site'].endswith('test_memory.py:6')
+        assert top['count'] == 3
+        assert top['bytes'] == 3 * q('-22!', tables[0]).py()
+        assert {'type': 'pykx.Table', 'count': 3, 'bytes': top['bytes']} \
+            in diff.top(None, group_by='type')
+        assert '_make_tables' in diff.top(1, group_by='stack')[0]['stack']
+        with pytest.raises(ValueError):
+            after.top(group_by='line')
+
+        del tables
+        freed = kx.memory.diff(after)
+        assert freed.top(1)[0]['count'] == -3
+        assert all(x.serial not in {y.serial for y in freed.freed}
+                   for x in kx.memory.snapshot().objects)
+    finally:
+        kx.memory.stop()
+    assert not kx.memory.is_tracking()
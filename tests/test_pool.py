@@ -0,0 +1,50 @@
+# Do not import pykx here - use the `kx` fixture instead!
+import os
+
+import pytest
+
+
+def _double(x):
+    return x * 2
+
+
+def _add(x, y=0):
+    return x + y
+
+
+def _table_total(t):
+    return t['x'].sum()
+
+
+def _pid(_):
+    return os.getpid()
+
+
+def _fail(x):
+    raise ValueError(x)
+
+
+def _preloaded(_):
+    import sys
+    return 'json' in sys.modules
+
+
+@pytest.mark.skipif(
+    os.getenv('PYKX_THREADING') is not None,
+    reason='Not supported with PYKX_THREADING'
+)
+def test_process_pool(q, kx):
+    with kx.ProcessPool(2, preload=['json'], share_threshold=10) as pool:
+        assert pool.submit(_double, q('1 2 3')).result().py() == [2, 4, 6]
+        assert pool.submit(_add, q('1 2'), y=q('10 20')).result().py() == [11, 22]
+        assert [x.py() for x in pool.map(_double, [q('1'), q('2'), q('3')])] == [2, 4, 6]
+        assert [x.py() for x in pool.map(_add, [1, 2, 3], [4, 5, 6], chunksize=2)] == [5, 7, 9]
+        assert all(pool.map(_preloaded, range(2)))
+        assert os.getpid() not in set(pool.map(_pid, range(4)))
+
+        # Tables of at least share_threshold rows are passed through shared memory
+        assert pool.submit(_table_total, q('([] x: til 100)')).result().py() == 4950
+        assert pool.submit(_table_total, q('([] x: til 5)')).result().py() == 10
+
+        with pytest.raises(ValueError, match='bad'):
+            pool.submit(_fail, 'bad').result()
@@ -0,0 +1,57 @@
+# Do not import pykx here - use the `kx` fixture instead!
+import json
+import pstats
+
+import pytest
+
+
+def test_profile(kx, tmp_path):
+    call = kx.EmbeddedQ.__call__
+    with kx.profile() as prof:
+        assert prof.recording
+        assert kx.q('{x+y}', [1, 2, 3], 10).py() == [11, 12, 13]
+        kx.q('til 3').np()
+    assert not prof.recording
+    assert kx.EmbeddedQ.__call__ is call
+    assert kx.embedded_q._keval is kx.core.keval
+
+    categories = [span.category for span in prof.spans]
+    for category in ('q', 'toq', 'execute', 'wrap', 'convert'):
+        assert category in categories
+    query = prof.spans[0]
+    assert query.category == 'q'
+    assert query.name == '{x+y}'
+    assert query.args['args'] == ['list[3]', 'int']
+    assert query.parent is None
+    assert {'toq', 'execute', 'wrap'} <= set(query.children)
+    assert query.duration >= sum(query.children.values())
+    assert all(span.end >= span.start for span in prof.spans)
+    assert set(prof.totals()) == set(categories)
+
+    trace = prof.chrome_trace()
+    assert len(trace['traceEvents']) == len(prof.spans)
+    assert trace['traceEvents'][0]['name'] == '{x+y}'
+    assert 'execute_us' in trace['traceEvents'][0]['args']
+    prof.write_chrome_trace(tmp_path/'trace.json')
+    with open(tmp_path/'trace.json') as f:
+        assert json.load(f) == trace
+
+    stats = pstats.Stats(prof)
+    assert ('pykx.q', 0, '{x+y}') in stats.stats
+    assert stats.stats[('pykx.q', 0, '{x+y}')][1] == 1
+    prof.dump_stats(tmp_path/'trace.prof')
+    assert ('pykx.execute', 0, 'execute') in pstats.Stats(str(tmp_path/'trace.prof')).stats
+
+    with prof:
+        with pytest.raises(kx.PyKXException):
+            prof.start()
+        kx.q('1+1')
+    assert [span.name for span in prof.spans].count('1+1') == 1
+
+    primitive = kx.wrappers._primitive
+    with kx.profile() as prof:
+        assert (kx.q('1 2 3') + kx.q('10')).py() == [11, 12, 13]
+        assert (kx.q('1 2 3') < 2).py() == [True, False, False]
+    assert kx.wrappers._primitive is primitive
+    operators = [span.name for span in prof.spans if span.category == 'execute']
+    assert '+' in operators and '<' in operators
@@ -241,6 +241,54 @@ def test_pykx_safe_reimport():
         assert output.split('\n')[-1] == "0 1 2 3 4 5 6 7 8 9"
 
 
+@pytest.mark.isolate
+def test_import_time():
+    # Regression budget for the time taken by `import pykx`. The dependencies which PyKX always
+    # imports are timed first as a baseline for the machine, and PyKX itself may take at most
+    # PYKX_IMPORT_TIME_BUDGET seconds longer than them.
+    budget = float(os.getenv('PYKX_IMPORT_TIME_BUDGET', '0.5'))
+    lazy = ('dill', 'streamlit', 'torch', 'pykx.builders', 'pykx.db', 'pykx.memory',
+            'pykx.pool', 'pykx.profiler', 'pykx.shared', 'pykx.tick')
+    code = ('import sys, time; start = time.perf_counter(); import numpy, pandas, pytz; '
+            'deps = time.perf_counter(); import pykx; end = time.perf_counter(); '
+            'print(deps - start); print(end - deps); '
+            f'print([m for m in {lazy!r} if m in sys.modules])')
+    cmd = (str(Path(sys.executable).as_posix()), '-c', code)
+    # The first import caches the result of checking that PyArrow can be imported safely
+    subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    output = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    ).stdout.strip().split('\n')
+    assert output[-1] == '[]'
+    assert float(output[-2]) < float(output[-3]) + budget
+
+
+@pytest.mark.isolate
+@pytest.mark.parametrize('statement', [
+    'import pykx.tick',
+    'from pykx.db import DB',
+    'from pykx.tick import TICK',
+    'from pykx.builders import TableBuilder',
+    'from pykx.shared import share',
+    'import pykx.memory',
+])
+def test_lazy_submodule_direct_import(statement):
+    # Submodules loaded on first use must also work when imported directly, rather than through
+    # an attribute of `pykx`
+    module = statement.split()[1]
+    code = f'{statement}; import sys; print(sys.modules["{module}"].q is sys.modules["pykx"].q)'
+    output = subprocess.run(
+        (str(Path(sys.executable).as_posix()), '-c', code),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    ).stdout.strip()
+    assert output.split('\n')[-1] == 'True'
+
+
 @pytest.mark.isolate
 def test_pykx_sigkill():
     returncode = subprocess.run(
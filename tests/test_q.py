@@ -138,6 +138,123 @@ def test_get_q_singleton_from_class(kx, q):
         kx.EmbeddedQ(arg=object())
 
 
+def test_query_cache(kx):
+    cache = kx.q.query_cache
+    maxsize = cache.maxsize
+    cache.clear()
+    try:
+        assert kx.q('{x+y}', 1, 2).py() == 3
+        assert kx.q('{x+y}', 3, 4).py() == 7
+        assert '{x+y}' in cache._cache
+        assert cache.hits >= 1
+        assert cache.misses >= 1
+
+        assert kx.q('+', 1, 2).py() == 3
+        assert '+' not in cache._cache
+        assert kx.q('{x}{y}', 1).py() == 1
+        assert '{x}{y}' not in cache._cache
+        assert kx.q('{x*2}', 2, cache=False).py() == 4
+        assert '{x*2}' not in cache._cache
+        assert kx.q('{x}', 'a').py() == 'a'
+        with pytest.raises(kx.QError):
+            kx.q('{x+y}', 1, 'a')
+
+        cache.maxsize = 2
+        for i in range(5):
+            assert kx.q(f'{{x+{i}}}', 1).py() == i + 1
+        assert len(cache) <= 2
+
+        cache.maxsize = 0
+        cache.clear()
+        kx.q('{x+y}', 1, 2)
+        assert len(cache) == 0
+    finally:
+        cache.maxsize = maxsize
+        cache.clear()
+
+
+def test_batch(kx):
+    res = kx.q.batch(['til 3', ('{x+y}', 1, 2), (b'sum', [1, 2, 3]), kx.CharVector('`a')])
+    assert [x.py() for x in res] == [[0, 1, 2], 3, 6, 'a']
+    assert kx.q.batch([]) == []
+    kx.q('batchvar:0')
+    with pytest.raises(kx.QError, match='type'):
+        kx.q.batch([('{x+y}', 1, 'a'), 'batchvar:1'])
+    assert kx.q('batchvar').py() == 1
+    with pytest.raises(TypeError):
+        kx.q.batch([('{x}', *range(9))])
+    # Calls are checked before any are run, so a bad call doesn't leak references to the
+    # arguments of the calls before it
+    from pykx import _wrappers, core
+    arg = kx.q('til 3')
+    refs = _wrappers.k_r(arg)
+    for calls in ([(b'{x}', [arg]), (b'{x}', [arg] * 9)], [(b'{x}', [arg]), (b'{x}', [1])]):
+        with pytest.raises((TypeError, AttributeError)):
+            core.keval_batch(calls)
+        assert _wrappers.k_r(arg) == refs
+    if os.getenv('PYKX_THREADING') is None:
+        with pytest.raises(kx.PyKXException):
+            kx.q.queue_stats()
+    else:
+        kx.q.queue_stats(reset=True)
+        kx.q.batch(['til 3'] * 10)
+        stats = kx.q.queue_stats()
+        assert stats['calls'] >= 10
+        assert 10 <= stats['max_depth'] <= stats['calls']
+        assert stats['wakeups'] < stats['calls']
+        assert stats['max_wait'] >= stats['mean_wait'] >= 0
+
+
+def test_async_call(kx):
+    import asyncio
+
+    if os.getenv('PYKX_THREADING') is None:
+        with pytest.raises(kx.PyKXException, match='PYKX_THREADING'):
+            asyncio.run(kx.q.async_call('til 3'))
+        return
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        res = await asyncio.gather(
+            kx.q.async_call('{system"sleep 0.5";x}', 1),
+            kx.q.async_call('til 3'),
+        )
+        ticker.cancel()
+        assert ticks > 10
+        assert [x.py() for x in res] == [1, [0, 1, 2]]
+        with pytest.raises(kx.QError):
+            await kx.q.async_call('{x+y}', 1, 'a')
+
+        kx.q('asyncvar:0')
+        slow = asyncio.create_task(kx.q.async_call('{system"sleep 0.5";x}', 1))
+        await asyncio.sleep(0.1)
+        cancelled = asyncio.create_task(kx.q.async_call('asyncvar:1'))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        assert (await slow).py() == 1
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert kx.q('asyncvar').py() == 0
+
+        maxsize = kx.q.async_queue.maxsize
+        kx.q.async_queue.maxsize = 1
+        try:
+            res = await asyncio.gather(*[kx.q.async_call('{x}', i) for i in range(5)])
+            assert [x.py() for x in res] == list(range(5))
+        finally:
+            kx.q.async_queue.maxsize = maxsize
+
+    asyncio.run(main())
+
+
 @pytest.mark.unlicensed(unlicensed_only=True)
 @pytest.mark.skipif(
     os.getenv('PYKX_THREADING') is not None,
@@ -296,3 +413,17 @@ def test_41_enabled():
     import pykx as kx
     assert kx.q('~', kx.q.z.K, 4.0).py()
     os.unsetenv('PYKX_4_1_ENABLED')
+
+
+@pytest.mark.isolate
+def test_pykx_q_cache(tmp_path):
+    os.environ['PYKX_CACHE_DIR'] = str(tmp_path)
+    import pykx as kx
+    cache_files = list(tmp_path.glob('pykx_q_*.bin'))
+    assert len(cache_files) == 1
+    assert 'util' in kx.q('key `.pykx').py()
+    pykx_q_path = Path(kx.__file__).parent/'pykx.q'
+    cached = kx.q('{-9!read1 hsym`$x}', str(cache_files[0]))
+    assert kx.q('~', kx.q._pykx_q_statements(pykx_q_path), cached).py()
+    assert list(tmp_path.glob('*.tmp')) == []
+    os.unsetenv('PYKX_CACHE_DIR')
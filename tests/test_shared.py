@@ -0,0 +1,54 @@
+# Do not import pykx here - use the `kx` fixture instead!
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+
+def test_share_attach(q, kx):
+    table = q('([] x: til 5; y: 5?1f; s: `a`b`c`d`e; t: 2020.01.01D+til 5; n: 5#enlist"ab")')
+    with kx.shared.share(table) as handle:
+        assert handle.owner
+        assert handle.length == 5
+        assert [c[2] for c in handle.columns] == [False, False, True, False, True]
+
+        res = kx.shared.attach(handle)
+        assert isinstance(res, kx.Table)
+        assert q('~', table, res)
+
+        arrays = kx.shared.attach(handle, format='numpy')
+        assert (arrays['x'] == np.arange(5)).all()
+        assert not arrays['x'].flags.writeable
+        assert (arrays['t'] == table['t'].np(raw=True)).all()
+        assert list(arrays['s']) == ['a', 'b', 'c', 'd', 'e']
+        with pytest.raises(ValueError):
+            kx.shared.attach(handle, format='pandas')
+    assert not handle.owner
+    assert not os.path.exists(handle.path)
+
+
+def test_share_keyed(q, kx):
+    table = q('([k: `a`b`c] x: 1 2 3; y: 3#`s#0 1 2)')
+    with kx.shared.share(table) as handle:
+        assert handle.keys == 1
+        res = kx.shared.attach(handle)
+        assert isinstance(res, kx.KeyedTable)
+        assert q('~', table, res)
+
+
+def test_share_handle_pickle(q, kx):
+    handle = kx.shared.share(q('([] x: 1 2 3)'))
+    copy = pickle.loads(pickle.dumps(handle))
+    assert not copy.owner
+    copy.close()
+    assert os.path.exists(handle.path)
+    assert q('~', q('([] x: 1 2 3)'), kx.shared.attach(copy))
+    path = handle.path
+    del handle
+    assert not os.path.exists(path)
+
+
+def test_share_errors(q, kx):
+    with pytest.raises(TypeError):
+        kx.shared.share(q('1 2 3'))
@@ -685,6 +685,29 @@ def test_from_list(kx):
         kx.List('aaa')
 
 
+def test_from_list_homogeneous(kx, q):
+    for data, ktype in (([1, 2, -3], kx.LongVector),
+                        ([1.5, float('nan'), 3.0], kx.FloatVector),
+                        ([True, False, True], kx.BooleanVector),
+                        (['a', 'bc', ''], kx.SymbolVector),
+                        ([uuid4(), uuid4()], kx.GUIDVector),
+                        ([datetime(2020, 1, 2, 3, 4, 5, 6), datetime(1990, 1, 1)],
+                         kx.TimestampVector)):
+        res = kx.toq(data)
+        assert type(res) is ktype
+        generic = kx.List([kx.toq(x) for x in data])
+        assert q('{(x~y) or all (x=y) or (null x)&null y}', res, generic)
+
+    assert q('~', kx.toq([datetime(2020, 1, 2, 3, 4, 5, 6)]),
+             q('enlist 2020.01.02D03:04:05.000006'))
+    assert isinstance(kx.toq([1, 2.0]), kx.List)
+    assert isinstance(kx.toq([1, True]), kx.List)
+    assert isinstance(kx.toq([1, None]), kx.List)
+    with pytest.raises(OverflowError):
+        kx.toq([1, 2**64])
+    assert isinstance(kx.toq(['ab', 'cd'], strings_as_char=True), kx.List)
+
+
 @pytest.mark.unlicensed
 def test_from_dict(kx):
     assert kx.K({}).py() == {}
@@ -1343,6 +1366,144 @@ def test_from_arrow_licensed(q, kx, pa):
     assert (type_tab == kx.K(type_tab.pa())).all()
 
 
+@pytest.mark.unlicensed
+@pytest.mark.nep49
+def test_adopt(kx, pd):
+    if not kx.config.k_allocator:
+        with pytest.raises(kx.PyKXException):
+            kx.toq.adopt(np.arange(3))
+        return
+
+    x = np.arange(3)
+    res, copied = kx.toq.adopt(x)
+    assert copied == {}
+    x[0] = 10
+    assert res.py() == [10, 1, 2]
+
+    res, copied = kx.toq.adopt(np.arange(6)[1::2])
+    assert list(copied) == [None]
+    assert res.py() == [1, 3, 5]
+
+    ts = np.array(['2020-01-01', '2020-01-02'], dtype='datetime64[ns]')
+    res, copied = kx.toq.adopt(ts)
+    assert 'inplace_epoch' in copied[None]
+    expected = ts.copy()
+    res, copied = kx.toq.adopt(ts, inplace_epoch=True)
+    assert copied == {}
+    assert (res.np() == expected).all()
+
+    df = pd.DataFrame(np.arange(6).reshape(3, 2), columns=['x', 'y'])
+    res, copied = kx.toq.adopt(df)
+    assert set(copied) == {'x', 'y'}
+    assert res['y'].py() == [1, 3, 5]
+
+    # The first column of a 2-D block starts at the block's allocation but does not cover it
+    block = np.array(['2020-01-01', '2020-01-02', '2020-01-03'] * 2,
+                     dtype='datetime64[ns]').reshape(2, 3)
+    expected = block.copy()
+    df = pd.DataFrame(block.T, columns=['x', 'y'], copy=False)
+    res, copied = kx.toq.adopt(df, inplace_epoch=True)
+    assert set(copied) == {'x', 'y'}
+    assert (block == expected).all()
+    assert (res['x'].np() == expected[0]).all()
+
+    df = pd.DataFrame({'a': np.arange(3), 'b': np.array([True, False, True])}, copy=False)
+    res, copied = kx.toq.adopt(df)
+    assert all(isinstance(v, str) for v in copied.values())
+    assert res.py() == {'a': [0, 1, 2], 'b': [True, False, True]}
+
+    with pytest.raises(TypeError):
+        kx.toq.adopt([1, 2, 3])
+
+
+@pytest.mark.unlicensed
+def test_compile(kx, pd):
+    convert = kx.toq.compile({'sym': kx.SymbolAtom, 'px': kx.FloatVector, 'sz': 7})
+    df = pd.DataFrame({'sym': ['a', 'b'], 'px': [1.5, 2.5], 'sz': [100, 200]})
+    for _ in range(3):
+        tab = convert(df)
+        assert isinstance(tab, kx.Table)
+        assert isinstance(tab._values._unlicensed_getitem(0), kx.SymbolVector)
+        assert isinstance(tab._values._unlicensed_getitem(2), kx.LongVector)
+        assert tab._keys.py() == ['sym', 'px', 'sz']
+
+    # The index is ignored for unkeyed schemas
+    tab = convert(df.set_index(pd.Index([5, 6])))
+    assert isinstance(tab, kx.Table)
+
+    with pytest.raises(ValueError):
+        convert(df[['sym', 'px']])
+    with pytest.raises(TypeError):
+        kx.toq.compile({'a': kx.Lambda})
+
+    convert = kx.toq.compile({'sz': kx.IntAtom}, cast=True)
+    assert isinstance(convert(df[['sz']])._values._unlicensed_getitem(0), kx.IntVector)
+
+    keyed = kx.toq.compile({'sym': kx.SymbolAtom, 'px': kx.FloatAtom}, key='sym')
+    tab = keyed(pd.DataFrame({'px': [1.5, 2.5]}, index=pd.Index(['a', 'b'], name='sym')))
+    assert isinstance(tab, kx.KeyedTable)
+    assert tab._keys._keys.py() == ['sym']
+    assert tab._values._keys.py() == ['px']
+
+
+def test_compile_schema(kx, q, pd):
+    schema = kx.schema.builder({'time': kx.TimestampAtom, 'sym': kx.SymbolAtom,
+                                'px': kx.FloatAtom})
+    convert = kx.toq.compile(schema)
+    df = pd.DataFrame({'time': pd.to_datetime(['2024-01-01', '2024-01-02']), 'sym': ['a', 'b'],
+                       'px': [1.0, 2.0]})
+    tab = convert(df)
+    assert q('{x~y}', kx.q.meta(tab), kx.q.meta(schema))
+    assert q('~', tab, kx.toq(df))
+
+    schema = kx.schema.builder({'sym': kx.SymbolAtom, 'px': kx.FloatAtom}, key='sym')
+    convert = kx.toq.compile(schema)
+    tab = convert(pd.DataFrame({'px': [1.5]}, index=pd.Index(['a'], name='sym')))
+    assert q('~', tab, q('([sym:enlist `a] px:enlist 1.5)'))
+
+
+@pytest.mark.unlicensed
+@pytest.mark.nep49
+def test_from_arrow_nested(kx, pa):
+    arr = pa.array([[1.0, 2.0], [], [3.0]])
+    lst = kx.toq(arr)
+    assert isinstance(lst, kx.List)
+    assert [x.py() for x in lst] == [[1.0, 2.0], [], [3.0]]
+    assert isinstance(lst._unlicensed_getitem(0), kx.FloatVector)
+
+    arr = pa.array([[1, 2], [3, 4, 5]], type=pa.large_list(pa.int32()))
+    lst = kx.toq(arr)
+    assert isinstance(lst._unlicensed_getitem(1), kx.IntVector)
+    assert [x.py() for x in lst] == [[1, 2], [3, 4, 5]]
+
+    arr = pa.array(['ab', '', 'cde'], type=pa.large_string())
+    lst = kx.toq(arr, strings_as_char=True)
+    assert isinstance(lst._unlicensed_getitem(0), kx.CharVector)
+    assert [x.py() for x in lst] == [b'ab', b'', b'cde']
+
+    arr = pa.array([[1, 2], None])
+    assert len(kx.toq(arr)) == 2
+
+
+def test_from_polars(kx, pa):
+    pl = pytest.importorskip('polars')
+    df = pl.DataFrame({
+        'a': [1, 2, 3],
+        'b': pl.Series(['x', 'y', 'x'], dtype=pl.Categorical),
+        't': [time(0, 0, 1), time(12), time(23, 59, 59, 999999)],
+    })
+    tab = kx.toq(df)
+    assert isinstance(tab, kx.Table)
+    assert isinstance(tab['b'], kx.SymbolVector)
+    assert tab['b'].py() == ['x', 'y', 'x']
+    assert isinstance(tab['t'], kx.TimespanVector)
+    assert tab['t'].np()[2] == np.timedelta64(86399999999000, 'ns')
+
+    vec = kx.toq(pl.Series([1.5, 2.5]))
+    assert isinstance(vec, kx.FloatVector)
+    assert vec.py() == [1.5, 2.5]
+
+
 @pytest.mark.unlicensed
 @pytest.mark.nep49
 def test_from_arrow(kx, pa, pd):
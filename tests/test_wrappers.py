@@ -1,8 +1,9 @@
 """Tests for the types defined in the wrappers module."""
 
-from collections import abc
+from collections import abc, namedtuple
 from datetime import date
 from datetime import datetime
+from datetime import time
 from datetime import timedelta
 import gc
 import math
@@ -11,6 +12,7 @@ import os
 import pickle
 from platform import python_implementation
 import shutil
+import sys
 from textwrap import dedent
 from uuid import UUID
 import itertools
@@ -206,6 +208,38 @@ class Test_K:
             pickle.dumps(kx.Foreign(10))
         assert 'Foreign' in str(err.value)
 
+    @pytest.mark.unlicensed
+    def test_pickling_out_of_band(self, kx):
+        tab = kx.toq(pd.DataFrame({
+            'x': np.arange(1000),
+            'y': np.linspace(0, 1, 1000),
+            'z': np.arange(1000).astype('datetime64[ns]'),
+            's': ['a', 'b'] * 500,
+        }))
+        buffers = []
+        data = pickle.dumps(tab, protocol=5, buffer_callback=buffers.append)
+        assert sum(memoryview(b).nbytes for b in buffers) >= 3 * 8000
+        assert len(data) < 8000
+        res = pickle.loads(data, buffers=buffers)
+        assert isinstance(res, kx.Table)
+        assert res._addr != tab._addr
+        pd.testing.assert_frame_equal(res.pd(), tab.pd())
+
+        for x in (kx.LongVector(np.arange(5)), kx.K([1, 'a', [1.5, 2.5]]), kx.K({'a': 1})):
+            res = pickle.loads(pickle.dumps(x, protocol=5))
+            assert type(res) is type(x)
+            assert res.py() == x.py()
+
+        # Lists are only pickled out-of-band when they hold vectors with exportable data
+        for x, out_of_band in ((kx.K([np.arange(1000), np.linspace(0, 1, 1000)]), True),
+                               (kx.K([1, 'a', 2.5] * 100), False)):
+            buffers = []
+            data = pickle.dumps(x, protocol=5, buffer_callback=buffers.append)
+            assert bool(buffers) is out_of_band
+            res = pickle.loads(data, buffers=buffers)
+            assert type(res) is kx.List
+            assert res.py() == x.py()
+
     @pytest.mark.ipc
     def test_is_atom(self, kx, q):
         assert q('til 2').is_atom is False
@@ -1515,6 +1549,55 @@ class Test_Vector:
         assert v.py() == [0, 1, 2]
         assert (q('"abc"') == b'abc').all()
 
+    def test_primitive_dispatch(self, q, kx):
+        assert set(kx.wrappers._primitive_ops) == set(kx.wrappers._primitives)
+        v = q('1 2 3')
+        assert (v + 1).py() == [2, 3, 4]
+        assert (2 - v).py() == [1, 0, -1]
+        assert (v * [1, 2, 3]).py() == [1, 4, 9]
+        assert (v / 2).py() == [0.5, 1.0, 1.5]
+        assert (v // 2).py() == [0, 1, 1]
+        assert (v % 2).py() == [1, 0, 1]
+        assert (-v).py() == [-1, -2, -3]
+        assert abs(q('-1 2')).py() == [1, 2]
+        assert (v <= 2).py() == [True, True, False]
+        assert (v == q('1 0 3')).py() == [True, False, True]
+        assert (v + np.array([1, 1, 1])).py() == [2, 3, 4]
+        with pytest.raises(kx.QError, match='length'):
+            v + q('1 2')
+
+    def test_lazy(self, q, kx):
+        x = kx.lazy(q('1 2 3 4'))
+        y = x * 2
+        expr = ((y + 1) * y).sum()
+        assert isinstance(expr, kx.LazyExpression)
+        assert expr.eval().py() == 220
+        # y is evaluated once and reused, then released
+        tree = expr.tree._tree
+        assert len(tree) == 3
+        assert not any(str(x).startswith('lazy') for x in q('key .pykx.util').py())
+        # Temporaries are named per compiled expression, so trees evaluated together don't
+        # overwrite each other's intermediate results
+        assert str(expr.tree._tree[1][1]) != str(expr.tree._tree[1][1])
+        z = kx.lazy(q('10 20')) + 1
+        assert q.eval([q('{x,y}'), expr._value, (z * z)._value]).py() == [220, 121, 441]
+        assert (x * x + x).eval().py() == [2, 6, 12, 20]
+        assert q('1 2 3').lazy().eval().py() == [1, 2, 3]
+        assert kx.lazy(q('(1;`a)')).eval().py() == [1, 'a']
+        s = kx.lazy(q('`a`b`c'))
+        assert (s == 'b').eval().py() == [False, True, False]
+        assert s.isin(['a', 'c']).eval().py() == [True, False, True]
+        assert x.max(iterator='\\').eval().py() == [1, 2, 3, 4]
+        t = q('([] px: 1 2 3f; size: 10 20 30)').lazy()
+        assert (t['px'] * t['size']).sum().eval().py() == 140.0
+        with pytest.raises(kx.QError, match='length'):
+            (x + q('1 2')).eval()
+        # Temporaries are released when evaluation fails
+        y = x + q('1 2')
+        with pytest.raises(kx.QError, match='length'):
+            (y * y).eval()
+        assert not any(str(x).startswith('lazy') for x in q('key .pykx.util').py())
+
     def test_empty_vector(self, q):
         assert q('()') == q('()')
         assert q('()') != q('"j"$()')
@@ -1662,6 +1745,106 @@ class Test_Vector:
         assert all(v.pa().to_numpy(zero_copy_only=False) == v.np())
         assert isinstance(v.pa(), pa.lib.BooleanArray)
 
+        v = q('1 0N 3')
+        assert v.pa().null_count == 1
+        assert v.pa().to_pylist() == [1, None, 3]
+        assert v.pa(raw=True).to_pylist() == [1, -2**63, 3]
+
+    @pytest.mark.unlicensed
+    def test_pl(self, kx, pa):
+        pl = pytest.importorskip('polars')
+        s = kx.toq(np.arange(5)).pl()
+        assert isinstance(s, pl.Series)
+        assert s.to_list() == [0, 1, 2, 3, 4]
+        assert kx.SymbolVector(['a', 'b', 'a']).pl().dtype == pl.Categorical
+        ts = kx.TimestampVector([np.datetime64('2020-01-01T00:00:00.000000001', 'ns')])
+        assert ts.pl().dtype == pl.Datetime('ns')
+        assert ts.pl().to_numpy()[0] == np.datetime64('2020-01-01T00:00:00.000000001', 'ns')
+        assert kx.DateVector([np.datetime64('2020-01-02', 'D')]).pl().dtype == pl.Date
+        assert kx.SecondVector([np.timedelta64(5, 's')]).pl().to_list() == [timedelta(seconds=5)]
+        assert kx.toq(np.array([1, -2**63])).pl().null_count() == 1
+
+    def test_pl_temporal(self, kx, pa):
+        pl = pytest.importorskip('polars')
+        # Times are mapped exactly to Polars times, and back to timespans
+        t = kx.q('00:00:00.001 0Nt 23:59:59.999')
+        assert t.pl().dtype == pl.Time
+        assert t.pl().to_list() == [time(0, 0, 0, 1000), None, time(23, 59, 59, 999000)]
+        assert isinstance(kx.toq(t.pl()), kx.TimespanVector)
+        assert kx.q('~', kx.toq(t.pl()), kx.q('"n"$', t))
+
+        # Polars has no month, minute or second types, so their values are kept as dates and
+        # millisecond durations, which convert back as dates and timespans
+        m = kx.q('2020.01 2020.02m')
+        assert m.pl().dtype == pl.Date
+        assert m.pl().to_list() == [date(2020, 1, 1), date(2020, 2, 1)]
+        assert kx.q('~', kx.toq(m.pl()), kx.q('2020.01.01 2020.02.01'))
+        for v, expected in ((kx.q('00:01 00:02'), [timedelta(minutes=1), timedelta(minutes=2)]),
+                            (kx.q('00:00:01 00:00:02'), [timedelta(seconds=1),
+                                                         timedelta(seconds=2)])):
+            assert v.pl().dtype == pl.Duration('ms')
+            assert v.pl().to_list() == expected
+            assert kx.q('~', kx.toq(v.pl()), kx.q('"n"$', v))
+
+    @pytest.mark.nep49
+    def test_arrow_c_array(self, q, pa):
+        if not hasattr(pa.Array, '_import_from_c_capsule'):
+            pytest.skip('PyArrow>=14.0 is required for the Arrow PyCapsule interface')
+        for v in (q('100?0Wj'), q('100?0Wi'), q('100?0Wh'), q('100?100.0'), q('"e"$100?100.0'),
+                  q('"x"$100?256'), q('100?0Wn')):
+            arr = pa.Array._import_from_c_capsule(*v.__arrow_c_array__())
+            assert arr.buffers()[1].address == v.np(raw=True).__array_interface__['data'][0]
+            assert all(arr.to_numpy() == v.np())
+
+        v = q('0N 1 0N 3')
+        arr = pa.Array._import_from_c_capsule(*v.__arrow_c_array__())
+        assert arr.to_pylist() == [None, 1, None, 3]
+        del v
+        assert arr.to_pylist() == [None, 1, None, 3]
+
+        v = q('100?`3')
+        arr = pa.Array._import_from_c_capsule(*v.__arrow_c_array__())
+        assert arr.to_pylist() == v.py()
+
+    @pytest.mark.skipif(not hasattr(np, 'from_dlpack'), reason='DLPack requires NumPy>=1.22')
+    def test_dlpack(self, q):
+        for v in (q('100?0Wj'), q('100?0Wi'), q('100?0Wh'), q('100?100.0'), q('"e"$100?100.0'),
+                  q('"x"$100?256'), q('100?0Wp'), q('100?0Wn'), q('100?0Wd')):
+            assert v.__dlpack_device__() == (1, 0)
+            arr = np.from_dlpack(v)
+            raw = v.np(raw=True)
+            assert arr.__array_interface__['data'][0] == raw.__array_interface__['data'][0]
+            assert (arr == raw).all()
+
+        arr = np.from_dlpack(q('1 2 3f'))
+        assert arr.tolist() == [1.0, 2.0, 3.0]
+
+        # The keywords of the DLPack standard are accepted whichever version of Numpy is installed
+        v = q('1 2 3')
+        v.__dlpack__(max_version=(1, 0), dl_device=(1, 0), copy=False)
+        v.__dlpack__(copy=True)
+        with pytest.raises(BufferError):
+            v.__dlpack__(dl_device=(2, 0))
+
+        with pytest.raises(TypeError):
+            q('`a`b`c').__dlpack__()
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason='__buffer__ requires Python 3.12+')
+    def test_buffer_protocol(self, q):
+        v = q('1 2 3')
+        mv = memoryview(v)
+        assert mv.format == 'q' or mv.format == 'l'
+        assert mv.tolist() == [1, 2, 3]
+        assert np.frombuffer(mv, dtype=np.int64).__array_interface__['data'][0] == \
+            v.np().__array_interface__['data'][0]
+        del v
+        assert mv.tolist() == [1, 2, 3]
+
+        assert memoryview(q('2000.01.02 2000.01.03')).tolist() == [1, 2]
+
+        with pytest.raises(TypeError):
+            memoryview(q('`a`b`c'))
+
     def test_has_null_and_has_inf(self, q):
         assert not q('(`o;7;{x*y+z})').has_nulls
         assert q('(`;7;{x*y+z})').has_nulls
@@ -1701,6 +1884,43 @@ class Test_Vector:
         for type_code, zero in types:
             f(type_code, zero)
 
+    @pytest.mark.unlicensed
+    def test_iter_py(self, kx):
+        v = kx.LongVector(np.array([1, -2**63, 3, 2**63 - 1, 5]))
+        assert list(v.iter_py(chunk=2)) == v.py()
+        assert v.py()[1] is pd.NA
+        assert v.py()[3] == math.inf
+        assert list(v.iter_py(chunk=2, raw=True)) == v.np().data.tolist()
+        assert list(kx.SymbolVector(['a', 'b', 'c']).iter_py(chunk=2)) == ['a', 'b', 'c']
+        lst = kx.K([1, 'a', [1, 2]])
+        assert list(lst.iter_py(chunk=1)) == lst.py()
+        assert list(kx.LongVector(np.array([], dtype=np.int64)).iter_py()) == []
+        with pytest.raises(ValueError):
+            next(v.iter_py(chunk=0))
+
+    @pytest.mark.unlicensed
+    def test_null_mask(self, kx):
+        v = kx.LongVector(np.array([1, -2**63, 3, 2**63 - 1, -2**63 + 1]))
+        assert v.null_count() == 1
+        assert v.null_mask().tolist() == [False, True, False, False, False]
+        assert v.inf_mask().tolist() == [False, False, False, True, True]
+        assert v.has_nulls and v.has_infs
+
+        v = kx.FloatVector(np.array([np.nan, 1.0, np.inf]))
+        assert v.null_mask().tolist() == [True, False, False]
+        assert v.inf_mask().tolist() == [False, False, True]
+
+        v = kx.SymbolVector(['a', '', 'c'])
+        assert v.null_mask().tolist() == [False, True, False]
+        assert not v.has_infs
+
+        v = kx.K([1, None, 'a', '', 2.0, kx.LongAtom.null, [1, 2]])
+        assert v.null_count() == 2
+        assert v.null_mask().tolist() == [False, False, False, True, False, True, False]
+
+        assert kx.TimestampVector(np.array(['NaT', 0], dtype='datetime64[ns]')).has_nulls
+        assert kx.GUIDVector([UUID(int=0), UUID(int=1)]).null_count() == 1
+
     def test_np_timestampvector_nulls(self, kx):
         assert pd.isna(kx.q('0Np').py())
         assert kx.q('enlist 0Np').py() == [kx.TimestampAtom(kx.q('0Np'))]
@@ -1924,6 +2144,64 @@ class Test_List:
             q('(1 2;2)').np(reshape=True)
         assert 'Data must be a singular type "rectangular" matrix' in str(err.value)
 
+    @pytest.mark.skipif(not hasattr(np, 'from_dlpack'), reason='DLPack requires NumPy>=1.22')
+    def test_dlpack(self, kx, q):
+        lst = q('5 4#20?1f')
+        arr = np.from_dlpack(lst)
+        assert arr.shape == (5, 4)
+        assert (arr == lst.np(reshape=True)).all()
+
+        with pytest.raises(TypeError):
+            q('(1 2;2 3f)').__dlpack__()
+
+    def test_ragged(self, q):
+        offsets, values = q('(1 2 3f;();4 5f)').ragged()
+        assert offsets.tolist() == [0, 3, 3, 5]
+        assert values.dtype == np.float64
+        assert values.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        offsets, values = q('("ab";"cde")').ragged()
+        assert offsets.tolist() == [0, 2, 5]
+        assert values.tobytes() == b'abcde'
+
+        offsets, values = q('(2000.01.01 0Nd;enlist 2000.01.03)').ragged()
+        assert np.isnat(values[1])
+        assert values[2] == np.datetime64('2000-01-03')
+        _, values = q('(2000.01.01 0Nd;enlist 2000.01.03)').ragged(raw=True)
+        assert values.tolist() == [0, -2**31, 2]
+
+        with pytest.raises(TypeError):
+            q('(1 2;3 4f)').ragged()
+        with pytest.raises(TypeError):
+            q('(`a`b;`c`d)').ragged()
+
+    @pytest.mark.nep49
+    def test_pa_nested(self, q, pa):
+        arr = q('(1 2 3f;();4 5f)').pa()
+        assert isinstance(arr, pa.ListArray)
+        assert arr.to_pylist() == [[1.0, 2.0, 3.0], [], [4.0, 5.0]]
+
+        arr = q('(1 0N;enlist 3)').pa()
+        assert arr.to_pylist() == [[1, None], [3]]
+
+        arr = q('("ab";"";"cde")').pa()
+        assert isinstance(arr, pa.LargeStringArray)
+        assert arr.to_pylist() == ['ab', '', 'cde']
+
+        arr = q('(2000.01.01D00:00:01;0Np)').pa()
+        assert arr.type == pa.list_(pa.timestamp('ns'))
+
+    @pytest.mark.nep49
+    def test_pa_nested_roundtrip(self, kx, q, pa):
+        lst = q('(1 2 3f;();4 5f)')
+        assert q('~', kx.toq(lst.pa()), lst)
+
+        lst = q('(0 1 2;3 4)')
+        assert q('~', kx.toq(lst.pa().slice(1)), q('enlist 3 4'))
+
+        lst = q('("ab";"";"cde")')
+        assert q('~', kx.toq(lst.pa(), strings_as_char=True), lst)
+
 
 # NaN is tricky to compare, so we generate GUID vectors until we get one whose complex form has no
 # NaNs in it.
@@ -2593,6 +2871,25 @@ class Test_EnumVector:
             assert all(
                 q(self.q_vec_str).pd(as_arrow=True) == ['abc', 'xyz', 'hmm', 'abc', 'xyz', 'hmm'])
 
+    def test_pd_as_category(self, kx):
+        kx.q('u2:`abc`xyz`hmm`unused')
+        v = kx.q('`u2$`xyz`abc`xyz`hmm`xyz')
+        res = v.pd(as_category=True)
+        assert res.dtype == 'category'
+        assert list(res.cat.categories) == ['abc', 'xyz', 'hmm', 'unused']
+        assert res.cat.codes.tolist() == [1, 0, 1, 2, 1]
+        assert res.tolist() == ['xyz', 'abc', 'xyz', 'hmm', 'xyz']
+        # Codes are stored in the narrowest type that fits the categories
+        assert res.cat.codes.dtype == np.int8
+
+        t = kx.q('([] a:`u2$`xyz`abc`hmm; b:1 2 3)')
+        df = t.pd(as_category=True)
+        assert df['a'].dtype == 'category'
+        assert df['a'].tolist() == ['xyz', 'abc', 'hmm']
+        assert list(df['a'].cat.categories) == ['abc', 'xyz', 'hmm', 'unused']
+        assert df['b'].tolist() == [1, 2, 3]
+        assert t.pd(as_category=True, raw=True)['a'].tolist() == [1, 0, 2]
+
     def test_enum_init(self, q, kx):
         q('tc:`a`b`c')
         v = ('a', 'c')
@@ -2667,6 +2964,96 @@ class Test_Mapping:
 class Test_Table:
     q_table_str = '([] a:til 3; b:"xyz"; c:-3?0Ng)'
 
+    def test_from_records(self, kx, q):
+        u = UUID('7a964b5c-0185-6160-a4ff-d94bc7df5f62')
+        records = [
+            {'sym': 'a', 'px': 1.5, 'sz': 10, 'ok': True, 'id': u,
+             'time': datetime(2020, 1, 1, 12), 'd': date(2020, 1, 2)},
+            {'sym': 'b', 'px': 2, 'sz': None, 'ok': False, 'id': None, 'time': None},
+        ]
+        tab = kx.Table.from_records(records)
+        expected = q('([] sym:`a`b; px:1.5 2; sz:10 0N; ok:10b; id:("G"$"7a964b5c-0185-6160-a4ff-d94bc7df5f62";0Ng); time:2020.01.01D12 0Np; d:2020.01.02 0Nd)') # noqa: E501
+        assert q('~', tab, expected)
+
+        Row = namedtuple('Row', ['sym', 'sz'])
+        tab = kx.Table.from_records([Row('a', 1), Row('b', 2)])
+        assert q('~', tab, q('([] sym:`a`b; sz:1 2)'))
+
+        tab = kx.Table.from_records(iter([(1, 'x'), (2, 'y')]))
+        assert q('~', tab, q('([] x:1 2; x1:`x`y)'))
+
+        schema = {'sym': kx.SymbolAtom, 'sz': kx.IntAtom, 'px': kx.RealAtom}
+        tab = kx.Table.from_records([('a', 1, 1.5), ('b', None, None)], schema)
+        assert q('~', tab, q('([] sym:`a`b; sz:1 0Ni; px:1.5 0Ne)'))
+
+        schema = {'d': kx.DateAtom, 'm': kx.MonthAtom, 'ts': kx.TimespanAtom}
+        rows = [(None, None, None), (date(2020, 1, 2), date(2020, 3, 1), timedelta(seconds=1))]
+        tab = kx.Table.from_records(rows, schema)
+        assert q('~', tab, q('([] d:0Nd 2020.01.02; m:0Nm 2020.03m; ts:0Nn 0D00:00:01)'))
+
+        tab = kx.Table.from_records([{'sym': 'a', 'extra': 1}], {'sym': kx.SymbolAtom})
+        assert q('~', tab, q('([] sym:enlist `a)'))
+
+        tab = kx.Table.from_records([], kx.schema.builder({'a': kx.LongAtom, 'b': kx.List}))
+        assert q('~', tab, q('([] a:`long$(); b:())'))
+
+        tab = kx.Table.from_records([{'a': 1, 'b': [1, 2]}, {'a': 2, 'b': 'x'}])
+        assert isinstance(tab['b'], kx.List)
+
+        keyed = kx.schema.builder({'sym': kx.SymbolAtom, 'px': kx.FloatAtom}, key='sym')
+        tab = kx.Table.from_records([('a', 1.0)], keyed)
+        assert q('~', tab, q('([sym:enlist `a] px:enlist 1f)'))
+
+        with pytest.raises(TypeError, match="column 'sz'"):
+            kx.Table.from_records([{'sz': 1}, {'sz': 'bad'}], {'sz': kx.LongAtom})
+        # Values of the wrong type are rejected rather than coerced
+        with pytest.raises(TypeError, match="column 'ok'"):
+            kx.Table.from_records([{'ok': 'no'}], {'ok': kx.BooleanAtom})
+        with pytest.raises(TypeError, match="column 'sym'"):
+            kx.Table.from_records([{'sym': 3.5}], {'sym': kx.SymbolAtom})
+
+        # Named tuples are matched to the schema by field name
+        tab = kx.Table.from_records([Row('a', 1)], {'sz': kx.LongAtom, 'sym': kx.SymbolAtom})
+        assert q('~', tab, q('([] sz:enlist 1; sym:enlist `a)'))
+        with pytest.raises(KeyError, match='px'):
+            kx.Table.from_records([Row('a', 1)], {'sym': kx.SymbolAtom, 'px': kx.FloatAtom})
+        with pytest.raises(ValueError, match='Row 1 has 1 values'):
+            kx.Table.from_records([(1, 'x'), (2,)])
+        with pytest.raises(ValueError):
+            kx.Table.from_records([])
+
+    def test_itertuples(self, kx, q):
+        tab = q('([] sym:`a`b`c; px:1.5 0n 3.5; sz:1 0N 3; s:("ab";"c";"de"))')
+        rows = list(tab.itertuples(chunk=2))
+        assert [r.sym for r in rows] == ['a', 'b', 'c']
+        assert rows[0] == ('a', 1.5, 1, b'ab')
+        assert rows[1].sz is pd.NA
+        assert type(next(tab.itertuples(name=None))) is tuple
+        assert list(q('([] x:til 0)').itertuples()) == []
+        with pytest.raises(ValueError):
+            next(tab.itertuples(chunk=0))
+
+    def test_iter_batches(self, kx, q):
+        tab = q('([] x:til 5; y:5?`a`b; z:5#enlist "ab")')
+        batches = list(tab.iter_batches(2))
+        assert [len(x) for x in batches] == [2, 2, 1]
+        assert list(batches[2].index) == [4]
+        pd.testing.assert_frame_equal(pd.concat(batches), tab.pd())
+
+        batches = list(tab.iter_batches(rows=3, columns=['y', 'x'], format='numpy'))
+        assert [len(x) for x in batches] == [3, 2]
+        assert batches[0].dtype.names == ('y', 'x')
+        assert batches[1]['x'].tolist() == [3, 4]
+
+        batches = list(tab.iter_batches(rows=4, columns=['x'], format='arrow'))
+        assert batches[0].column_names == ['x']
+        assert batches[1].column(0).to_pylist() == [4]
+
+        with pytest.raises(KeyError):
+            next(tab.iter_batches(columns=['w']))
+        with pytest.raises(ValueError):
+            next(tab.iter_batches(format='polars'))
+
     def test_bool(self, q):
         assert q(self.q_table_str).any().any()
         assert not q(self.q_table_str).all().all()
@@ -2780,6 +3167,37 @@ class Test_Table:
         t = q(self.q_table_str)
         assert all(t.pa().to_pandas() == t.pd(raw_guids=True))
 
+    def test_pl(self, kx, q, pa):
+        pl = pytest.importorskip('polars')
+        t = q('([] a:til 3; b:3#1.5; c:`x`y`x; d:2020.01.01D+til 3)')
+        df = t.pl()
+        assert isinstance(df, pl.DataFrame)
+        assert df.columns == ['a', 'b', 'c', 'd']
+        assert df['c'].dtype == pl.Categorical
+        assert df['d'].dtype == pl.Datetime('ns')
+        assert q('~', t, kx.toq(df))
+
+        kt = q('([k:`p`q] v:1 2)').pl()
+        assert kt.columns == ['k', 'v']
+        assert kt['v'].to_list() == [1, 2]
+
+    @pytest.mark.nep49
+    def test_arrow_c_stream(self, q, pa):
+        if not hasattr(pa.RecordBatchReader, '_import_from_c_capsule'):
+            pytest.skip('PyArrow>=14.0 is required for the Arrow PyCapsule interface')
+        t = q('([] a:til 10; b:10?1f; c:10?`3; d:0N,9?100i)')
+        res = pa.RecordBatchReader._import_from_c_capsule(t.__arrow_c_stream__()).read_all()
+        assert res.column_names == ['a', 'b', 'c', 'd']
+        assert res['a'].to_pylist() == t['a'].py()
+        assert res['c'].to_pylist() == t['c'].py()
+        assert res['d'].null_count == 1
+        assert res['b'].chunk(0).buffers()[1].address == \
+            t['b'].np().__array_interface__['data'][0]
+
+        arr = pa.Array._import_from_c_capsule(*t.__arrow_c_array__())
+        assert isinstance(arr, pa.StructArray)
+        assert len(arr) == 10
+
     def test_has_null_and_has_inf(self, q):
         table = q('([]0w,9?1f;0n,9?1f)')
         assert table.has_nulls
@@ -3092,6 +3510,15 @@ class Test_SplayedTable:
         assert list(t) == ['a', 'b', 'c']
         assert len(t) == 3
 
+    def test_iter_batches(self, q, tmp_path, kx):
+        t = self.create_splayed_table(q, tmp_path)
+        batches = list(t.iter_batches(2))
+        assert [len(x) for x in batches] == [2, 1]
+        assert list(batches[1].index) == [2]
+        assert batches[1]['a'].tolist() == [2]
+        batches = list(t.iter_batches(2, columns=['b'], format='numpy'))
+        assert batches[0].dtype.names == ('b',)
+
     def test_not_implemented_methods(self, q, tmp_path, kx):
         t = self.create_splayed_table(q, tmp_path)
         assert t._values is None
@@ -3166,6 +3593,16 @@ class Test_ParitionedTable:
         assert list(t) == ['a', 'b', 'c']
         assert len(t) == 9
 
+    def test_iter_batches(self, q, tmp_path, kx):
+        t = self.create_partitioned_table(q, tmp_path)
+        batches = list(t.iter_batches(2, columns=['month', 'a']))
+        assert [len(x) for x in batches] == [2, 1, 2, 1, 2, 1]
+        df = pd.concat(batches)
+        assert list(df.index) == list(range(9))
+        assert df['a'].tolist() == [0, 1, 2, 1, 2, 3, 2, 3, 4]
+        assert df['month'].nunique() == 3
+        assert len(next(t.iter_batches(10, columns=['a', 'b'], format='arrow'))) == 3
+
     def test_not_implemented_methods(self, q, tmp_path, kx):
         t = self.create_partitioned_table(q, tmp_path)
         assert t._values is None